@@ -0,0 +1,96 @@
+"""Throughput of 64 concurrent `search_datasets_async` calls per pool setting.
+
+Run with: python benchmarks/bench_connection_pool.py
+
+Starts a local HTTP/1.1 stub server that answers `/search/0.2/query` with a
+20-hit page after a fixed delay (standing in for server latency), then runs
+rounds of 64 concurrent calls through SDKs built with different
+`ConnectionConfig` limits. The stub server does not speak HTTP/2; compare
+`ConnectionConfig(http2=True)` against a real endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from typing import Optional
+
+from dateno import SDK, ConnectionConfig
+
+import payloads
+
+CONCURRENCY = 64
+ROUNDS = 5
+LATENCY_S = 0.05
+BODY = payloads.as_bytes(payloads.search_query_response(1))
+
+
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+    b"content-length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Minimal keep-alive HTTP/1.1 responder: every GET gets the same page.
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            await asyncio.sleep(LATENCY_S)
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _serve(port_queue: "multiprocessing.Queue[int]") -> None:
+    async def serve() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0, backlog=256)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+async def _run(server_url: str, config: Optional[ConnectionConfig]) -> float:
+    sdk = SDK(api_key_query="BENCH", server_url=server_url, connection_config=config)
+    search = sdk.search_api
+    # Warm-up round opens the connections the pool will keep.
+    await asyncio.gather(*(search.search_datasets_async(q="x") for _ in range(CONCURRENCY)))
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(
+            *(search.search_datasets_async(q="x") for _ in range(CONCURRENCY))
+        )
+    elapsed = time.perf_counter() - start
+    await sdk.sdk_configuration.async_client.aclose()
+    return CONCURRENCY * ROUNDS / elapsed
+
+
+def main() -> None:
+    # The stub runs in its own process so it does not compete for the GIL.
+    port_queue: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(port_queue,), daemon=True)
+    server.start()
+    server_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+
+    configs = {
+        "max_connections=4": ConnectionConfig(max_connections=4),
+        "max_connections=16": ConnectionConfig(max_connections=16),
+        "default (no ConnectionConfig)": None,
+        "max_connections=64, keepalive=64": ConnectionConfig(
+            max_connections=64, max_keepalive_connections=64
+        ),
+    }
+    print(f"{CONCURRENCY} concurrent calls x {ROUNDS} rounds, {LATENCY_S * 1000:.0f} ms server latency")
+    for name, config in configs.items():
+        rps = asyncio.run(_run(server_url, config))
+        print(f"  {name:<36} {rps:8.0f} req/s")
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Client-side cost of debug logging on 500-hit search pages.
+
+Run with: python benchmarks/bench_debug_logging.py
+
+Compares the default `NoOpLogger` (debug disabled, bodies never formatted)
+with a logger that accepts every record (the behaviour every call used to
+pay for), and counts how many response bodies were decoded to `str`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List
+
+import httpx
+
+from dateno import SDK
+from dateno.utils.logger import NoOpLogger
+
+import payloads
+
+N_CALLS = 50
+BODY = payloads.as_bytes(payloads.search_query_response(500))
+
+
+class _DiscardingLogger:
+    """Accepts every record (no `isEnabledFor`) but drops it after formatting."""
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if args:
+            msg % args  # pylint: disable=pointless-statement
+
+
+def _run(logger: Any) -> None:
+    responses: List[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        res = httpx.Response(
+            200, headers={"content-type": "application/json"}, content=BODY
+        )
+        responses.append(res)
+        return res
+
+    sdk = SDK(
+        api_key_query="BENCH",
+        server_url="https://bench.invalid",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        debug_logger=logger,
+    )
+
+    start = time.perf_counter()
+    for _ in range(N_CALLS):
+        sdk.search_api.search_datasets(q="salmon", limit=500)
+    elapsed = time.perf_counter() - start
+
+    decoded = sum(1 for res in responses if hasattr(res, "_text"))
+    print(
+        f"{type(logger).__name__:<18} {elapsed / N_CALLS * 1e3:8.2f} ms/call   "
+        f"bodies decoded to str: {decoded}/{len(responses)}"
+    )
+
+
+def main() -> None:
+    print(f"search_datasets, 500 hits, body {len(BODY) / 1024:.0f} KiB")
+    _run(_DiscardingLogger())
+    _run(NoOpLogger())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Memory per search hit: `models.Hit` vs `CompactHit`.
+
+Run with: python benchmarks/bench_hit_memory.py
+
+Decodes 20,000 hits from JSON, as they arrive in search responses, keeps them
+alive in each representation and reports the memory allocated for them
+(tracemalloc), plus the cost of converting hits and of reading one `_source`
+field back.
+"""
+
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from dateno import models, utils
+from dateno.ext.compact_hits import CompactHit
+
+import payloads
+
+N_HITS = 20_000
+
+
+def _allocated(build: Callable[[], List[Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    encoded = [utils.json_dumps(payloads.search_hit(i)) for i in range(N_HITS)]
+
+    model_bytes = _allocated(
+        lambda: [models.Hit.model_validate(utils.json_loads(b)) for b in encoded]
+    )
+    compact_bytes = _allocated(
+        lambda: [CompactHit.from_raw(utils.json_loads(b)) for b in encoded]
+    )
+    print(f"{N_HITS} hits")
+    print(f"  models.Hit  {model_bytes / N_HITS:8.0f} B/hit")
+    print(
+        f"  CompactHit  {compact_bytes / N_HITS:8.0f} B/hit   "
+        f"x{model_bytes / compact_bytes:.1f} smaller"
+    )
+
+    sample = [utils.json_loads(b) for b in encoded[:1000]]
+    hits = [models.Hit.model_validate(h) for h in sample]
+    compact = [CompactHit.from_hit(h) for h in hits]
+    per_hit = lambda t: t / len(sample) * 1e6  # noqa: E731
+    print(
+        "  from_hit   %6.2f us/hit"
+        % per_hit(timeit.timeit(lambda: [CompactHit.from_hit(h) for h in hits], number=1))
+    )
+    print(
+        "  to_hit     %6.2f us/hit"
+        % per_hit(timeit.timeit(lambda: [c.to_hit() for c in compact], number=1))
+    )
+    print(
+        "  get(title) %6.2f us/hit"
+        % per_hit(
+            timeit.timeit(lambda: [c.get("dataset.title") for c in compact], number=1)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
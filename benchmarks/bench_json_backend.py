@@ -0,0 +1,80 @@
+"""JSON backends compared on the SDK's hot encode/decode paths.
+
+Run with: python benchmarks/bench_json_backend.py
+
+For every backend installed here (`builtin` always; `orjson` / `msgspec` with
+`pip install "dateno[json]"` or directly), times parsing a 500-hit search page
+with aggregations, validating it into `SearchQueryResponse`, serializing a
+large `search_datasets_dsl` body and writing the 500 hits as NDJSON.
+"""
+
+from __future__ import annotations
+
+import io
+import timeit
+from typing import Any, Dict, Optional
+
+from dateno import models
+from dateno.utils import jsonbackend, serializers
+
+import payloads
+
+
+def dsl_body(n_clauses: int = 2_000) -> Dict[str, Any]:
+    return {
+        "query": {
+            "bool": {
+                "must": [{"match": {"dataset.title": "population"}}],
+                "should": [
+                    {"term": {"dataset.uid": f"uid-{i:06d}"}} for i in range(n_clauses)
+                ],
+                "filter": [
+                    {"terms": {"source.countries.name.keyword": ["Germany", "France"]}}
+                ],
+            }
+        },
+        "sort": [{"_score": "desc"}, {"id": "asc"}],
+        "search_after": [1.5, "x" * 32],
+    }
+
+
+def _time(func, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e3
+
+
+def main() -> None:
+    page = payloads.search_query_response(500)
+    body = payloads.as_bytes(page)
+    hits = page["hits"]["hits"]
+    dsl = models.BodySearchDatasetsDsl(**dsl_body())
+    dsl_size = len(
+        serializers.marshal_json(dsl, Optional[models.BodySearchDatasetsDsl])
+    )
+    print(f"search page {len(body) / 1024:.0f} KiB, DSL body {dsl_size / 1024:.0f} KiB")
+
+    cases = {
+        "decode page": lambda: jsonbackend.json_loads(body),
+        "unmarshal page": lambda: serializers.unmarshal_json(
+            body, models.SearchQueryResponse
+        ),
+        "encode DSL body": lambda: serializers.marshal_json(
+            dsl, Optional[models.BodySearchDatasetsDsl]
+        ),
+        "NDJSON 500 hits": lambda: jsonbackend.write_ndjson(io.BytesIO(), hits),
+    }
+    baseline: Dict[str, float] = {}
+    for name in ("builtin",) + tuple(
+        n for n in jsonbackend.available_json_backends() if n != "builtin"
+    ):
+        jsonbackend.set_json_backend(name)
+        print(name)
+        for label, func in cases.items():
+            func()  # warm up
+            ms = _time(func, number=20)
+            base = baseline.setdefault(label, ms)
+            print(f"  {label:<16} {ms:8.3f} ms   x{base / ms:5.2f}")
+    jsonbackend.set_json_backend(None)
+
+
+if __name__ == "__main__":
+    main()
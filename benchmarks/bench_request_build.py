@@ -0,0 +1,97 @@
+"""Requests built per second for typical GET operations.
+
+Run with: python benchmarks/bench_request_build.py
+
+Builds `httpx.Request`s for `SearchDatasetsRequest` and `ListTimeseriesRequest`
+through `BaseSDK._build_request`, once with the per-class field plans cached
+(the normal case) and once with the cache dropped before every build, which
+reflects over the request model on each call as the SDK used to.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict
+
+from dateno import SDK, models, utils
+from dateno.utils.metadata import clear_field_plan_cache
+
+N_BUILDS = 5_000
+
+SDK_ = SDK(api_key_query="BENCH", server_url="https://bench.invalid")
+
+CASES: Dict[str, Dict[str, Any]] = {
+    "SearchDatasetsRequest": dict(
+        path="/search/0.2/query",
+        request=models.SearchDatasetsRequest(
+            q="salmon",
+            filters=['"source.catalog_type"="Geoportal"', '"source.countries.name"="Norway"'],
+            limit=500,
+            offset=1000,
+            facets=True,
+            sort_by="_score",
+        ),
+        request_has_path_params=False,
+    ),
+    "ListTimeseriesRequest": dict(
+        path="/statsdb/0.1/ns/{ns_id}/ts",
+        request=models.ListTimeseriesRequest(ns_id="worldbank", start=200, limit=100),
+        request_has_path_params=True,
+    ),
+}
+
+
+def _build(case: Dict[str, Any]) -> None:
+    SDK_.search_api._build_request(  # pylint: disable=protected-access
+        method="GET",
+        base_url="https://bench.invalid",
+        url_variables=None,
+        request_body_required=False,
+        request_has_query_params=True,
+        user_agent_header="user-agent",
+        accept_header_value="application/json",
+        security=SDK_.sdk_configuration.security,
+        timeout_ms=None,
+        **case,
+    )
+
+
+def _params(case: Dict[str, Any]) -> None:
+    request = case["request"]
+    utils.generate_url("https://bench.invalid", case["path"], request)
+    utils.get_query_params(request)
+    utils.get_headers(request)
+
+
+def _rate(fn: Callable[[], None]) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(N_BUILDS):
+        fn()
+    return N_BUILDS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print("full request build (_build_request, includes httpx URL handling)")
+    for name, case in CASES.items():
+        _compare(name, lambda: _build(case))
+    print("path/query/header extraction only")
+    for name, case in CASES.items():
+        _compare(name, lambda: _params(case))
+
+
+def _compare(name: str, fn: Callable[[], None]) -> None:
+    def cold() -> None:
+        clear_field_plan_cache()
+        fn()
+
+    cached = _rate(fn)
+    uncached = _rate(cold)
+    print(
+        f"  {name:<24} cached {cached:9,.0f}/s   "
+        f"uncached {uncached:9,.0f}/s   speedup {cached / uncached:4.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
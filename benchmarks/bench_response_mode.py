@@ -0,0 +1,76 @@
+"""Cost of returning a search page in each `response_mode`.
+
+Run with: python benchmarks/bench_response_mode.py
+
+Times `search_datasets` end to end over an in-process transport, so the
+numbers include request building and the SDK pipeline, and separately the
+body handling alone: validating into `SearchQueryResponse` ("model"),
+parsing to dicts ("json") and taking the bytes ("bytes").
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import httpx
+
+from dateno import SDK, models
+from dateno.utils import serializers
+from dateno.utils.rawresponse import raw_response
+
+import payloads
+
+
+def _sdk(body: bytes) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    return SDK(
+        api_key_query="BENCH",
+        server_url="https://bench.invalid",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def main() -> None:
+    for n_hits in (20, 500):
+        body = payloads.as_bytes(payloads.search_query_response(n_hits))
+        response = httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+        sdk = _sdk(body)
+        number = 200 if n_hits == 20 else 20
+        print(f"{n_hits} hits, {len(body) / 1024:.0f} KiB")
+
+        serializers.unmarshal_json(body, models.SearchQueryResponse)
+        parse = {
+            "model": lambda: serializers.unmarshal_json(
+                body, models.SearchQueryResponse
+            ),
+            "json": lambda: raw_response(response, "json"),
+            "bytes": lambda: raw_response(response, "bytes"),
+        }
+        base_parse = base_call = None
+        for mode in ("model", "json", "bytes"):
+            parse_s = timeit.timeit(parse[mode], number=number) / number
+            call_s = (
+                timeit.timeit(
+                    lambda: sdk.search_api.search_datasets(
+                        limit=n_hits, response_mode=mode
+                    ),
+                    number=number,
+                )
+                / number
+            )
+            base_parse = base_parse or parse_s
+            base_call = base_call or call_s
+            print(
+                f"  {mode:<6} body {parse_s * 1e3:8.3f} ms (x{base_parse / parse_s:6.1f})   "
+                f"call {call_s * 1e3:8.3f} ms (x{base_call / call_s:5.1f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Load amplification of retries while the API fails half of all requests.
+
+Run with: python benchmarks/bench_retry_amplification.py
+
+Simulates `N_REQUESTS` logical calls through `utils.retry` against a fake
+endpoint that returns 503 with probability `ERROR_RATE`, and reports how many
+attempts reached the server per logical call. Sleeps are zeroed so that only
+the retry policy (attempt cap, budget) determines the load.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+import httpx
+
+from dateno.utils import retries as retries_mod
+from dateno.utils.retries import BackoffStrategy, Retries, RetryBudget, RetryConfig
+
+N_REQUESTS = 10_000
+ERROR_RATE = 0.5
+
+
+def _run(
+    label: str,
+    error_rate: float,
+    max_attempts: Optional[int] = None,
+    budget: Optional[RetryBudget] = None,
+) -> None:
+    rng = random.Random(42)
+    attempts = 0
+    failed = 0
+
+    def call() -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(503 if rng.random() < error_rate else 200)
+
+    config = RetryConfig(
+        "backoff",
+        BackoffStrategy(
+            initial_interval=0,
+            max_interval=0,
+            exponent=1.5,
+            # Stands in for the hour-long default without sleeping for it.
+            max_elapsed_time=3_600_000,
+            jitter="full",
+            max_attempts=max_attempts,
+        ),
+        retry_connection_errors=True,
+        budget=budget,
+    )
+    retries = Retries(config, ["503"])
+    for _ in range(N_REQUESTS):
+        if retries_mod.retry(call, retries).status_code != 200:
+            failed += 1
+
+    print(
+        f"{label:<34} amplification {attempts / N_REQUESTS:6.2f}x   "
+        f"failed calls {failed / N_REQUESTS:6.1%}"
+    )
+
+
+def main() -> None:
+    for error_rate in (ERROR_RATE, 0.95):
+        print(f"error rate {error_rate:.0%}")
+        # Without a cap the unbounded case would only stop on max_elapsed_time.
+        _run("max_attempts=20", error_rate, max_attempts=20)
+        _run("max_attempts=4", error_rate, max_attempts=4)
+        _run(
+            "max_attempts=4, budget 10%",
+            error_rate,
+            max_attempts=4,
+            budget=RetryBudget(ratio=0.1, window_s=3600),
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
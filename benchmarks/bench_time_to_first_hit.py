@@ -0,0 +1,67 @@
+"""Time to the first hit of a search page, `response_mode="model"` vs `"lazy"`.
+
+Run with: python benchmarks/bench_time_to_first_hit.py
+
+Times `search_datasets` end to end over an in-process transport up to reading
+`hits.total`, up to the first validated hit, and up to iterating every hit.
+In "lazy" mode the page is parsed eagerly but each hit is validated on first
+access, so the first two shrink while a full iteration costs about the same.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable, Dict
+
+import httpx
+
+from dateno import SDK
+
+import payloads
+
+
+def _sdk(body: bytes) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    return SDK(
+        api_key_query="BENCH",
+        server_url="https://bench.invalid",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def main() -> None:
+    for n_hits in (20, 500):
+        body = payloads.as_bytes(payloads.search_query_response(n_hits))
+        sdk = _sdk(body)
+        number = 200 if n_hits == 20 else 20
+        print(f"{n_hits} hits, {len(body) / 1024:.0f} KiB")
+
+        def search(mode: str) -> Any:
+            return sdk.search_api.search_datasets(limit=n_hits, response_mode=mode)
+
+        stages: Dict[str, Callable[[str], Any]] = {
+            "total": lambda mode: search(mode).hits.total,
+            "first hit": lambda mode: search(mode).hits.hits[0].source,
+            "all hits": lambda mode: [hit.source for hit in search(mode).hits.hits],
+        }
+        for stage, run in stages.items():
+            timings = {}
+            for mode in ("model", "lazy"):
+                run(mode)
+                timings[mode] = (
+                    min(timeit.repeat(lambda: run(mode), number=number, repeat=5))
+                    / number
+                )
+            print(
+                f"  {stage:<10} model {timings['model'] * 1e3:8.3f} ms   "
+                f"lazy {timings['lazy'] * 1e3:8.3f} ms "
+                f"(x{timings['model'] / timings['lazy']:5.1f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
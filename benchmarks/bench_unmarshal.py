@@ -0,0 +1,55 @@
+"""Per-call response parse cost with and without the cached unmarshaller.
+
+Run with: python benchmarks/bench_unmarshal.py
+
+"before" rebuilds the `Unmarshaller` wrapper model on every call (what
+`utils.serializers.unmarshal` used to do); "after" goes through the cached,
+type-keyed registry used by `unmarshal_json_response`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from pydantic import ConfigDict, create_model
+from pydantic_core import from_json
+
+from dateno import models
+from dateno.utils import serializers
+
+import payloads
+
+
+def _unmarshal_uncached(raw: bytes, typ):
+    unmarshaller = create_model(
+        "Unmarshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    return unmarshaller(body=from_json(raw)).body
+
+
+def _bench(label: str, raw: bytes, typ, number: int) -> None:
+    serializers.unmarshal_json(raw, typ)  # warm the registry
+    before = timeit.timeit(lambda: _unmarshal_uncached(raw, typ), number=number)
+    after = timeit.timeit(lambda: serializers.unmarshal_json(raw, typ), number=number)
+    print(
+        f"{label:<32} before {before / number * 1e6:9.1f} us/call   "
+        f"after {after / number * 1e6:9.1f} us/call   "
+        f"speedup x{before / after:5.1f}"
+    )
+
+
+def main() -> None:
+    cases = [
+        ("SearchQueryResponse (1 hit)", payloads.search_query_response(1), models.SearchQueryResponse),
+        ("SearchQueryResponse (20 hits)", payloads.search_query_response(20), models.SearchQueryResponse),
+        ("PageTimeseries (10 items)", payloads.page_timeseries(10), models.PageTimeseries),
+        ("PageTimeseries (100 items)", payloads.page_timeseries(100), models.PageTimeseries),
+    ]
+    for label, payload, typ in cases:
+        _bench(label, payloads.as_bytes(payload), typ, number=200)
+
+
+if __name__ == "__main__":
+    main()
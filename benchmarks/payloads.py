@@ -0,0 +1,110 @@
+"""Deterministic API payloads shared by the benchmark scripts.
+
+The documents mirror the shape of real `/search/0.2/query` and
+`/statsdb/0.1/ns/{ns_id}/ts` responses (field names, nesting and typical
+value sizes) so that parse/validation costs are representative without
+needing network access or an API key.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+CATALOG_TYPES = ["Open data portal", "Geoportal", "Scientific data repository"]
+COUNTRIES = [("DE", "Germany"), ("FR", "France"), ("US", "United States")]
+
+
+def search_hit(i: int) -> Dict[str, Any]:
+    code, country = COUNTRIES[i % len(COUNTRIES)]
+    resources = [
+        {
+            "id": f"res-{i}-{r}",
+            "name": f"Resource {r} of dataset {i}",
+            "url": f"https://data.example.org/datasets/{i}/resources/{r}.csv",
+            "format": "csv",
+            "mimetype": "text/csv",
+            "size": 1024 * (r + 1),
+        }
+        for r in range(3)
+    ]
+    return {
+        "_index": "fulldb",
+        "_id": f"{i:064x}",
+        "_score": 10.0 - i / 1000,
+        "_source": {
+            "id": f"{i:064x}",
+            "int_id": str(i),
+            "dataset": {
+                "id": f"ds-{i}",
+                "title": f"Atlantic salmon monitoring {i}",
+                "description": "Annual counts of returning adult salmon. " * 8,
+                "url": f"https://data.example.org/datasets/{i}",
+                "tags": ["fish", "salmon", "monitoring", "environment"],
+                "formats": ["CSV", "JSON"],
+                "num_resources": len(resources),
+                "topics": [{"id": "ENVI", "name": "Environment"}],
+                "geotopics": [],
+                "datatypes": ["Tabular"],
+            },
+            "source": {
+                "uid": f"cdi{i % 50:08d}",
+                "name": f"Catalog {i % 50}",
+                "catalog_type": CATALOG_TYPES[i % len(CATALOG_TYPES)],
+                "software": {"id": "ckan", "name": "CKAN"},
+                "countries": [{"id": code, "name": country}],
+                "owner_type": "Central government",
+            },
+            "resources": resources,
+            "owner": {"name": f"Agency {i % 7}", "type": "Central government"},
+        },
+    }
+
+
+def search_query_response(n_hits: int = 20, total: int = 125_000) -> Dict[str, Any]:
+    return {
+        "took": 42,
+        "timed_out": False,
+        "_shards": {"total": 5, "successful": 5, "skipped": 0, "failed": 0},
+        "hits": {
+            "total": {"value": total, "relation": "eq"},
+            "max_score": 10.0,
+            "hits": [search_hit(i) for i in range(n_hits)],
+        },
+        "aggregations": {
+            "source.catalog_type": {
+                "buckets": [
+                    {"key": name, "doc_count": 1000 - k}
+                    for k, name in enumerate(CATALOG_TYPES)
+                ]
+            },
+            "source.countries.name.keyword": {
+                "buckets": [
+                    {"key": name, "doc_count": 500 - k}
+                    for k, (_, name) in enumerate(COUNTRIES)
+                ]
+            },
+        },
+    }
+
+
+def page_timeseries(n_items: int = 100, totals: int = 4_000) -> Dict[str, Any]:
+    items: List[Dict[str, Any]] = [
+        {
+            "id": f"ts{i:06d}",
+            "indicator": f"IND{i % 40:03d}",
+            "table": f"TBL{i % 5}",
+            "name": f"Population, total, region {i}",
+            "metadata": [
+                {"name": "unit", "value": "persons"},
+                {"name": "frequency", "value": "A"},
+                {"name": "source", "value": "National statistics office"},
+            ],
+        }
+        for i in range(n_items)
+    ]
+    return {"totals": totals, "start": 0, "limit": n_items, "items": items}
+
+
+def as_bytes(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload).encode("utf-8")
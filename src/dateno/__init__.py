@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from .sdk import SDK as SDK
 from .sdk import SDK as Dateno
+from .httpclient import ConnectionConfig as ConnectionConfig
 from . import models, errors
 
-__all__ = ["SDK", "Dateno", "models", "errors"]
+__all__ = ["SDK", "Dateno", "ConnectionConfig", "models", "errors"]
@@ -1,9 +1,12 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+from .httpclient import AsyncHttpClient, HttpClient
 from .sdkconfiguration import SDKConfiguration
 from . import errors, utils
 from ._hooks import AfterErrorContext, AfterSuccessContext, BeforeRequestContext
-from .utils import RetryConfig, SerializedRequestBody, get_body_content
+from .utils import RetryConfig, SerializedRequestBody
+from .utils.compression import ACCEPT_ENCODING
+from .utils.logger import LazyRequestBody, LazyResponseBody, is_debug_enabled
 import httpx
 from typing import Callable, List, Mapping, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
@@ -172,6 +175,8 @@ class BaseSDK:
 
         headers = utils.get_headers(request, _globals)
         headers["Accept"] = accept_header_value
+        if not any(h.lower() == "accept-encoding" for h in http_headers or {}):
+            headers["Accept-Encoding"] = ACCEPT_ENCODING
         headers[user_agent_header] = self.sdk_configuration.user_agent
 
         if security is not None:
@@ -206,7 +211,11 @@ class BaseSDK:
             for header, value in http_headers.items():
                 headers[header] = value
 
-        timeout = timeout_ms / 1000 if timeout_ms is not None else None
+        connection_config = self.sdk_configuration.connection_config
+        if connection_config is not None:
+            timeout = connection_config.timeout(timeout_ms)
+        else:
+            timeout = timeout_ms / 1000 if timeout_ms is not None else None
 
         return client.build_request(
             method,
@@ -229,25 +238,55 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.client
         logger = self.sdk_configuration.debug_logger
+        # Checked once per call so that request/response bodies are never
+        # formatted or decoded when debug logging is off.
+        debug = is_debug_enabled(logger)
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
+        limiter = self.sdk_configuration.rate_limiter
+        backoff = self.sdk_configuration.backoff_coordinator
+        router = self.sdk_configuration.server_router
+        compression_metrics = self.sdk_configuration.compression_metrics
+
+        def send_request(
+            http_client: HttpClient, req: httpx.Request
+        ) -> httpx.Response:
+            if router is None:
+                return http_client.send(req, stream=stream)
+            return router.send(
+                hook_ctx.operation_id, req, lambda r: http_client.send(r, stream=stream)
+            )
 
         def do():
             http_res = None
             try:
                 req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
-                logger.debug(
-                    "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                    req.method,
-                    req.url,
-                    req.headers,
-                    get_body_content(req),
-                )
+                if debug:
+                    logger.debug(
+                        "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                        req.method,
+                        req.url,
+                        req.headers,
+                        LazyRequestBody(req),
+                    )
 
                 if client is None:
                     raise ValueError("client is required")
 
-                http_res = client.send(req, stream=stream)
+                if backoff is not None:
+                    backoff.wait(req)
+
+                if limiter is not None:
+                    limiter.acquire(hook_ctx.operation_id)
+                    try:
+                        http_res = send_request(client, req)
+                    finally:
+                        limiter.release(hook_ctx.operation_id)
+                    limiter.observe(
+                        hook_ctx.operation_id, http_res, retry_after=backoff is None
+                    )
+                else:
+                    http_res = send_request(client, req)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -258,13 +297,20 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
-            logger.debug(
-                "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                http_res.status_code,
-                http_res.url,
-                http_res.headers,
-                "<streaming response>" if stream else http_res.text,
-            )
+            if backoff is not None:
+                backoff.observe(req, http_res)
+
+            if compression_metrics is not None:
+                compression_metrics.observe(http_res)
+
+            if debug:
+                logger.debug(
+                    "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                    http_res.status_code,
+                    http_res.url,
+                    http_res.headers,
+                    LazyResponseBody(http_res, stream),
+                )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
                 result, err = hooks.after_error(
@@ -284,10 +330,46 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
+        breaker = self.sdk_configuration.circuit_breaker
+        hedger = self.sdk_configuration.request_hedger
+
+        def attempt() -> httpx.Response:
+            if breaker is None:
+                return do()
+            return breaker.call(hook_ctx.operation_id, request, do)
+
+        def hedged_attempt() -> httpx.Response:
+            if hedger is None or stream:
+                return attempt()
+            return hedger.call(hook_ctx.operation_id, request, attempt)
+
+        cache = self.sdk_configuration.response_cache
+        memo = self.sdk_configuration.response_memo
+
+        def send() -> httpx.Response:
+            cache_entry = (
+                cache.lookup(hook_ctx.operation_id, request)
+                if cache is not None and not stream
+                else None
+            )
+            if cache_entry is not None and cache_entry.fresh is not None:
+                return cache_entry.fresh
+
+            if retry_config is not None:
+                http_res = utils.retry(
+                    hedged_attempt, utils.Retries(retry_config[0], retry_config[1])
+                )
+            else:
+                http_res = hedged_attempt()
+
+            if cache is not None and cache_entry is not None:
+                http_res = cache.update(cache_entry, http_res)
+            return http_res
+
+        if memo is not None and not stream:
+            http_res = memo.fetch(hook_ctx.operation_id, request, send)
         else:
-            http_res = do()
+            http_res = send()
 
         if not utils.match_status_codes(error_status_codes, http_res.status_code):
             http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
@@ -304,25 +386,55 @@ class BaseSDK:
     ) -> httpx.Response:
         client = self.sdk_configuration.async_client
         logger = self.sdk_configuration.debug_logger
+        # Checked once per call so that request/response bodies are never
+        # formatted or decoded when debug logging is off.
+        debug = is_debug_enabled(logger)
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
+        limiter = self.sdk_configuration.rate_limiter
+        backoff = self.sdk_configuration.backoff_coordinator
+        router = self.sdk_configuration.server_router
+        compression_metrics = self.sdk_configuration.compression_metrics
+
+        async def send_request(
+            http_client: AsyncHttpClient, req: httpx.Request
+        ) -> httpx.Response:
+            if router is None:
+                return await http_client.send(req, stream=stream)
+            return await router.send_async(
+                hook_ctx.operation_id, req, lambda r: http_client.send(r, stream=stream)
+            )
 
         async def do():
             http_res = None
             try:
                 req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
-                logger.debug(
-                    "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                    req.method,
-                    req.url,
-                    req.headers,
-                    get_body_content(req),
-                )
+                if debug:
+                    logger.debug(
+                        "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                        req.method,
+                        req.url,
+                        req.headers,
+                        LazyRequestBody(req),
+                    )
 
                 if client is None:
                     raise ValueError("client is required")
 
-                http_res = await client.send(req, stream=stream)
+                if backoff is not None:
+                    await backoff.wait_async(req)
+
+                if limiter is not None:
+                    await limiter.acquire_async(hook_ctx.operation_id)
+                    try:
+                        http_res = await send_request(client, req)
+                    finally:
+                        limiter.release(hook_ctx.operation_id)
+                    limiter.observe(
+                        hook_ctx.operation_id, http_res, retry_after=backoff is None
+                    )
+                else:
+                    http_res = await send_request(client, req)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -333,13 +445,20 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
-            logger.debug(
-                "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
-                http_res.status_code,
-                http_res.url,
-                http_res.headers,
-                "<streaming response>" if stream else http_res.text,
-            )
+            if backoff is not None:
+                backoff.observe(req, http_res)
+
+            if compression_metrics is not None:
+                compression_metrics.observe(http_res)
+
+            if debug:
+                logger.debug(
+                    "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
+                    http_res.status_code,
+                    http_res.url,
+                    http_res.headers,
+                    LazyResponseBody(http_res, stream),
+                )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
                 result, err = hooks.after_error(
@@ -359,12 +478,46 @@ class BaseSDK:
 
             return http_res
 
-        if retry_config is not None:
-            http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
+        breaker = self.sdk_configuration.circuit_breaker
+        hedger = self.sdk_configuration.request_hedger
+
+        async def attempt() -> httpx.Response:
+            if breaker is None:
+                return await do()
+            return await breaker.call_async(hook_ctx.operation_id, request, do)
+
+        async def hedged_attempt() -> httpx.Response:
+            if hedger is None or stream:
+                return await attempt()
+            return await hedger.call_async(hook_ctx.operation_id, request, attempt)
+
+        cache = self.sdk_configuration.response_cache
+        memo = self.sdk_configuration.response_memo
+
+        async def send() -> httpx.Response:
+            cache_entry = (
+                await cache.lookup_async(hook_ctx.operation_id, request)
+                if cache is not None and not stream
+                else None
             )
+            if cache_entry is not None and cache_entry.fresh is not None:
+                return cache_entry.fresh
+
+            if retry_config is not None:
+                http_res = await utils.retry_async(
+                    hedged_attempt, utils.Retries(retry_config[0], retry_config[1])
+                )
+            else:
+                http_res = await hedged_attempt()
+
+            if cache is not None and cache_entry is not None:
+                http_res = await cache.update_async(cache_entry, http_res)
+            return http_res
+
+        if memo is not None and not stream:
+            http_res = await memo.fetch_async(hook_ctx.operation_id, request, send)
         else:
-            http_res = await do()
+            http_res = await send()
 
         if not utils.match_status_codes(error_status_codes, http_res.status_code):
             http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
@@ -7,6 +7,7 @@ import builtins
 import sys
 
 if TYPE_CHECKING:
+    from .circuit_open_error import CircuitOpenError
     from .errorresponse import ErrorResponse, ErrorResponseData
     from .httpvalidationerror import HTTPValidationError, HTTPValidationErrorData
     from .no_response_error import NoResponseError
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from .sdkdefaulterror import SDKDefaultError
 
 __all__ = [
+    "CircuitOpenError",
     "ErrorResponse",
     "ErrorResponseData",
     "HTTPValidationError",
@@ -25,6 +27,7 @@ __all__ = [
 ]
 
 _dynamic_imports: dict[str, str] = {
+    "CircuitOpenError": ".circuit_open_error",
     "ErrorResponse": ".errorresponse",
     "ErrorResponseData": ".errorresponse",
     "HTTPValidationError": ".httpvalidationerror",
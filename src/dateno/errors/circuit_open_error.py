@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class CircuitOpenError(Exception):
+    """Error raised without sending a request because its circuit is open."""
+
+    message: str
+    key: str
+    retry_after_s: float
+
+    def __init__(self, key: str, retry_after_s: float):
+        message = f"Circuit '{key}' is open; retry in {retry_after_s:.1f}s"
+        object.__setattr__(self, "message", message)
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "retry_after_s", retry_after_s)
+        super().__init__(message)
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from dateno import models, utils
+
+_MISSING = object()
+
+
+def _encode(value: Any) -> bytes:
+    # orjson returns over-allocated buffers (~2.5x here); keep an exact-size copy.
+    return bytes(memoryview(utils.json_dumps(value)))
+
+
+class CompactHit:
+    """A search hit that keeps its `_source` as encoded JSON.
+
+    A validated `models.Hit` carries a per-instance `__dict__`, pydantic
+    bookkeeping and a fully materialized `_source` tree, which dominates memory
+    when millions of hits are held for deduplication or ranking. `CompactHit`
+    keeps `id`, `score` and `index` in slots and `_source` (plus any extra hit
+    fields such as `sort`) as bytes, decoded on access. `source` and `get`
+    decode on every call, so read the fields you need once.
+    """
+
+    __slots__ = ("id", "score", "index", "_source", "_extra")
+
+    def __init__(
+        self,
+        id: str,  # pylint: disable=redefined-builtin
+        source: Union[bytes, Mapping[str, Any]],
+        score: Optional[float] = None,
+        index: Optional[str] = None,
+        extra: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.id = id
+        self.score = score
+        self.index = index
+        self._source = source if isinstance(source, bytes) else _encode(source)
+        self._extra = _encode(extra) if extra else None
+
+    @classmethod
+    def from_hit(cls, hit: models.Hit) -> CompactHit:
+        return cls(
+            hit.id,
+            hit.source,
+            score=hit.score,
+            index=hit.index,
+            extra=hit.additional_properties,
+        )
+
+    @classmethod
+    def from_raw(cls, hit: Mapping[str, Any]) -> CompactHit:
+        """From a hit of a `response_mode="json"` search response."""
+        extra = {
+            k: v
+            for k, v in hit.items()
+            if k not in ("_id", "_source", "_score", "_index")
+        }
+        return cls(
+            hit["_id"],
+            hit.get("_source") or {},
+            score=hit.get("_score"),
+            index=hit.get("_index"),
+            extra=extra,
+        )
+
+    @classmethod
+    def from_response(
+        cls, response: Union[models.SearchQueryResponse, Mapping[str, Any]]
+    ) -> List[CompactHit]:
+        """The hits of a search page, validated or from `response_mode="json"`."""
+        if isinstance(response, Mapping):
+            return [cls.from_raw(hit) for hit in utils.raw_hits(response)]
+        return [cls.from_hit(hit) for hit in response.hits.hits]
+
+    @property
+    def source(self) -> Dict[str, Any]:
+        """The decoded `_source` document (a new dict on every access)."""
+        return utils.json_loads(self._source)
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """Hit fields besides `_id`, `_source`, `_score` and `_index`, e.g. `sort`."""
+        return utils.json_loads(self._extra) if self._extra is not None else {}
+
+    @property
+    def source_size(self) -> int:
+        """Size of the encoded `_source` in bytes."""
+        return len(self._source)
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """The `_source` field at dotted `path`, e.g. `"dataset.title"`."""
+        value: Any = self.source
+        for key in path.split("."):
+            value = value.get(key, _MISSING) if isinstance(value, dict) else _MISSING
+            if value is _MISSING:
+                return default
+        return value
+
+    def to_hit(self) -> models.Hit:
+        hit = models.Hit(
+            id=self.id, source=self.source, score=self.score, index=self.index
+        )
+        if self._extra is not None:
+            hit.additional_properties.update(self.extra)
+        return hit
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactHit):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.score == other.score
+            and self.index == other.index
+            and self._source == other._source
+            and self._extra == other._extra
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactHit(id={self.id!r}, score={self.score!r}, "
+            f"index={self.index!r}, source=<{len(self._source)} bytes>)"
+        )
+
+    def __getstate__(self) -> tuple:
+        return (self.id, self.score, self.index, self._source, self._extra)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.id, self.score, self.index, self._source, self._extra = state
+
+
+def compact_hits(
+    hits: Iterable[Union[models.Hit, Mapping[str, Any]]],
+) -> Iterator[CompactHit]:
+    """Convert hits lazily, e.g. `compact_hits(sdk.search_api.paginate_search_datasets(...))`."""
+    for hit in hits:
+        if isinstance(hit, Mapping):
+            yield CompactHit.from_raw(hit)
+        else:
+            yield CompactHit.from_hit(hit)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from dateno import models, utils
+from dateno.search_api import SearchAPI
+
+DEFAULT_PARTITION_KEYS = ("source.catalog_type",)
+DEFAULT_MAX_PARTITION_SIZE = 10_000
+"""Partitions larger than this (the default Elasticsearch result window) are
+split further by the next partition key, if any."""
+
+
+@dataclass
+class HarvestPartition:
+    filters: List[str]
+    """Filters added to the base query for this partition."""
+    expected: Optional[int] = None
+    """Upper bound of hits reported by the facet values (unfiltered counts)."""
+    harvested: int = 0
+    error: Optional[BaseException] = None
+    split: bool = False
+    """Set when the partition was split by the next key instead of harvested."""
+    total: Optional[int] = None
+    """Exact `hits.total` of a split partition."""
+    uncovered: Optional[int] = None
+    """Hits of a split partition reached by none of its sub-partitions (those
+    without a value for the next key); None if a sub-partition failed."""
+    parent: Optional[HarvestPartition] = field(
+        default=None, repr=False, compare=False
+    )
+
+
+@dataclass
+class HarvestReport:
+    expected_total: Optional[int] = None
+    """Exact `hits.total` of the unpartitioned query, if the server reported it."""
+    unique_hits: int = 0
+    duplicate_hits: int = 0
+    partitions: List[HarvestPartition] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> Optional[float]:
+        """Share of `expected_total` that was harvested (deduplicated)."""
+        if not self.expected_total:
+            return None
+        return self.unique_hits / self.expected_total
+
+    @property
+    def failed_partitions(self) -> List[HarvestPartition]:
+        return [p for p in self.partitions if p.error is not None]
+
+    @property
+    def uncovered_hits(self) -> int:
+        """Hits of split partitions that no sub-partition could reach."""
+        return sum(p.uncovered or 0 for p in self.partitions if p.split)
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def facet_filter(key: str, value: str) -> str:
+    """Format a `search_datasets` filter matching `key` exactly."""
+    return f"{_quote(key)}={_quote(value)}"
+
+
+class SearchHarvest:
+    """Async iterator over the deduplicated hits of a partitioned harvest.
+
+    `report` is filled in while the harvest runs and is complete once
+    iteration finishes.
+    """
+
+    def __init__(
+        self,
+        search: SearchAPI,
+        *,
+        q: str,
+        filters: Sequence[str],
+        partition_keys: Sequence[str],
+        limit: int,
+        concurrency: int,
+        prefetch: Optional[int],
+        max_partition_size: int,
+        timeout_ms: Optional[int],
+        http_headers: Optional[Mapping[str, str]],
+    ) -> None:
+        if not partition_keys:
+            raise ValueError("at least one partition key is required")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+        self._search = search
+        self._q = q
+        self._filters = list(filters)
+        self._partition_keys = list(partition_keys)
+        self._limit = limit
+        self._concurrency = concurrency
+        self._prefetch = prefetch
+        self._max_partition_size = max_partition_size
+        self._timeout_ms = timeout_ms
+        self._http_headers = http_headers
+        self.report = HarvestReport()
+        self._covered: Dict[int, Set[str]] = {}
+
+    def __aiter__(self) -> AsyncIterator[models.Hit]:
+        return self._run()
+
+    async def _plan(self) -> List[HarvestPartition]:
+        available = {
+            facet.key
+            for facet in await self._search.list_search_facets_async(
+                timeout_ms=self._timeout_ms, http_headers=self._http_headers
+            )
+        }
+        unknown = [key for key in self._partition_keys if key not in available]
+        if unknown:
+            raise ValueError(f"unknown partition keys: {', '.join(unknown)}")
+
+        values: Dict[str, List[models.FacetItem]] = {}
+        for key in self._partition_keys:
+            response = await self._search.get_search_facet_values_async(
+                key=key, timeout_ms=self._timeout_ms, http_headers=self._http_headers
+            )
+            values[key] = list(response.items or [])
+
+        partitions: List[HarvestPartition] = []
+        pending = [(HarvestPartition(filters=[]), 0)]
+        while pending:
+            parent, depth = pending.pop()
+            if depth > 0 and (
+                depth == len(self._partition_keys)
+                or parent.expected is None
+                or parent.expected <= self._max_partition_size
+            ):
+                partitions.append(parent)
+                continue
+            if depth > 0:
+                # Filters can only match values, not their absence, and the
+                # parent itself is beyond the result window, so its hits
+                # without a value for `key` cannot be reached; its exact total
+                # lets the report count them once the children are harvested.
+                parent.split = True
+                parent.total = await self._hits_total(parent.filters)
+                self._covered[id(parent)] = set()
+                partitions.append(parent)
+            key = self._partition_keys[depth]
+            for item in values[key]:
+                expected = item.num
+                if parent.expected is not None:
+                    expected = min(expected, parent.expected)
+                child = HarvestPartition(
+                    filters=parent.filters + [facet_filter(key, item.key)],
+                    expected=expected,
+                    parent=parent if depth > 0 else None,
+                )
+                pending.append((child, depth + 1))
+
+        partitions.reverse()
+        return partitions
+
+    async def _hits_total(self, filters: List[str]) -> Optional[int]:
+        first = await self._search.search_datasets_async(
+            q=self._q,
+            filters=(self._filters + filters) or None,
+            limit=1,
+            facets=False,
+            timeout_ms=self._timeout_ms,
+            http_headers=self._http_headers,
+            response_mode="model",
+        )
+        return utils.search_hits_total(first)
+
+    def _ancestors(self, partition: HarvestPartition) -> List[HarvestPartition]:
+        ancestors = []
+        parent = partition.parent
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parent.parent
+        return ancestors
+
+    def _finish_split_partitions(self) -> None:
+        failed = {
+            id(a)
+            for p in self.report.failed_partitions
+            for a in self._ancestors(p)
+        }
+        for p in self.report.partitions:
+            if p.split and p.total is not None and id(p) not in failed:
+                p.uncovered = max(0, p.total - len(self._covered[id(p)]))
+
+    async def _harvest_partition(
+        self,
+        partition: HarvestPartition,
+        semaphore: asyncio.Semaphore,
+        queue: "asyncio.Queue[Optional[models.Hit]]",
+    ) -> None:
+        ancestors = self._ancestors(partition)
+        async with semaphore:
+            try:
+                async for hit in self._search.paginate_search_datasets_async(
+                    q=self._q,
+                    filters=self._filters + partition.filters,
+                    limit=self._limit,
+                    facets=False,
+                    timeout_ms=self._timeout_ms,
+                    http_headers=self._http_headers,
+                    prefetch=self._prefetch,
+                ):
+                    partition.harvested += 1
+                    for ancestor in ancestors:
+                        self._covered[id(ancestor)].add(hit.id)
+                    await queue.put(hit)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                partition.error = e
+
+    async def _run(self) -> AsyncIterator[models.Hit]:
+        self.report.expected_total = await self._hits_total([])
+        self.report.partitions = await self._plan()
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        queue: "asyncio.Queue[Optional[models.Hit]]" = asyncio.Queue(
+            maxsize=self._limit * self._concurrency
+        )
+
+        async def produce() -> None:
+            try:
+                await asyncio.gather(
+                    *(
+                        self._harvest_partition(p, semaphore, queue)
+                        for p in self.report.partitions
+                        if not p.split
+                    )
+                )
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        seen: Set[str] = set()
+        try:
+            while True:
+                hit = await queue.get()
+                if hit is None:
+                    break
+                if hit.id in seen:
+                    self.report.duplicate_hits += 1
+                    continue
+                seen.add(hit.id)
+                self.report.unique_hits += 1
+                yield hit
+            await producer
+            self._finish_split_partitions()
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+
+def harvest_search_datasets_async(
+    search: SearchAPI,
+    *,
+    q: str = "",
+    filters: Optional[Sequence[str]] = None,
+    partition_keys: Sequence[str] = DEFAULT_PARTITION_KEYS,
+    limit: int = 500,
+    concurrency: int = 8,
+    prefetch: Optional[int] = None,
+    max_partition_size: int = DEFAULT_MAX_PARTITION_SIZE,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> SearchHarvest:
+    """
+    Harvest every hit of a large query by splitting it into facet partitions.
+    - Partitions by the values of `partition_keys[0]` (from get_search_facet_values);
+      partitions whose facet count exceeds `max_partition_size` are split again
+      by the next key. The split partition itself is not harvested (it is beyond
+      the server's result window); its hits without a value for the next key
+      are counted in its `uncovered` and in `report.uncovered_hits`
+    - Runs up to `concurrency` partitions at once via paginate_search_datasets_async
+    - Yields each hit once (deduplicated by `Hit.id`)
+    - `report` compares the harvested hits against `hits.total` of the full query;
+      hits without a value for the first key are in no partition and show up as
+      missing coverage
+    """
+    return SearchHarvest(
+        search,
+        q=q,
+        filters=filters or [],
+        partition_keys=partition_keys,
+        limit=limit,
+        concurrency=concurrency,
+        prefetch=prefetch,
+        max_partition_size=max_partition_size,
+        timeout_ms=timeout_ms,
+        http_headers=http_headers,
+    )
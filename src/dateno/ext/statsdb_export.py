@@ -1,9 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional, Mapping
+from typing import IO, Any, Collection, Dict, List, Optional, Mapping, Protocol, Tuple
 
-from dateno.apis.statistics_api import StatisticsAPI, ExportTimeseriesFileAcceptEnum
+import httpx
+
+from dateno import errors
+from dateno.statistics_api import StatisticsAPI, ExportTimeseriesFileAcceptEnum
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_EXPORT_CONCURRENCY = 8
+DEFAULT_RESUME_ATTEMPTS = 5
+
+
+class BinarySink(Protocol):
+    """Anything with a `write(bytes)` method; async sinks may return an awaitable."""
+
+    def write(self, data: bytes, /) -> Any: ...
 
 
 def export_timeseries_file_bytes(
@@ -21,6 +44,9 @@ def export_timeseries_file_bytes(
     - Calls generated export_timeseries_file(stream=True)
     - Ensures response is read
     - Returns bytes
+
+    The whole file is held in memory; use export_timeseries_file_to_stream or
+    export_timeseries_file_to_path for large exports.
     """
     resp = stats.export_timeseries_file(
         ns_id=ns_id,
@@ -40,27 +66,671 @@ def export_timeseries_file_bytes(
     return r.content
 
 
-def export_timeseries_file_to_path(
+def export_timeseries_file_to_stream(
     stats: StatisticsAPI,
     *,
     ns_id: str,
     ts_id: str,
     fileext: str,
-    path: str | Path,
+    sink: BinarySink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
     accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
     timeout_ms: Optional[int] = None,
     http_headers: Optional[Mapping[str, str]] = None,
-) -> Path:
-    data = export_timeseries_file_bytes(
-        stats,
+) -> int:
+    """
+    Stream an export into a file-like `sink` in `chunk_size` pieces.
+    - Memory use is bounded by the chunk size, not the file size
+    - The response is closed even if writing fails
+    - Returns the number of bytes written
+    """
+    resp = stats.export_timeseries_file(
         ns_id=ns_id,
         ts_id=ts_id,
         fileext=fileext,
-        accept=accept,
+        accept_header_override=accept,
         timeout_ms=timeout_ms,
         http_headers=http_headers,
     )
-    p = Path(path)
+
+    r = resp.result  # httpx.Response
+    written = 0
+    try:
+        for chunk in r.iter_bytes(chunk_size):
+            sink.write(chunk)
+            written += len(chunk)
+    finally:
+        r.close()
+    return written
+
+
+async def export_timeseries_file_to_stream_async(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    ts_id: str,
+    fileext: str,
+    sink: BinarySink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> int:
+    """
+    Async counterpart of export_timeseries_file_to_stream.
+    `sink.write` may be a plain or a coroutine method. A plain `write` runs on
+    the event loop, so it must not block; pass a sink whose coroutine `write`
+    offloads blocking I/O (as export_timeseries_file_to_path_async does for
+    files).
+    """
+    resp = await stats.export_timeseries_file_async(
+        ns_id=ns_id,
+        ts_id=ts_id,
+        fileext=fileext,
+        accept_header_override=accept,
+        timeout_ms=timeout_ms,
+        http_headers=http_headers,
+    )
+
+    r = resp.result  # httpx.Response
+    written = 0
+    try:
+        async for chunk in r.aiter_bytes(chunk_size):
+            result = sink.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            written += len(chunk)
+    finally:
+        await r.aclose()
+    return written
+
+
+class _ThreadedFileSink:
+    """Sink writing to a file from a worker thread, off the event loop."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        self._f = f
+
+    async def write(self, data: bytes) -> None:
+        await asyncio.to_thread(self._f.write, data)
+
+
+def _temp_file_for(p: Path) -> IO[bytes]:
+    # Unlike tempfile (0600), `open` creates the file with the umask-derived
+    # mode, which `os.replace` carries over to the exported file.
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_bytes(data)
+    while True:
+        name = p.parent / f".{p.name}.{secrets.token_hex(4)}.part"
+        try:
+            return open(str(name), "xb")
+        except FileExistsError:
+            continue
+
+
+def _discard(tmp_path: str) -> None:
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+
+
+class IncompleteExportError(IOError):
+    """The transfer ended before `Content-Length` bytes were received."""
+
+    def __init__(self, received: int, expected: int) -> None:
+        super().__init__(f"export incomplete: received {received} of {expected} bytes")
+        self.received = received
+        self.expected = expected
+
+
+class _PartialExport:
+    """Partial download of `path`: `<path>.part` plus the validator it was started with.
+
+    The validator is kept in `<path>.part.json` so a later call (or process)
+    can continue where the previous one stopped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.part = path.with_name(path.name + ".part")
+        self.meta = path.with_name(path.name + ".part.json")
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.meta.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def offset(self) -> Tuple[int, Optional[str]]:
+        """Bytes already on disk that can be resumed, and the If-Range validator."""
+        meta = self._load_meta()
+        validator = meta.get("validator")
+        if not meta.get("accept_ranges") or not validator or not self.part.exists():
+            return 0, None
+        return self.part.stat().st_size, validator
+
+    def request_headers(
+        self, http_headers: Optional[Mapping[str, str]]
+    ) -> Tuple[Dict[str, str], int]:
+        # Ranges refer to the encoded body; ask for identity so offsets match the file.
+        headers = dict(http_headers or {})
+        headers["Accept-Encoding"] = "identity"
+        offset, validator = self.offset()
+        if offset > 0 and validator:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        return headers, offset
+
+    def open(
+        self, response: httpx.Response, offset: int, chunk_size: int
+    ) -> Tuple[IO[bytes], Optional[int]]:
+        """Open the part file for this response; return it with the expected final size."""
+        total: Optional[int] = None
+        if response.status_code == 206:
+            start, total = _parse_content_range(response.headers.get("content-range"))
+            if start != offset:
+                self.reset()
+                raise IncompleteExportError(0, total or 0)
+            mode = "ab"
+        else:
+            length = response.headers.get("content-length")
+            total = int(length) if length and length.isdigit() else None
+            mode = "wb"
+            etag = response.headers.get("etag")
+            validator = (
+                etag
+                if etag and not etag.startswith("W/")
+                else response.headers.get("last-modified")
+            )
+            self.meta.write_text(
+                json.dumps(
+                    {
+                        "validator": validator,
+                        "accept_ranges": response.headers.get("accept-ranges", "").lower()
+                        == "bytes",
+                        "length": total,
+                    }
+                ),
+                encoding="utf-8",
+            )
+        # pylint: disable-next=consider-using-with
+        return open(self.part, mode, buffering=chunk_size), total
+
+    def verify(self, total: Optional[int]) -> None:
+        size = self.part.stat().st_size
+        if total is not None and size != total:
+            raise IncompleteExportError(size, total)
+
+    def complete(self) -> None:
+        os.replace(self.part, self.path)
+        _discard(str(self.meta))
+
+    def reset(self) -> None:
+        _discard(str(self.part))
+        _discard(str(self.meta))
+
+
+def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    # "bytes 100-199/200" -> (100, 200); the total may be "*".
+    try:
+        unit, spec = (value or "").split(" ", 1)
+        span, total = spec.split("/", 1)
+        start = int(span.split("-", 1)[0])
+    except ValueError:
+        return None, None
+    if unit != "bytes":
+        return None, None
+    return start, int(total) if total.isdigit() else None
+
+
+def _resumable_export_to_path(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    ts_id: str,
+    fileext: str,
+    path: Path,
+    chunk_size: int,
+    attempts: int,
+    accept: Optional[ExportTimeseriesFileAcceptEnum],
+    timeout_ms: Optional[int],
+    http_headers: Optional[Mapping[str, str]],
+) -> Path:
+    partial = _PartialExport(path)
+    last_error: Optional[Exception] = None
+    for _ in range(attempts):
+        headers, offset = partial.request_headers(http_headers)
+        try:
+            resp = stats.export_timeseries_file(
+                ns_id=ns_id,
+                ts_id=ts_id,
+                fileext=fileext,
+                accept_header_override=accept,
+                timeout_ms=timeout_ms,
+                http_headers=headers,
+            )
+        except errors.SDKError as e:
+            if e.status_code == 416 and offset:
+                partial.reset()
+                last_error = e
+                continue
+            raise
+        except httpx.TransportError as e:
+            # Reconnecting right after a drop often fails too; keep the part file.
+            last_error = e
+            continue
+
+        r = resp.result
+        try:
+            f, total = partial.open(r, offset, chunk_size)
+            # Unchunked iteration, so bytes received before a drop reach the file.
+            with f:
+                for chunk in r.iter_bytes():
+                    f.write(chunk)
+            partial.verify(total)
+        except (httpx.TransportError, IncompleteExportError) as e:
+            last_error = e
+            continue
+        finally:
+            r.close()
+        partial.complete()
+        return path
+
+    assert last_error is not None
+    raise last_error
+
+
+async def _resumable_export_to_path_async(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    ts_id: str,
+    fileext: str,
+    path: Path,
+    chunk_size: int,
+    attempts: int,
+    accept: Optional[ExportTimeseriesFileAcceptEnum],
+    timeout_ms: Optional[int],
+    http_headers: Optional[Mapping[str, str]],
+) -> Path:
+    # Disk I/O, including the `.part.json` bookkeeping, runs in worker threads.
+    partial = await asyncio.to_thread(_PartialExport, path)
+    last_error: Optional[Exception] = None
+    for _ in range(attempts):
+        headers, offset = await asyncio.to_thread(partial.request_headers, http_headers)
+        try:
+            resp = await stats.export_timeseries_file_async(
+                ns_id=ns_id,
+                ts_id=ts_id,
+                fileext=fileext,
+                accept_header_override=accept,
+                timeout_ms=timeout_ms,
+                http_headers=headers,
+            )
+        except errors.SDKError as e:
+            if e.status_code == 416 and offset:
+                await asyncio.to_thread(partial.reset)
+                last_error = e
+                continue
+            raise
+        except httpx.TransportError as e:
+            last_error = e
+            continue
+
+        r = resp.result
+        try:
+            f, total = await asyncio.to_thread(partial.open, r, offset, chunk_size)
+            try:
+                async for chunk in r.aiter_bytes():
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            await asyncio.to_thread(partial.verify, total)
+        except (httpx.TransportError, IncompleteExportError) as e:
+            last_error = e
+            continue
+        finally:
+            await r.aclose()
+        await asyncio.to_thread(partial.complete)
+        return path
+
+    assert last_error is not None
+    raise last_error
+
+
+def export_timeseries_file_to_path(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    ts_id: str,
+    fileext: str,
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = False,
+    resume_attempts: int = DEFAULT_RESUME_ATTEMPTS,
+    accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> Path:
+    """
+    Stream an export to `path`.
+    - Data goes to a temporary file next to `path`, renamed over it on success
+    - On failure the temporary file is removed and `path` is left untouched
+
+    With `resume=True` the data goes to `<path>.part` instead, which is kept on
+    failure. Dropped transfers are continued with `Range`/`If-Range` when the
+    server advertised `Accept-Ranges: bytes` (and restarted otherwise), up to
+    `resume_attempts` requests, including ones that fail to connect; a later
+    call continues an existing part file.
+    The final size is checked against `Content-Length`.
+    """
+    p = Path(path)
+    if resume:
+        return _resumable_export_to_path(
+            stats,
+            ns_id=ns_id,
+            ts_id=ts_id,
+            fileext=fileext,
+            path=p,
+            chunk_size=chunk_size,
+            attempts=resume_attempts,
+            accept=accept,
+            timeout_ms=timeout_ms,
+            http_headers=http_headers,
+        )
+    tmp = _temp_file_for(p)
+    try:
+        with tmp:
+            export_timeseries_file_to_stream(
+                stats,
+                ns_id=ns_id,
+                ts_id=ts_id,
+                fileext=fileext,
+                sink=tmp,
+                chunk_size=chunk_size,
+                accept=accept,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+            )
+        os.replace(tmp.name, p)
+    except BaseException:
+        _discard(tmp.name)
+        raise
     return p
+
+
+async def export_timeseries_file_to_path_async(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    ts_id: str,
+    fileext: str,
+    path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = False,
+    resume_attempts: int = DEFAULT_RESUME_ATTEMPTS,
+    accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> Path:
+    """Async counterpart of export_timeseries_file_to_path.
+    File writes, renames and resume bookkeeping run in worker threads
+    (`asyncio.to_thread`), so they do not block the event loop.
+    """
+    p = Path(path)
+    if resume:
+        return await _resumable_export_to_path_async(
+            stats,
+            ns_id=ns_id,
+            ts_id=ts_id,
+            fileext=fileext,
+            path=p,
+            chunk_size=chunk_size,
+            attempts=resume_attempts,
+            accept=accept,
+            timeout_ms=timeout_ms,
+            http_headers=http_headers,
+        )
+    tmp = await asyncio.to_thread(_temp_file_for, p)
+    try:
+        try:
+            await export_timeseries_file_to_stream_async(
+                stats,
+                ns_id=ns_id,
+                ts_id=ts_id,
+                fileext=fileext,
+                sink=_ThreadedFileSink(tmp),
+                chunk_size=chunk_size,
+                accept=accept,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+            )
+        finally:
+            await asyncio.to_thread(tmp.close)
+        await asyncio.to_thread(os.replace, tmp.name, p)
+    except BaseException:
+        # Synchronous, so the file is also removed when the task is cancelled.
+        _discard(tmp.name)
+        raise
+    return p
+
+
+@dataclass
+class ExportManifestEntry:
+    ts_id: str
+    indicator: str
+    table: str
+    path: str
+    size: Optional[int] = None
+    duration_s: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class ExportManifest:
+    ns_id: str
+    fileext: str
+    entries: List[ExportManifestEntry] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[ExportManifestEntry]:
+        return [e for e in self.entries if e.error is not None]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.size or 0 for e in self.entries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ns_id": self.ns_id,
+            "fileext": self.fileext,
+            "exported": len(self.entries) - len(self.failed),
+            "failed": len(self.failed),
+            "total_bytes": self.total_bytes,
+            "entries": [asdict(e) for e in self.entries],
+        }
+
+    def write(self, path: str | Path) -> Path:
+        """Write the manifest as JSON."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return p
+
+
+def _selected(
+    ts: Any, indicators: Optional[Collection[str]], tables: Optional[Collection[str]]
+) -> bool:
+    if indicators is not None and ts.indicator not in indicators:
+        return False
+    if tables is not None and ts.table not in tables:
+        return False
+    return True
+
+
+def _export_file_name(ts_id: str, fileext: str) -> str:
+    name = ts_id.replace("/", "_").replace(os.sep, "_")
+    if name != ts_id:
+        # Keep ids that differ only in separators (`a/b`, `a_b`) apart.
+        name = f"{name}-{hashlib.sha1(ts_id.encode('utf-8')).hexdigest()[:8]}"
+    return f"{name}.{fileext}"
+
+
+def export_namespace(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    dest_dir: str | Path,
+    fileext: str = "csv",
+    indicators: Optional[Collection[str]] = None,
+    tables: Optional[Collection[str]] = None,
+    concurrency: int = DEFAULT_EXPORT_CONCURRENCY,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> ExportManifest:
+    """
+    Export every timeseries of a namespace into `dest_dir`.
+    - Walks paginate_list_timeseries, optionally keeping only the given
+      `indicators` / `tables`
+    - Streams up to `concurrency` exports at once to `<dest_dir>/<ts_id>.<fileext>`;
+      ids containing path separators get them replaced and a short hash of the
+      id appended, e.g. `a/b` -> `a_b-<hash>.csv`
+    - A failed export is recorded in the manifest instead of stopping the run
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    dest = Path(dest_dir)
+    manifest = ExportManifest(ns_id=ns_id, fileext=fileext)
+
+    def run(entry: ExportManifestEntry) -> None:
+        started = time.monotonic()
+        try:
+            p = export_timeseries_file_to_path(
+                stats,
+                ns_id=ns_id,
+                ts_id=entry.ts_id,
+                fileext=fileext,
+                path=entry.path,
+                chunk_size=chunk_size,
+                accept=accept,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+            )
+            entry.size = p.stat().st_size
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            entry.error = f"{type(e).__name__}: {e}"
+        entry.duration_s = time.monotonic() - started
+
+    # Listing stays at most `concurrency` exports ahead, so an error or Ctrl-C
+    # only waits for the exports already running.
+    slots = threading.BoundedSemaphore(concurrency)
+
+    def run_in_slot(entry: ExportManifestEntry) -> None:
+        try:
+            run(entry)
+        finally:
+            slots.release()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for ts in stats.paginate_list_timeseries(
+            ns_id=ns_id, timeout_ms=timeout_ms, http_headers=http_headers
+        ):
+            if not _selected(ts, indicators, tables):
+                continue
+            entry = ExportManifestEntry(
+                ts_id=ts.id,
+                indicator=ts.indicator,
+                table=ts.table,
+                path=str(dest / _export_file_name(ts.id, fileext)),
+            )
+            manifest.entries.append(entry)
+            slots.acquire()
+            executor.submit(run_in_slot, entry)
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return manifest
+
+
+async def export_namespace_async(
+    stats: StatisticsAPI,
+    *,
+    ns_id: str,
+    dest_dir: str | Path,
+    fileext: str = "csv",
+    indicators: Optional[Collection[str]] = None,
+    tables: Optional[Collection[str]] = None,
+    concurrency: int = DEFAULT_EXPORT_CONCURRENCY,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    accept: Optional[ExportTimeseriesFileAcceptEnum] = None,
+    timeout_ms: Optional[int] = None,
+    http_headers: Optional[Mapping[str, str]] = None,
+) -> ExportManifest:
+    """Async counterpart of export_namespace.
+
+    `concurrency` workers take the timeseries from a bounded queue, so listing
+    the namespace stays at most `concurrency` entries ahead of the exports.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    dest = Path(dest_dir)
+    manifest = ExportManifest(ns_id=ns_id, fileext=fileext)
+    queue: "asyncio.Queue[Optional[ExportManifestEntry]]" = asyncio.Queue(
+        maxsize=concurrency
+    )
+
+    async def run(entry: ExportManifestEntry) -> None:
+        started = time.monotonic()
+        try:
+            p = await export_timeseries_file_to_path_async(
+                stats,
+                ns_id=ns_id,
+                ts_id=entry.ts_id,
+                fileext=fileext,
+                path=entry.path,
+                chunk_size=chunk_size,
+                accept=accept,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+            )
+            entry.size = (await asyncio.to_thread(p.stat)).st_size
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            entry.error = f"{type(e).__name__}: {e}"
+        entry.duration_s = time.monotonic() - started
+
+    async def worker() -> None:
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            await run(entry)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        async for ts in stats.paginate_list_timeseries_async(
+            ns_id=ns_id, timeout_ms=timeout_ms, http_headers=http_headers
+        ):
+            if not _selected(ts, indicators, tables):
+                continue
+            entry = ExportManifestEntry(
+                ts_id=ts.id,
+                indicator=ts.indicator,
+                table=ts.table,
+                path=str(dest / _export_file_name(ts.id, fileext)),
+            )
+            manifest.entries.append(entry)
+            await queue.put(entry)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        # Wait for cancelled exports to remove their temporary files.
+        await asyncio.gather(*workers, return_exceptions=True)
+    return manifest
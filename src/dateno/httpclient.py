@@ -2,9 +2,11 @@
 
 # pyright: reportReturnType = false
 import asyncio
+import importlib.util
+from dataclasses import dataclass
 from typing_extensions import Protocol, runtime_checkable
 import httpx
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 
 @runtime_checkable
@@ -85,6 +87,49 @@ class AsyncHttpClient(Protocol):
         pass
 
 
+@dataclass(frozen=True)
+class ConnectionConfig:
+    """Connection pool settings for the HTTP clients created by the SDK.
+
+    `max_connections` bounds concurrent connections per client and
+    `max_keepalive_connections` the idle ones kept open for reuse, for up to
+    `keepalive_expiry` seconds. `http2` multiplexes requests over fewer
+    connections and requires the `h2` package (`pip install "httpx[http2]"`).
+    `pool_timeout_ms` bounds how long a request waits for a free connection;
+    by default it is the request timeout.
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    pool_timeout_ms: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package; "
+                'install it with: pip install "httpx[http2]"'
+            )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        return {"limits": self.limits(), "http2": self.http2, "follow_redirects": True}
+
+    def timeout(self, timeout_ms: Optional[int]) -> Union[httpx.Timeout, float, None]:
+        """Request timeout for `timeout_ms`, with the pool timeout applied."""
+        timeout = timeout_ms / 1000 if timeout_ms is not None else None
+        if self.pool_timeout_ms is None:
+            return timeout
+        return httpx.Timeout(timeout, pool=self.pool_timeout_ms / 1000)
+
+
 class ClientOwner(Protocol):
     client: Union[HttpClient, None]
     async_client: Union[AsyncHttpClient, None]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 from dateno.types import BaseModel, Nullable, OptionalNullable, UNSET, UNSET_SENTINEL
+import pydantic
 from pydantic import model_serializer
-from typing import Any, Dict
-from typing_extensions import NotRequired, TypedDict
+from typing import Any, Dict, List, Union
+from typing_extensions import Annotated, NotRequired, TypedDict
 
 
 class BodySearchDatasetsDslTypedDict(TypedDict):
@@ -12,6 +13,14 @@ class BodySearchDatasetsDslTypedDict(TypedDict):
     r"""Elastic DSL query object. If omitted, match_all is used."""
     post_filter: NotRequired[Nullable[Dict[str, Any]]]
     r"""Facet filters as Elastic DSL post_filter (bool/term/etc)."""
+    sort: NotRequired[Nullable[List[Any]]]
+    r"""Elastic DSL sort clauses. Must end with a unique tiebreaker when used with `search_after`."""
+    search_after: NotRequired[Nullable[List[Any]]]
+    r"""Sort values of the last hit of the previous page (cursor pagination)."""
+    pit: NotRequired[Nullable[Dict[str, Any]]]
+    r"""Point in time to search, e.g. `{\"id\": \"...\", \"keep_alive\": \"1m\"}`."""
+    source: NotRequired[Nullable[Union[bool, List[str], Dict[str, Any]]]]
+    r"""Elastic DSL `_source` filter, e.g. `{\"includes\": [\"id\", \"dataset.title\"]}`."""
 
 
 class BodySearchDatasetsDsl(BaseModel):
@@ -21,10 +30,39 @@ class BodySearchDatasetsDsl(BaseModel):
     post_filter: OptionalNullable[Dict[str, Any]] = UNSET
     r"""Facet filters as Elastic DSL post_filter (bool/term/etc)."""
 
+    sort: OptionalNullable[List[Any]] = UNSET
+    r"""Elastic DSL sort clauses. Must end with a unique tiebreaker when used with `search_after`."""
+
+    search_after: OptionalNullable[List[Any]] = UNSET
+    r"""Sort values of the last hit of the previous page (cursor pagination)."""
+
+    pit: OptionalNullable[Dict[str, Any]] = UNSET
+    r"""Point in time to search, e.g. `{\"id\": \"...\", \"keep_alive\": \"1m\"}`."""
+
+    source: Annotated[
+        OptionalNullable[Union[bool, List[str], Dict[str, Any]]],
+        pydantic.Field(alias="_source"),
+    ] = UNSET
+    r"""Elastic DSL `_source` filter, e.g. `{\"includes\": [\"id\", \"dataset.title\"]}`."""
+
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["query", "post_filter"]
-        nullable_fields = ["query", "post_filter"]
+        optional_fields = [
+            "query",
+            "post_filter",
+            "sort",
+            "search_after",
+            "pit",
+            "_source",
+        ]
+        nullable_fields = [
+            "query",
+            "post_filter",
+            "sort",
+            "search_after",
+            "pit",
+            "_source",
+        ]
         null_default_fields = []
 
         serialized = handler(self)
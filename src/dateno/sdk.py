@@ -1,9 +1,16 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from .basesdk import BaseSDK
-from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
+from .httpclient import (
+    AsyncHttpClient,
+    ClientOwner,
+    ConnectionConfig,
+    HttpClient,
+    close_clients,
+)
 from .sdkconfiguration import DEFAULT_TIMEOUT_MS, SDKConfiguration
 from .utils.logger import Logger, get_default_logger
+from .utils.rawresponse import ResponseMode, resolve_response_mode
 from .utils.retries import RetryConfig
 from . import models, utils
 from ._hooks import SDKHooks
@@ -11,7 +18,7 @@ from .types import OptionalNullable, UNSET
 import httpx
 import importlib
 import sys
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union, cast
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union, cast
 import weakref
 
 if TYPE_CHECKING:
@@ -20,6 +27,41 @@ if TYPE_CHECKING:
     from .search_api import SearchAPI
     from .service import Service
     from .statistics_api import StatisticsAPI
+    from .utils.backoff import BackoffCoordinator
+    from .utils.circuitbreaker import CircuitBreaker
+    from .utils.compression import CompressionMetrics
+    from .utils.hedging import RequestHedger
+    from .utils.httpcache import ResponseCache
+    from .utils.memo import ResponseMemo
+    from .utils.ratelimit import RateLimiter
+    from .utils.routing import ServerRouter
+
+
+# Success response types of all operations; used to build their unmarshallers
+# up front when the SDK is created with `prewarm_models=True`.
+_PREWARM_MODEL_NAMES = (
+    "DataCatalog",
+    "DataCatalogSearchResponse",
+    "FacetValuesResponse",
+    "Indicator",
+    "Namespace",
+    "PageIndicator",
+    "PageNamespace",
+    "PageTableListItem",
+    "PageTimeseries",
+    "SearchIndexEntry",
+    "SearchQueryResponse",
+    "SimilarHitsResponse",
+    "TableWithSchema",
+    "TimeseriesWithSchema",
+)
+
+
+def _prewarm_models() -> None:
+    types: List[Any] = [getattr(models, name) for name in _PREWARM_MODEL_NAMES]
+    types.append(List[models.FacetInfo])
+    types.append(Dict[str, Any])
+    utils.prewarm_serializers(types)
 
 
 class SDK(BaseSDK):
@@ -76,6 +118,17 @@ class SDK(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = DEFAULT_TIMEOUT_MS,
         debug_logger: Optional[Logger] = None,
+        prewarm_models: bool = False,
+        response_cache: Optional["ResponseCache"] = None,
+        response_memo: Optional["ResponseMemo"] = None,
+        connection_config: Optional[ConnectionConfig] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        backoff_coordinator: Optional["BackoffCoordinator"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        request_hedger: Optional["RequestHedger"] = None,
+        server_router: Optional["ServerRouter"] = None,
+        compression_metrics: Optional["CompressionMetrics"] = None,
+        response_mode: ResponseMode = "model",
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -88,10 +141,39 @@ class SDK(BaseSDK):
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
             (defaults to 30000; pass None to disable)
+        :param prewarm_models: Build the response validators of all operations now instead
+            of on first use, moving that one-off cost out of the first requests
+        :param response_cache: Persistent cache for the responses of read-only metadata
+            operations (see `dateno.utils.ResponseCache`); disabled by default
+        :param response_memo: In-memory memo for hot read-only lookups that also coalesces
+            concurrent identical calls (see `dateno.utils.ResponseMemo`); disabled by default
+        :param connection_config: Pool limits, keepalive, HTTP/2 and pool timeout for the
+            clients the SDK creates (see `dateno.ConnectionConfig`); clients passed in as
+            `client` / `async_client` keep their own settings
+        :param rate_limiter: Client-side request rate and concurrency limits, which may be
+            shared between SDK instances (see `dateno.utils.RateLimiter`); disabled by default
+        :param backoff_coordinator: Pauses all requests to a server when one of them is
+            throttled (see `dateno.utils.BackoffCoordinator`); disabled by default
+        :param circuit_breaker: Fails fast with `errors.CircuitOpenError` for operations
+            that keep failing (see `dateno.utils.CircuitBreaker`); disabled by default
+        :param request_hedger: Re-sends slow idempotent GETs and takes the first response
+            (see `dateno.utils.RequestHedger`); disabled by default
+        :param server_router: Routes requests to the fastest healthy of several servers and
+            fails over on connection errors (see `dateno.utils.ServerRouter`); ignored when
+            `server_url` is set
+        :param compression_metrics: Collects transfer size and latency per response
+            `Content-Encoding` (see `dateno.utils.CompressionMetrics`); disabled by default
+        :param response_mode: Default result of the search operations: validated models
+            ("model"), pages whose hits are validated on access ("lazy", dataset search
+            only), parsed but unvalidated JSON ("json") or the raw body ("bytes")
         """
+        client_kwargs: Dict[str, Any] = {"follow_redirects": True}
+        if connection_config is not None:
+            client_kwargs = connection_config.client_kwargs()
+
         client_supplied = True
         if client is None:
-            client = httpx.Client(follow_redirects=True)
+            client = httpx.Client(**client_kwargs)
             client_supplied = False
 
         assert issubclass(
@@ -100,7 +182,7 @@ class SDK(BaseSDK):
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient(follow_redirects=True)
+            async_client = httpx.AsyncClient(**client_kwargs)
             async_client_supplied = False
 
         if debug_logger is None:
@@ -121,6 +203,11 @@ class SDK(BaseSDK):
             if url_params is not None:
                 server_url = utils.template_url(server_url, url_params)
 
+        response_mode = resolve_response_mode(None, response_mode)
+
+        if prewarm_models:
+            _prewarm_models()
+
         BaseSDK.__init__(
             self,
             SDKConfiguration(
@@ -134,6 +221,16 @@ class SDK(BaseSDK):
                 retry_config=retry_config,
                 timeout_ms=timeout_ms,
                 debug_logger=debug_logger,
+                response_cache=response_cache,
+                response_memo=response_memo,
+                connection_config=connection_config,
+                rate_limiter=rate_limiter,
+                backoff_coordinator=backoff_coordinator,
+                circuit_breaker=circuit_breaker,
+                request_hedger=request_hedger,
+                server_router=server_router,
+                compression_metrics=compression_metrics,
+                response_mode=response_mode,
             ),
             parent_ref=self,
         )
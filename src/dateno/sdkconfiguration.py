@@ -6,13 +6,24 @@ from ._version import (
     __user_agent__,
     __version__,
 )
-from .httpclient import AsyncHttpClient, HttpClient
+from .httpclient import AsyncHttpClient, ConnectionConfig, HttpClient
 from .utils import Logger, RetryConfig, remove_suffix
+from .utils.rawresponse import ResponseMode
 from dataclasses import dataclass
 from . import models
 from .types import OptionalNullable, UNSET
 from pydantic import Field
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, TYPE_CHECKING, Tuple, Union
+
+if TYPE_CHECKING:
+    from .utils.backoff import BackoffCoordinator
+    from .utils.circuitbreaker import CircuitBreaker
+    from .utils.compression import CompressionMetrics
+    from .utils.hedging import RequestHedger
+    from .utils.httpcache import ResponseCache
+    from .utils.memo import ResponseMemo
+    from .utils.ratelimit import RateLimiter
+    from .utils.routing import ServerRouter
 
 
 SERVERS = [
@@ -41,10 +52,22 @@ class SDKConfiguration:
     user_agent: str = __user_agent__
     retry_config: OptionalNullable[RetryConfig] = Field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = DEFAULT_TIMEOUT_MS
+    response_cache: Optional["ResponseCache"] = None
+    response_memo: Optional["ResponseMemo"] = None
+    connection_config: Optional[ConnectionConfig] = None
+    rate_limiter: Optional["RateLimiter"] = None
+    backoff_coordinator: Optional["BackoffCoordinator"] = None
+    circuit_breaker: Optional["CircuitBreaker"] = None
+    request_hedger: Optional["RequestHedger"] = None
+    server_router: Optional["ServerRouter"] = None
+    compression_metrics: Optional["CompressionMetrics"] = None
+    response_mode: ResponseMode = "model"
 
     def get_server_details(self) -> Tuple[str, Dict[str, str]]:
         if self.server_url is not None and self.server_url:
             return remove_suffix(self.server_url, "/"), {}
+        if self.server_router is not None:
+            return self.server_router.select() or SERVERS[0], {}
         if self.server_idx is None:
             self.server_idx = 0
 
@@ -4,11 +4,114 @@ from .basesdk import BaseSDK
 from dateno import errors, models, utils
 from dateno._hooks import HookContext
 from dateno.types import OptionalNullable, UNSET
+from dateno.utils.lazyresponse import LazySearchQueryResponse
+from dateno.utils.projection import Projection, SourceProjection, coerce_projection
+from dateno.utils.rawresponse import (
+    ResponseMode,
+    projected_response,
+    raw_response,
+    resolve_response_mode,
+)
 from dateno.utils.unmarshal_json_response import unmarshal_json_response
-from typing import AsyncIterator, Iterator, List, Mapping, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+    overload,
+)
 
 ErrorData = Union[errors.ErrorResponseData, errors.HTTPValidationErrorData]
 
+# Results of the search operations per `response_mode`; the overloads narrow
+# them for literal modes. An omitted mode falls back to the SDK-level default,
+# which may be any mode, so it is typed as the full union.
+SearchResult = Union[
+    models.SearchQueryResponse, LazySearchQueryResponse, Dict[str, Any], bytes
+]
+SimilarResult = Union[models.SimilarHitsResponse, Dict[str, Any], bytes]
+
+
+SEARCH_AFTER_DEFAULT_SORT: List[Any] = [{"_score": "desc"}, {"id": "asc"}]
+"""Default sort for cursor pagination: relevance, then a unique tiebreaker."""
+
+
+def _search_page_is_empty(page: models.SearchQueryResponse) -> bool:
+    return not (getattr(page.hits, "hits", None) or [])
+
+
+def _hit_sort_value(hit: models.Hit, clause: Any) -> Any:
+    field = clause if isinstance(clause, str) else next(iter(clause))
+    if field == "_score":
+        return hit.score
+    if field == "_id":
+        return hit.id
+    if field == "_index":
+        return hit.index
+
+    value: Any = hit.source
+    if isinstance(value, dict) and field in value:
+        return value[field]
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def _search_after_body(
+    query: Optional[Dict[str, Any]],
+    post_filter: Optional[Dict[str, Any]],
+    sort: List[Any],
+    cursor: utils.SearchCursor,
+) -> models.BodySearchDatasetsDsl:
+    fields: Dict[str, Any] = {"sort": sort}
+    if query is not None:
+        fields["query"] = query
+    if post_filter is not None:
+        fields["post_filter"] = post_filter
+    if cursor.search_after is not None:
+        fields["search_after"] = cursor.search_after
+    if cursor.pit_id is not None:
+        fields["pit"] = {"id": cursor.pit_id}
+    return models.BodySearchDatasetsDsl(**fields)
+
+
+def _with_source(
+    body: Optional[models.BodySearchDatasetsDsl], projection: SourceProjection
+) -> models.BodySearchDatasetsDsl:
+    if body is None:
+        return models.BodySearchDatasetsDsl(source=projection.to_dsl())
+    return body.model_copy(update={"source": projection.to_dsl()})
+
+
+def _search_cursor_advance(sort: List[Any]):
+    def advance(
+        page: models.SearchQueryResponse, cursor: utils.SearchCursor
+    ) -> Optional[utils.SearchCursor]:
+        hits = getattr(page.hits, "hits", None) or []
+        if not hits:
+            return None
+
+        last = hits[-1]
+        # ES returns the sort values of each hit next to `_source`; fall back
+        # to reading the sort fields from the hit when the server omits them.
+        sort_values = (getattr(last, "additional_properties", None) or {}).get("sort")
+        if sort_values is None:
+            sort_values = [_hit_sort_value(last, clause) for clause in sort]
+
+        page_extra = getattr(page, "additional_properties", None) or {}
+        return utils.SearchCursor(
+            search_after=list(sort_values),
+            pit_id=page_extra.get("pit_id", cursor.pit_id),
+            fetched=cursor.fetched + len(hits),
+        )
+
+    return advance
+
 
 class SearchAPI(BaseSDK):
     r"""Endpoints for searching datasets.
@@ -215,6 +318,101 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    @overload
+    def search_datasets(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["model"],
+    ) -> models.SearchQueryResponse: ...
+
+    @overload
+    def search_datasets(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["lazy"],
+    ) -> LazySearchQueryResponse: ...
+
+    @overload
+    def search_datasets(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def search_datasets(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    def search_datasets(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult: ...
+
     def search_datasets(
         self,
         *,
@@ -229,7 +427,9 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SearchQueryResponse:
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult:
         r"""Search Datasets
 
         :param q: Free-text search query, e.g. 'Atlantic salmon'
@@ -243,6 +443,12 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param projection: `_source` fields to return per hit, as a list of dotted paths to
+            include or a `utils.SourceProjection`; hits are pruned client-side if the server
+            returns more
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), hits validated on access ("lazy"), unvalidated
+            dicts ("json") or the raw body ("bytes")
 
         Example:
             resp = sdk.search_api.search_datasets(q="environment", limit=100, offset=0)
@@ -253,6 +459,10 @@ class SearchAPI(BaseSDK):
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
+        source_projection = coerce_projection(projection)
 
         if server_url is not None:
             base_url = server_url
@@ -309,6 +519,15 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if source_projection is not None:
+                return projected_response(
+                    http_res,
+                    models.SearchQueryResponse,
+                    response_mode,
+                    source_projection,
+                )
+            if response_mode != "model":
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SearchQueryResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -333,6 +552,7 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    @overload
     async def search_datasets_async(
         self,
         *,
@@ -347,7 +567,103 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SearchQueryResponse:
+        projection: Optional[Projection] = None,
+        response_mode: Literal["model"],
+    ) -> models.SearchQueryResponse: ...
+
+    @overload
+    async def search_datasets_async(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["lazy"],
+    ) -> LazySearchQueryResponse: ...
+
+    @overload
+    async def search_datasets_async(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def search_datasets_async(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    async def search_datasets_async(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult: ...
+
+    async def search_datasets_async(
+        self,
+        *,
+        q: Optional[str] = "",
+        filters: Optional[List[str]] = None,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sort_by: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult:
         r"""Search Datasets
 
         :param q: Free-text search query, e.g. 'Atlantic salmon'
@@ -361,6 +677,12 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param projection: `_source` fields to return per hit, as a list of dotted paths to
+            include or a `utils.SourceProjection`; hits are pruned client-side if the server
+            returns more
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), hits validated on access ("lazy"), unvalidated
+            dicts ("json") or the raw body ("bytes")
 
         Example:
             resp = await sdk.search_api.search_datasets_async(
@@ -373,6 +695,10 @@ class SearchAPI(BaseSDK):
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
+        source_projection = coerce_projection(projection)
 
         if server_url is not None:
             base_url = server_url
@@ -429,6 +755,15 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if source_projection is not None:
+                return projected_response(
+                    http_res,
+                    models.SearchQueryResponse,
+                    response_mode,
+                    source_projection,
+                )
+            if response_mode != "model":
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SearchQueryResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -467,11 +802,18 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        prefetch: Optional[int] = None,
+        projection: Optional[Projection] = None,
     ) -> Iterator[models.SearchQueryResponse]:
         r"""Iterate over pages of dataset search results.
 
         This helper increments `offset` by `limit` and stops when the response
         contains no hits.
+
+        :param prefetch: Number of pages to keep in flight. When greater than 1,
+            pages after the first are requested concurrently from a thread pool
+            (bounded by `hits.total` of the first page) and still yielded in order.
+        :param projection: `_source` fields to return per hit (see `search_datasets`).
         """
         page_limit = 20 if limit is None else limit
         if page_limit <= 0:
@@ -479,6 +821,31 @@ class SearchAPI(BaseSDK):
 
         current_offset = 0 if offset is None else offset
 
+        if prefetch is not None and prefetch > 1:
+            yield from utils.prefetch_pages(
+                lambda page_offset: self.search_datasets(
+                    q=q,
+                    filters=filters,
+                    limit=page_limit,
+                    offset=page_offset,
+                    facets=facets,
+                    sort_by=sort_by,
+                    apikey=apikey,
+                    retries=retries,
+                    server_url=server_url,
+                    timeout_ms=timeout_ms,
+                    http_headers=http_headers,
+                    projection=projection,
+                    response_mode="model",
+                ),
+                start=current_offset,
+                step=page_limit,
+                window=prefetch,
+                is_empty=_search_page_is_empty,
+                get_total=utils.search_hits_total,
+            )
+            return
+
         while True:
             page = self.search_datasets(
                 q=q,
@@ -492,6 +859,8 @@ class SearchAPI(BaseSDK):
                 server_url=server_url,
                 timeout_ms=timeout_ms,
                 http_headers=http_headers,
+                projection=projection,
+                response_mode="model",
             )
 
             hits = getattr(page.hits, "hits", None) or []
@@ -515,11 +884,18 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        prefetch: Optional[int] = None,
+        projection: Optional[Projection] = None,
     ) -> AsyncIterator[models.SearchQueryResponse]:
         r"""Iterate over pages of dataset search results (async).
 
         This helper increments `offset` by `limit` and stops when the response
         contains no hits.
+
+        :param prefetch: Number of pages to keep in flight. When greater than 1,
+            pages after the first are requested concurrently as tasks (bounded by
+            `hits.total` of the first page) and still yielded in order.
+        :param projection: `_source` fields to return per hit (see `search_datasets`).
         """
         page_limit = 20 if limit is None else limit
         if page_limit <= 0:
@@ -527,6 +903,32 @@ class SearchAPI(BaseSDK):
 
         current_offset = 0 if offset is None else offset
 
+        if prefetch is not None and prefetch > 1:
+            async for prefetched_page in utils.prefetch_pages_async(
+                lambda page_offset: self.search_datasets_async(
+                    q=q,
+                    filters=filters,
+                    limit=page_limit,
+                    offset=page_offset,
+                    facets=facets,
+                    sort_by=sort_by,
+                    apikey=apikey,
+                    retries=retries,
+                    server_url=server_url,
+                    timeout_ms=timeout_ms,
+                    http_headers=http_headers,
+                    projection=projection,
+                    response_mode="model",
+                ),
+                start=current_offset,
+                step=page_limit,
+                window=prefetch,
+                is_empty=_search_page_is_empty,
+                get_total=utils.search_hits_total,
+            ):
+                yield prefetched_page
+            return
+
         while True:
             page = await self.search_datasets_async(
                 q=q,
@@ -540,6 +942,8 @@ class SearchAPI(BaseSDK):
                 server_url=server_url,
                 timeout_ms=timeout_ms,
                 http_headers=http_headers,
+                projection=projection,
+                response_mode="model",
             )
 
             hits = getattr(page.hits, "hits", None) or []
@@ -563,11 +967,17 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        prefetch: Optional[int] = None,
+        projection: Optional[Projection] = None,
     ) -> Iterator[models.Hit]:
         r"""Iterate over individual dataset hits.
 
         This helper yields each hit and transparently paginates using
         `limit`/`offset`.
+
+        :param prefetch: Number of pages to keep in flight (see
+            `iter_search_datasets`).
+        :param projection: `_source` fields to return per hit (see `search_datasets`).
         """
         for page in self.iter_search_datasets(
             q=q,
@@ -581,6 +991,8 @@ class SearchAPI(BaseSDK):
             server_url=server_url,
             timeout_ms=timeout_ms,
             http_headers=http_headers,
+            prefetch=prefetch,
+            projection=projection,
         ):
             for hit in page.hits.hits:
                 yield hit
@@ -599,11 +1011,17 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
+        prefetch: Optional[int] = None,
+        projection: Optional[Projection] = None,
     ) -> AsyncIterator[models.Hit]:
         r"""Iterate over individual dataset hits (async).
 
         This helper yields each hit and transparently paginates using
         `limit`/`offset`.
+
+        :param prefetch: Number of pages to keep in flight (see
+            `iter_search_datasets_async`).
+        :param projection: `_source` fields to return per hit (see `search_datasets`).
         """
         async for page in self.iter_search_datasets_async(
             q=q,
@@ -617,10 +1035,13 @@ class SearchAPI(BaseSDK):
             server_url=server_url,
             timeout_ms=timeout_ms,
             http_headers=http_headers,
+            prefetch=prefetch,
+            projection=projection,
         ):
             for hit in page.hits.hits:
                 yield hit
 
+    @overload
     def search_datasets_dsl(
         self,
         *,
@@ -636,7 +1057,108 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SearchQueryResponse:
+        projection: Optional[Projection] = None,
+        response_mode: Literal["model"],
+    ) -> models.SearchQueryResponse: ...
+
+    @overload
+    def search_datasets_dsl(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["lazy"],
+    ) -> LazySearchQueryResponse: ...
+
+    @overload
+    def search_datasets_dsl(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def search_datasets_dsl(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    def search_datasets_dsl(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult: ...
+
+    def search_datasets_dsl(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult:
         r"""Dataset Search Using Elastic Dsl
 
         :param limit:
@@ -649,11 +1171,21 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param projection: `_source` fields to return per hit, as a list of dotted paths to
+            include or a `utils.SourceProjection`; hits are pruned client-side if the server
+            returns more
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), hits validated on access ("lazy"), unvalidated
+            dicts ("json") or the raw body ("bytes")
         """
         base_url = None
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
+        source_projection = coerce_projection(projection)
 
         if server_url is not None:
             base_url = server_url
@@ -668,6 +1200,8 @@ class SearchAPI(BaseSDK):
             apikey=apikey,
             body=utils.get_pydantic_model(body, Optional[models.BodySearchDatasetsDsl]),
         )
+        if source_projection is not None:
+            request.body = _with_source(request.body, source_projection)
 
         req = self._build_request(
             method="POST",
@@ -716,6 +1250,15 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if source_projection is not None:
+                return projected_response(
+                    http_res,
+                    models.SearchQueryResponse,
+                    response_mode,
+                    source_projection,
+                )
+            if response_mode != "model":
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SearchQueryResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -740,6 +1283,27 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    @overload
+    async def search_datasets_dsl_async(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["model"],
+    ) -> models.SearchQueryResponse: ...
+
+    @overload
     async def search_datasets_dsl_async(
         self,
         *,
@@ -755,7 +1319,88 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SearchQueryResponse:
+        projection: Optional[Projection] = None,
+        response_mode: Literal["lazy"],
+    ) -> LazySearchQueryResponse: ...
+
+    @overload
+    async def search_datasets_dsl_async(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def search_datasets_dsl_async(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    async def search_datasets_dsl_async(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult: ...
+
+    async def search_datasets_dsl_async(
+        self,
+        *,
+        limit: Optional[int] = 20,
+        offset: Optional[int] = 0,
+        facets: Optional[bool] = True,
+        sortby: Optional[str] = "_score",
+        apikey: OptionalNullable[str] = UNSET,
+        body: Optional[
+            Union[models.BodySearchDatasetsDsl, models.BodySearchDatasetsDslTypedDict]
+        ] = None,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SearchResult:
         r"""Dataset Search Using Elastic Dsl
 
         :param limit:
@@ -768,11 +1413,21 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param projection: `_source` fields to return per hit, as a list of dotted paths to
+            include or a `utils.SourceProjection`; hits are pruned client-side if the server
+            returns more
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), hits validated on access ("lazy"), unvalidated
+            dicts ("json") or the raw body ("bytes")
         """
         base_url = None
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
+        source_projection = coerce_projection(projection)
 
         if server_url is not None:
             base_url = server_url
@@ -787,6 +1442,8 @@ class SearchAPI(BaseSDK):
             apikey=apikey,
             body=utils.get_pydantic_model(body, Optional[models.BodySearchDatasetsDsl]),
         )
+        if source_projection is not None:
+            request.body = _with_source(request.body, source_projection)
 
         req = self._build_request_async(
             method="POST",
@@ -835,6 +1492,15 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if source_projection is not None:
+                return projected_response(
+                    http_res,
+                    models.SearchQueryResponse,
+                    response_mode,
+                    source_projection,
+                )
+            if response_mode != "model":
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SearchQueryResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -859,6 +1525,121 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    def iter_search_datasets_dsl(
+        self,
+        *,
+        query: Optional[Dict[str, Any]] = None,
+        post_filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Any]] = None,
+        limit: Optional[int] = 100,
+        facets: Optional[bool] = False,
+        cursor: Optional[Union[utils.SearchCursor, str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+    ) -> utils.CursorPageIterator[models.SearchQueryResponse]:
+        r"""Iterate over pages of an Elastic DSL search using `search_after` cursors.
+
+        Unlike `iter_search_datasets`, every page is requested at offset 0 with the
+        sort values of the previous page's last hit, so the cost per page stays
+        constant and the offset result window does not apply. The returned
+        iterator exposes `cursor`; persist `cursor.to_token()` and pass it back as
+        `cursor` to resume an interrupted export.
+
+        The API cannot open a point in time, so pages are read from the live
+        index and documents indexed or removed during the export can be missed
+        or seen out of order. For a consistent snapshot, open a point in time
+        out of band and pass its id as `SearchCursor(pit_id=...)`; it is sent
+        with every page, and its keep-alive is managed by whoever opened it.
+
+        :param query: Elastic DSL query object. If omitted, match_all is used.
+        :param post_filter: Facet filters as Elastic DSL post_filter.
+        :param sort: Sort clauses ending with a unique tiebreaker field
+            (defaults to `SEARCH_AFTER_DEFAULT_SORT`).
+        :param limit: Hits per page (max 500).
+        :param facets: If true, each page includes aggregations.
+        :param cursor: `SearchCursor` or token to resume from. A cursor with a
+            caller-supplied `pit_id` searches that point in time.
+        :param apikey:
+        :param retries: Override the default retry configuration for this method
+        :param server_url: Override the default server URL for this method
+        :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
+        :param http_headers: Additional headers to set or replace on requests.
+        :param projection: `_source` fields to return per hit (see `search_datasets`).
+
+        Example:
+            pages = sdk.search_api.iter_search_datasets_dsl(
+                query={"match": {"dataset.title": "salmon"}}, limit=500
+            )
+            for page in pages:
+                store(page.hits.hits)
+                save_checkpoint(pages.cursor.to_token())
+        """
+        sort_clauses = list(sort) if sort is not None else SEARCH_AFTER_DEFAULT_SORT
+
+        def fetch(page_cursor: utils.SearchCursor) -> models.SearchQueryResponse:
+            return self.search_datasets_dsl(
+                limit=limit,
+                offset=0,
+                facets=facets,
+                apikey=apikey,
+                body=_search_after_body(query, post_filter, sort_clauses, page_cursor),
+                retries=retries,
+                server_url=server_url,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+                projection=projection,
+                response_mode="model",
+            )
+
+        return utils.CursorPageIterator(
+            fetch, _search_cursor_advance(sort_clauses), utils.SearchCursor.coerce(cursor)
+        )
+
+    def iter_search_datasets_dsl_async(
+        self,
+        *,
+        query: Optional[Dict[str, Any]] = None,
+        post_filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Any]] = None,
+        limit: Optional[int] = 100,
+        facets: Optional[bool] = False,
+        cursor: Optional[Union[utils.SearchCursor, str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        projection: Optional[Projection] = None,
+    ) -> utils.AsyncCursorPageIterator[models.SearchQueryResponse]:
+        r"""Iterate over pages of an Elastic DSL search using `search_after` cursors (async).
+
+        See `iter_search_datasets_dsl`; use with `async for`.
+        """
+        sort_clauses = list(sort) if sort is not None else SEARCH_AFTER_DEFAULT_SORT
+
+        async def fetch(page_cursor: utils.SearchCursor) -> models.SearchQueryResponse:
+            return await self.search_datasets_dsl_async(
+                limit=limit,
+                offset=0,
+                facets=facets,
+                apikey=apikey,
+                body=_search_after_body(query, post_filter, sort_clauses, page_cursor),
+                retries=retries,
+                server_url=server_url,
+                timeout_ms=timeout_ms,
+                http_headers=http_headers,
+                projection=projection,
+                response_mode="model",
+            )
+
+        return utils.AsyncCursorPageIterator(
+            fetch, _search_cursor_advance(sort_clauses), utils.SearchCursor.coerce(cursor)
+        )
+
     def list_search_facets(
         self,
         *,
@@ -1253,6 +2034,7 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    @overload
     def get_similar_datasets(
         self,
         *,
@@ -1264,7 +2046,67 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SimilarHitsResponse:
+        response_mode: Literal["model", "lazy"],
+    ) -> models.SimilarHitsResponse: ...
+
+    @overload
+    def get_similar_datasets(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def get_similar_datasets(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    def get_similar_datasets(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SimilarResult: ...
+
+    def get_similar_datasets(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SimilarResult:
         r"""Get Similar Datasets
 
         Return a list of entries similar to the selected one.
@@ -1278,6 +2120,8 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), unvalidated dicts ("json") or the raw body ("bytes")
 
         Example:
             resp = sdk.search_api.get_similar_datasets(entry_id="ENTRY_ID", limit=5)
@@ -1288,6 +2132,9 @@ class SearchAPI(BaseSDK):
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
 
         if server_url is not None:
             base_url = server_url
@@ -1341,6 +2188,8 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if response_mode in ("json", "bytes"):
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SimilarHitsResponse, http_res)
         if utils.match_response(http_res, ["400", "404"], "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -1365,6 +2214,37 @@ class SearchAPI(BaseSDK):
             "Unexpected response received", http_res, http_res_text
         )
 
+    @overload
+    async def get_similar_datasets_async(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["model", "lazy"],
+    ) -> models.SimilarHitsResponse: ...
+
+    @overload
+    async def get_similar_datasets_async(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Literal["json"],
+    ) -> Dict[str, Any]: ...
+
+    @overload
     async def get_similar_datasets_async(
         self,
         *,
@@ -1376,7 +2256,37 @@ class SearchAPI(BaseSDK):
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.SimilarHitsResponse:
+        response_mode: Literal["bytes"],
+    ) -> bytes: ...
+
+    @overload
+    async def get_similar_datasets_async(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SimilarResult: ...
+
+    async def get_similar_datasets_async(
+        self,
+        *,
+        entry_id: str,
+        limit: Optional[int] = 20,
+        fields: Optional[List[str]] = None,
+        apikey: OptionalNullable[str] = UNSET,
+        retries: OptionalNullable[utils.RetryConfig] = UNSET,
+        server_url: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        http_headers: Optional[Mapping[str, str]] = None,
+        response_mode: Optional[ResponseMode] = None,
+    ) -> SimilarResult:
         r"""Get Similar Datasets
 
         Return a list of entries similar to the selected one.
@@ -1390,6 +2300,8 @@ class SearchAPI(BaseSDK):
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
         :param http_headers: Additional headers to set or replace on requests.
+        :param response_mode: Override the default response mode of the SDK for this method:
+            validated models ("model"), unvalidated dicts ("json") or the raw body ("bytes")
 
         Example:
             resp = await sdk.search_api.get_similar_datasets_async(
@@ -1402,6 +2314,9 @@ class SearchAPI(BaseSDK):
         url_variables = None
         if timeout_ms is None:
             timeout_ms = self.sdk_configuration.timeout_ms
+        response_mode = resolve_response_mode(
+            response_mode, self.sdk_configuration.response_mode
+        )
 
         if server_url is not None:
             base_url = server_url
@@ -1455,6 +2370,8 @@ class SearchAPI(BaseSDK):
 
         response_data: Optional[ErrorData] = None
         if utils.match_response(http_res, "200", "application/json"):
+            if response_mode in ("json", "bytes"):
+                return raw_response(http_res, response_mode)
             return unmarshal_json_response(models.SimilarHitsResponse, http_res)
         if utils.match_response(http_res, ["400", "404"], "application/json"):
             response_data = unmarshal_json_response(errors.ErrorResponseData, http_res)
@@ -2337,23 +2337,23 @@ class StatisticsAPI(BaseSDK):
         )
 
         response_data: Optional[ErrorData] = None
-        if utils.match_response(http_res, "200", "application/octet-stream"):
+        if utils.match_response(http_res, ["200", "206"], "application/octet-stream"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
-        if utils.match_response(http_res, "200", "text/csv"):
+        if utils.match_response(http_res, ["200", "206"], "text/csv"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
         if utils.match_response(
             http_res,
-            "200",
+            ["200", "206"],
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         ):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
-        if utils.match_response(http_res, "200", "application/json"):
+        if utils.match_response(http_res, ["200", "206"], "application/json"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
@@ -2473,23 +2473,23 @@ class StatisticsAPI(BaseSDK):
         )
 
         response_data: Optional[ErrorData] = None
-        if utils.match_response(http_res, "200", "application/octet-stream"):
+        if utils.match_response(http_res, ["200", "206"], "application/octet-stream"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
-        if utils.match_response(http_res, "200", "text/csv"):
+        if utils.match_response(http_res, ["200", "206"], "text/csv"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
         if utils.match_response(
             http_res,
-            "200",
+            ["200", "206"],
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         ):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
-        if utils.match_response(http_res, "200", "application/json"):
+        if utils.match_response(http_res, ["200", "206"], "application/json"):
             return models.ExportTimeseriesFileResponse(
                 result=http_res, headers=utils.get_response_headers(http_res.headers)
             )
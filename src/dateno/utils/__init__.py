@@ -7,13 +7,33 @@ import sys
 
 if TYPE_CHECKING:
     from .annotations import get_discriminator
+    from .backoff import BackoffCoordinator, BackoffMetrics
+    from .circuitbreaker import CircuitBreaker, CircuitState, path_prefix_key
+    from .compression import (
+        ACCEPT_ENCODING,
+        CompressionMetrics,
+        EncodingStats,
+        supported_encodings,
+    )
+    from .hedging import DEFAULT_HEDGE_OPERATIONS, HedgeStats, RequestHedger
+    from .routing import ServerRouter, ServerState
     from .datetimes import parse_datetime
     from .enums import OpenEnumMeta
     from .headers import get_headers, get_response_headers
+    from .httpcache import (
+        CachePolicy,
+        CacheStats,
+        DEFAULT_CACHE_POLICIES,
+        ResponseCache,
+    )
+    from .memo import DEFAULT_MEMO_OPERATIONS, MemoStats, ResponseMemo
     from .metadata import (
+        clear_field_plan_cache,
         FieldMetadata,
+        FieldPlan,
         find_metadata,
         FormMetadata,
+        get_field_plan,
         HeaderMetadata,
         MultipartFormMetadata,
         PathParamMetadata,
@@ -21,13 +41,55 @@ if TYPE_CHECKING:
         RequestMetadata,
         SecurityMetadata,
     )
+    from .pagination import (
+        AsyncCursorPageIterator,
+        CursorPageIterator,
+        prefetch_pages,
+        prefetch_pages_async,
+        search_hits_total,
+        SearchCursor,
+    )
     from .queryparams import get_query_params
-    from .retries import BackoffStrategy, Retries, retry, retry_async, RetryConfig
+    from .ratelimit import RateLimit, RateLimiter
+    from .retries import (
+        BackoffStrategy,
+        parse_retry_after_header,
+        Retries,
+        RetryBudget,
+        RetryBudgetStats,
+        retry,
+        retry_async,
+        RetryConfig,
+    )
+    from .lazyresponse import LazyHitList, LazySearchQueryResponse
+    from .projection import Projection, SourceProjection
+    from .rawresponse import (
+        ResponseMode,
+        raw_aggregations,
+        raw_hit_id,
+        raw_hit_score,
+        raw_hit_source,
+        raw_hits,
+        raw_hits_total,
+    )
+    from .jsonbackend import (
+        JsonBackend,
+        available_json_backends,
+        get_json_backend,
+        json_dumps,
+        json_loads,
+        set_json_backend,
+        write_ndjson,
+    )
     from .requestbodies import serialize_request_body, SerializedRequestBody
-    from .security import get_security
+    from .security import clear_security_cache, get_security
     from .serializers import (
+        clear_serializer_cache,
+        get_marshaller,
         get_pydantic_model,
+        get_unmarshaller,
         marshal_json,
+        prewarm_serializers,
         unmarshal,
         unmarshal_json,
         serialize_decimal,
@@ -53,44 +115,112 @@ if TYPE_CHECKING:
         match_response,
         cast_partial,
     )
-    from .logger import Logger, get_body_content, get_default_logger
+    from .logger import (
+        is_debug_enabled,
+        LazyRequestBody,
+        LazyResponseBody,
+        Logger,
+        get_body_content,
+        get_default_logger,
+    )
 
 __all__ = [
+    "ACCEPT_ENCODING",
+    "AsyncCursorPageIterator",
+    "BackoffCoordinator",
+    "BackoffMetrics",
     "BackoffStrategy",
+    "CachePolicy",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitState",
+    "CompressionMetrics",
+    "DEFAULT_CACHE_POLICIES",
+    "DEFAULT_HEDGE_OPERATIONS",
+    "DEFAULT_MEMO_OPERATIONS",
+    "EncodingStats",
+    "clear_field_plan_cache",
+    "clear_security_cache",
+    "clear_serializer_cache",
+    "CursorPageIterator",
     "FieldMetadata",
+    "FieldPlan",
     "find_metadata",
     "FormMetadata",
     "generate_url",
     "get_body_content",
     "get_default_logger",
     "get_discriminator",
+    "get_field_plan",
     "parse_datetime",
     "get_global_from_env",
     "get_headers",
+    "get_marshaller",
     "get_pydantic_model",
     "get_query_params",
     "get_response_headers",
     "get_security",
+    "get_unmarshaller",
     "HeaderMetadata",
+    "HedgeStats",
+    "is_debug_enabled",
+    "LazyRequestBody",
+    "LazyResponseBody",
     "Logger",
     "marshal_json",
     "match_content_type",
     "match_status_codes",
     "match_response",
+    "MemoStats",
     "MultipartFormMetadata",
     "OpenEnumMeta",
+    "parse_retry_after_header",
     "PathParamMetadata",
+    "path_prefix_key",
+    "prefetch_pages",
+    "prefetch_pages_async",
+    "prewarm_serializers",
     "QueryParamMetadata",
+    "RateLimit",
+    "RateLimiter",
     "remove_suffix",
+    "RequestHedger",
     "Retries",
     "retry",
     "retry_async",
+    "RetryBudget",
+    "RetryBudgetStats",
     "RetryConfig",
     "RequestMetadata",
+    "ResponseCache",
+    "ResponseMemo",
+    "search_hits_total",
+    "ServerRouter",
+    "ServerState",
+    "supported_encodings",
+    "SearchCursor",
     "SecurityMetadata",
     "serialize_decimal",
     "serialize_float",
     "serialize_int",
+    "LazyHitList",
+    "LazySearchQueryResponse",
+    "Projection",
+    "SourceProjection",
+    "ResponseMode",
+    "raw_aggregations",
+    "raw_hit_id",
+    "raw_hit_score",
+    "raw_hit_source",
+    "raw_hits",
+    "raw_hits_total",
+    "JsonBackend",
+    "available_json_backends",
+    "get_json_backend",
+    "json_dumps",
+    "json_loads",
+    "set_json_backend",
+    "write_ndjson",
     "serialize_request_body",
     "SerializedRequestBody",
     "stream_to_text",
@@ -111,8 +241,33 @@ __all__ = [
 ]
 
 _dynamic_imports: dict[str, str] = {
+    "AsyncCursorPageIterator": ".pagination",
+    "BackoffCoordinator": ".backoff",
+    "BackoffMetrics": ".backoff",
+    "CircuitBreaker": ".circuitbreaker",
+    "CircuitState": ".circuitbreaker",
+    "path_prefix_key": ".circuitbreaker",
+    "ACCEPT_ENCODING": ".compression",
+    "CompressionMetrics": ".compression",
+    "EncodingStats": ".compression",
+    "supported_encodings": ".compression",
+    "DEFAULT_HEDGE_OPERATIONS": ".hedging",
+    "HedgeStats": ".hedging",
+    "RequestHedger": ".hedging",
+    "ServerRouter": ".routing",
+    "ServerState": ".routing",
     "BackoffStrategy": ".retries",
+    "CachePolicy": ".httpcache",
+    "CacheStats": ".httpcache",
+    "DEFAULT_CACHE_POLICIES": ".httpcache",
+    "DEFAULT_MEMO_OPERATIONS": ".memo",
+    "clear_serializer_cache": ".serializers",
+    "CursorPageIterator": ".pagination",
+    "clear_field_plan_cache": ".metadata",
+    "clear_security_cache": ".security",
     "FieldMetadata": ".metadata",
+    "FieldPlan": ".metadata",
+    "get_field_plan": ".metadata",
     "find_metadata": ".metadata",
     "FormMetadata": ".metadata",
     "generate_url": ".url",
@@ -122,30 +277,66 @@ _dynamic_imports: dict[str, str] = {
     "parse_datetime": ".datetimes",
     "get_global_from_env": ".values",
     "get_headers": ".headers",
+    "get_marshaller": ".serializers",
     "get_pydantic_model": ".serializers",
     "get_query_params": ".queryparams",
     "get_response_headers": ".headers",
     "get_security": ".security",
+    "get_unmarshaller": ".serializers",
     "HeaderMetadata": ".metadata",
+    "is_debug_enabled": ".logger",
+    "LazyRequestBody": ".logger",
+    "LazyResponseBody": ".logger",
     "Logger": ".logger",
     "marshal_json": ".serializers",
     "match_content_type": ".values",
     "match_status_codes": ".values",
     "match_response": ".values",
+    "MemoStats": ".memo",
     "MultipartFormMetadata": ".metadata",
     "OpenEnumMeta": ".enums",
+    "parse_retry_after_header": ".retries",
     "PathParamMetadata": ".metadata",
+    "prefetch_pages": ".pagination",
+    "prefetch_pages_async": ".pagination",
+    "prewarm_serializers": ".serializers",
     "QueryParamMetadata": ".metadata",
+    "RateLimit": ".ratelimit",
+    "RateLimiter": ".ratelimit",
     "remove_suffix": ".url",
     "Retries": ".retries",
     "retry": ".retries",
     "retry_async": ".retries",
     "RetryConfig": ".retries",
+    "RetryBudget": ".retries",
+    "RetryBudgetStats": ".retries",
     "RequestMetadata": ".metadata",
+    "ResponseCache": ".httpcache",
+    "ResponseMemo": ".memo",
+    "search_hits_total": ".pagination",
+    "SearchCursor": ".pagination",
     "SecurityMetadata": ".metadata",
     "serialize_decimal": ".serializers",
     "serialize_float": ".serializers",
     "serialize_int": ".serializers",
+    "LazyHitList": ".lazyresponse",
+    "LazySearchQueryResponse": ".lazyresponse",
+    "Projection": ".projection",
+    "SourceProjection": ".projection",
+    "ResponseMode": ".rawresponse",
+    "raw_aggregations": ".rawresponse",
+    "raw_hit_id": ".rawresponse",
+    "raw_hit_score": ".rawresponse",
+    "raw_hit_source": ".rawresponse",
+    "raw_hits": ".rawresponse",
+    "raw_hits_total": ".rawresponse",
+    "JsonBackend": ".jsonbackend",
+    "available_json_backends": ".jsonbackend",
+    "get_json_backend": ".jsonbackend",
+    "json_dumps": ".jsonbackend",
+    "json_loads": ".jsonbackend",
+    "set_json_backend": ".jsonbackend",
+    "write_ndjson": ".jsonbackend",
     "serialize_request_body": ".requestbodies",
     "SerializedRequestBody": ".requestbodies",
     "stream_to_text": ".serializers",
@@ -187,7 +378,12 @@ def __getattr__(attr_name: str) -> object:
 
     try:
         module = dynamic_import(module_name)
-        return getattr(module, attr_name)
+        result = getattr(module, attr_name)
+        # Bind it on the package: request building looks up several helpers
+        # as `utils.<name>` per call, which would otherwise re-enter the
+        # import machinery every time.
+        globals()[attr_name] = result
+        return result
     except ImportError as e:
         raise ImportError(
             f"Failed to import {attr_name} from {module_name}: {e}"
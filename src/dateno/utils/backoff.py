@@ -0,0 +1,103 @@
+"""Process-wide backoff coordination applied by `BaseSDK.do_request`."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Collection, Dict
+
+import httpx
+
+from .retries import parse_retry_after_header
+
+
+@dataclass
+class BackoffMetrics:
+    throttles: int = 0
+    """Throttle responses that started or extended a pause."""
+    held_requests: int = 0
+    """Requests that had to wait for a pause to end."""
+    held_seconds_total: float = 0.0
+    held_seconds_max: float = 0.0
+
+
+class BackoffCoordinator:
+    """Shares throttle signals between all requests to the same server.
+
+    When any response has a status in `status_codes`, every request to that
+    host waits out its `Retry-After` (or `default_pause_s` when the header is
+    missing) before being sent, so concurrent workers back off together
+    instead of each collecting its own 429. Pauses are capped at
+    `max_pause_s`. Share one instance between SDKs to coordinate them too.
+    When the SDK also has a `RateLimiter`, this is the only place
+    `Retry-After` is waited out.
+    """
+
+    def __init__(
+        self,
+        *,
+        status_codes: Collection[int] = (429, 503),
+        default_pause_s: float = 0.0,
+        max_pause_s: float = 300.0,
+    ) -> None:
+        self.status_codes = frozenset(status_codes)
+        self.default_pause_s = default_pause_s
+        self.max_pause_s = max_pause_s
+        self.metrics = BackoffMetrics()
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Hold requests to `host` for `seconds` (extends, never shortens, a pause)."""
+        seconds = min(seconds, self.max_pause_s)
+        if seconds <= 0:
+            return
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until.get(host, 0.0):
+                self._paused_until[host] = until
+                self.metrics.throttles += 1
+
+    def paused_for(self, host: str) -> float:
+        """Seconds until requests to `host` may be sent again."""
+        with self._lock:
+            return max(0.0, self._paused_until.get(host, 0.0) - time.monotonic())
+
+    def _record(self, held: float) -> None:
+        with self._lock:
+            self.metrics.held_requests += 1
+            self.metrics.held_seconds_total += held
+            self.metrics.held_seconds_max = max(self.metrics.held_seconds_max, held)
+
+    def wait(self, request: httpx.Request) -> None:
+        """Block while requests to the request's host are paused."""
+        host = request.url.host
+        delay = self.paused_for(host)
+        if delay <= 0:
+            return
+        started = time.monotonic()
+        while delay > 0:
+            time.sleep(delay)
+            # The pause may have been extended while sleeping.
+            delay = self.paused_for(host)
+        self._record(time.monotonic() - started)
+
+    async def wait_async(self, request: httpx.Request) -> None:
+        """Async counterpart of `wait`."""
+        host = request.url.host
+        delay = self.paused_for(host)
+        if delay <= 0:
+            return
+        started = time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.paused_for(host)
+        self._record(time.monotonic() - started)
+
+    def observe(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Start a pause if the `response` to `request` is a throttle signal."""
+        if response.status_code not in self.status_codes:
+            return
+        retry_after = parse_retry_after_header(response)
+        seconds = retry_after / 1000 if retry_after is not None else self.default_pause_s
+        self.pause(request.url.host, seconds)
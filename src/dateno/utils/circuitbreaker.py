@@ -0,0 +1,244 @@
+"""Per-endpoint circuit breaking applied by `BaseSDK.do_request`."""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Collection, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from ..errors.circuit_open_error import CircuitOpenError
+from ..errors.no_response_error import NoResponseError
+from ..errors.sdkerror import SDKError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CircuitKey = Callable[[str, httpx.Request], str]
+
+
+def operation_key(operation_id: str, request: httpx.Request) -> str:
+    """One circuit per `HookContext.operation_id` (the default)."""
+    return operation_id
+
+
+def path_prefix_key(segments: int = 1) -> CircuitKey:
+    """One circuit per leading URL path segment(s), e.g. `/statsdb`."""
+
+    def key(operation_id: str, request: httpx.Request) -> str:
+        parts = [p for p in request.url.path.split("/") if p][:segments]
+        return "/" + "/".join(parts)
+
+    return key
+
+
+@dataclass(frozen=True)
+class CircuitState:
+    key: str
+    state: str
+    calls: int
+    """Calls with an outcome in the current window."""
+    failures: int
+    retry_in_s: float
+    """Seconds until an open circuit lets a probe through."""
+    trips: int
+    """How often the circuit has opened since it was created."""
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.open_until = 0.0
+        self.probes = 0
+        self.trips = 0
+
+    def trim(self, now: float, window_s: float) -> None:
+        while self.outcomes and self.outcomes[0][0] <= now - window_s:
+            _, failed = self.outcomes.popleft()
+            self.failures -= failed
+
+    def clear(self) -> None:
+        self.outcomes.clear()
+        self.failures = 0
+
+
+class CircuitBreaker:
+    """Fails fast with `errors.CircuitOpenError` for endpoints that keep failing.
+
+    Each circuit (one per `operation_id` by default, see `key`) records the
+    outcome of every attempt over the last `window_s` seconds. Once at least
+    `minimum_calls` outcomes are recorded and `failure_threshold` of them are
+    failures - transport errors or a status in `failure_status_codes` - the
+    circuit opens and requests are rejected without being sent. After
+    `open_s`, up to `half_open_probes` requests are let through: a success
+    closes the circuit, a failure opens it again. Sync and async calls share
+    state, as can several SDKs using the same instance.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_s: float = 30.0,
+        open_s: float = 30.0,
+        half_open_probes: int = 1,
+        failure_status_codes: Collection[int] = (500, 502, 503, 504),
+        key: CircuitKey = operation_key,
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if minimum_calls < 1 or half_open_probes < 1:
+            raise ValueError("minimum_calls and half_open_probes must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.window_s = window_s
+        self.open_s = open_s
+        self.half_open_probes = half_open_probes
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self.key = key
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _enter(self, key: str) -> bool:
+        """Admit a request or raise; True if it is a half-open probe."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == CLOSED:
+                return False
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                if now < circuit.open_until:
+                    raise CircuitOpenError(key, circuit.open_until - now)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenError(key, 0.0)
+            circuit.probes += 1
+            return True
+
+    def _leave(self, key: str, probe: bool, failed: Optional[bool]) -> None:
+        with self._lock:
+            # setdefault: the circuit may have been reset while in flight.
+            circuit = self._circuits.setdefault(key, _Circuit())
+            now = time.monotonic()
+            if probe:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed is None or circuit.state != HALF_OPEN:
+                    return
+                if failed:
+                    self._open(circuit, now)
+                else:
+                    circuit.state = CLOSED
+                    circuit.clear()
+                return
+            if failed is None or circuit.state != CLOSED:
+                # Late results of requests admitted before the circuit opened.
+                return
+            circuit.outcomes.append((now, failed))
+            circuit.failures += failed
+            circuit.trim(now, self.window_s)
+            calls = len(circuit.outcomes)
+            if (
+                calls >= self.minimum_calls
+                and circuit.failures / calls >= self.failure_threshold
+            ):
+                self._open(circuit, now)
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = OPEN
+        circuit.open_until = now + self.open_s
+        circuit.trips += 1
+        circuit.clear()
+
+    def _failed(self, response: httpx.Response) -> bool:
+        return response.status_code in self.failure_status_codes
+
+    def call(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        func: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Run one attempt of `request` through its circuit."""
+        key = self.key(operation_id, request)
+        probe = self._enter(key)
+        failed: Optional[bool] = None
+        try:
+            res = func()
+            failed = self._failed(res)
+            return res
+        except SDKError as e:
+            failed = self._failed(e.raw_response)
+            raise
+        except (httpx.TransportError, NoResponseError):
+            failed = True
+            raise
+        finally:
+            self._leave(key, probe, failed)
+
+    async def call_async(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        func: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async counterpart of `call`."""
+        key = self.key(operation_id, request)
+        probe = self._enter(key)
+        failed: Optional[bool] = None
+        try:
+            res = await func()
+            failed = self._failed(res)
+            return res
+        except SDKError as e:
+            failed = self._failed(e.raw_response)
+            raise
+        except (httpx.TransportError, NoResponseError):
+            failed = True
+            raise
+        finally:
+            self._leave(key, probe, failed)
+
+    def state(self, key: str) -> CircuitState:
+        """Current state of the circuit for `key`."""
+        with self._lock:
+            return self._snapshot(key, self._circuits.get(key) or _Circuit())
+
+    def states(self) -> Dict[str, CircuitState]:
+        """Current state of every circuit that has seen a request."""
+        with self._lock:
+            return {
+                key: self._snapshot(key, circuit)
+                for key, circuit in self._circuits.items()
+            }
+
+    def _snapshot(self, key: str, circuit: _Circuit) -> CircuitState:
+        now = time.monotonic()
+        circuit.trim(now, self.window_s)
+        return CircuitState(
+            key=key,
+            state=circuit.state,
+            calls=len(circuit.outcomes),
+            failures=circuit.failures,
+            retry_in_s=(
+                max(0.0, circuit.open_until - now) if circuit.state == OPEN else 0.0
+            ),
+            trips=circuit.trips,
+        )
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close the circuit for `key`, or every circuit."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
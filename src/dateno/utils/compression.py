@@ -0,0 +1,126 @@
+"""Content-encoding negotiation and per-encoding transfer metrics."""
+
+import importlib.util
+import threading
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Iterator, Tuple
+
+import httpx
+
+
+def _installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(m) is not None for m in modules)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Encodings httpx can decode here, most compact first.
+
+    httpx decodes `br` with `brotli` / `brotlicffi` and `zstd` with
+    `zstandard` when they are installed (`pip install "dateno[compression]"`).
+    """
+    encodings = []
+    if _installed("zstandard"):
+        encodings.append("zstd")
+    if _installed("brotli", "brotlicffi"):
+        encodings.append("br")
+    encodings += ["gzip", "deflate"]
+    return tuple(encodings)
+
+
+ACCEPT_ENCODING = ", ".join(supported_encodings())
+"""`Accept-Encoding` sent by the SDK unless a call overrides it."""
+
+
+@dataclass
+class EncodingStats:
+    responses: int = 0
+    wire_bytes: int = 0
+    """Bytes received, before decoding."""
+    decoded_bytes: int = 0
+    """Bytes after decoding; streamed responses are not included."""
+    streamed_wire_bytes: int = 0
+    """Part of `wire_bytes` received by streamed responses (e.g. exports)."""
+    elapsed_s: float = 0.0
+    """Time from sending each request until its body was read or closed."""
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded bytes per wire byte for responses that were read in full."""
+        buffered = self.wire_bytes - self.streamed_wire_bytes
+        return self.decoded_bytes / buffered if buffered else 1.0
+
+
+class _MeteredStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        self._stream.close()
+        self._on_close()
+
+
+class _AsyncMeteredStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        self._on_close()
+
+
+class CompressionMetrics:
+    """Bytes on the wire, decoded bytes and latency per `Content-Encoding`.
+
+    Responses that are read in full are recorded when they arrive; streamed
+    responses when they are closed.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, EncodingStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, EncodingStats]:
+        with self._lock:
+            return {
+                encoding: EncodingStats(**vars(stats))
+                for encoding, stats in self._stats.items()
+            }
+
+    def _record(self, response: httpx.Response, decoded: int, streamed: bool) -> None:
+        encoding = response.headers.get("content-encoding", "identity").lower()
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except RuntimeError:
+            elapsed = 0.0
+        wire = response.num_bytes_downloaded
+        with self._lock:
+            stats = self._stats.setdefault(encoding, EncodingStats())
+            stats.responses += 1
+            stats.wire_bytes += wire
+            stats.decoded_bytes += decoded
+            stats.elapsed_s += elapsed
+            if streamed:
+                stats.streamed_wire_bytes += wire
+
+    def observe(self, response: httpx.Response) -> None:
+        if response.is_closed:
+            self._record(response, len(response.content), streamed=False)
+            return
+
+        def on_close() -> None:
+            self._record(response, 0, streamed=True)
+
+        if isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = _AsyncMeteredStream(response.stream, on_close)
+        else:
+            response.stream = _MeteredStream(response.stream, on_close)
@@ -8,11 +8,10 @@ from typing import (
 )
 from httpx import Headers
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     HeaderMetadata,
-    find_field_metadata,
+    get_field_plan,
 )
 
 from .values import _is_set, _populate_from_globals, _val_to_string
@@ -41,17 +40,13 @@ def _populate_headers(
     if not isinstance(headers_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = headers_params.__class__.model_fields
-    for name in param_fields:
+    for plan in get_field_plan(headers_params.__class__, HeaderMetadata):
+        name = plan.name
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-        f_name = field.alias if field.alias is not None else name
-
-        metadata = find_field_metadata(field, HeaderMetadata)
-        if metadata is None:
-            continue
+        f_name = plan.alias
+        metadata = plan.metadata
 
         value, global_found = _populate_from_globals(
             name, getattr(headers_params, name), HeaderMetadata, gbls
@@ -72,17 +67,10 @@ def _serialize_header(explode: bool, obj: Any) -> str:
 
     if isinstance(obj, BaseModel):
         items = []
-        obj_fields: Dict[str, FieldInfo] = obj.__class__.model_fields
-        for name in obj_fields:
-            obj_field = obj_fields[name]
-            obj_param_metadata = find_field_metadata(obj_field, HeaderMetadata)
-
-            if not obj_param_metadata:
-                continue
-
-            f_name = obj_field.alias if obj_field.alias is not None else name
+        for plan in get_field_plan(obj.__class__, HeaderMetadata):
+            f_name = plan.alias
 
-            val = getattr(obj, name)
+            val = getattr(obj, plan.name)
             if not _is_set(val):
                 continue
 
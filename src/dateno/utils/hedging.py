@@ -0,0 +1,342 @@
+"""Hedged requests for tail-latency-sensitive reads, used by `BaseSDK.do_request`."""
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Collection, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from .retries import RetryBudget
+
+DEFAULT_HEDGE_OPERATIONS = frozenset(("get_dataset_by_entry_id", "search_datasets"))
+"""Operations hedged by default, keyed on `HookContext.operation_id`."""
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    """Requests eligible for hedging."""
+    hedged: int = 0
+    """Requests for which a second request was sent."""
+    hedge_wins: int = 0
+    """Hedged requests answered first by the second request."""
+    budget_rejected: int = 0
+    """Hedges not sent because the budget was spent."""
+
+
+class _Latencies:
+    """Recent attempt durations of one operation and their cached percentile."""
+
+    def __init__(self, window: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.since_update = 0
+        self.delay: Optional[float] = None
+
+
+def _is_failure(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+class _Workers:
+    """Reusable daemon threads without an upper bound; idle ones exit after
+    `idle_s`, so steady sync traffic does not start a thread per request."""
+
+    def __init__(self, idle_s: float = 60.0) -> None:
+        self.idle_s = idle_s
+        self._idle: Deque["queue.SimpleQueue[Optional[Callable[[], None]]]"] = deque()
+        self._lock = threading.Lock()
+
+    def submit(self, job: Callable[[], None]) -> None:
+        with self._lock:
+            inbox = self._idle.pop() if self._idle else None
+        if inbox is not None:
+            inbox.put(job)
+            return
+        threading.Thread(
+            target=self._work, args=(job,), name="dateno-request", daemon=True
+        ).start()
+
+    def _work(self, job: Callable[[], None]) -> None:
+        inbox: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        next_job: Optional[Callable[[], None]] = job
+        while next_job is not None:
+            next_job()
+            with self._lock:
+                self._idle.append(inbox)
+            try:
+                next_job = inbox.get(timeout=self.idle_s)
+            except queue.Empty:
+                with self._lock:
+                    if inbox in self._idle:
+                        self._idle.remove(inbox)
+                        return
+                # A job was handed over just as the wait timed out.
+                next_job = inbox.get()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for inbox in idle:
+            inbox.put(None)
+
+
+class RequestHedger:
+    """Sends a second, identical GET when the first is slower than usual.
+
+    For the operations in `operations`, if no response has arrived after the
+    `percentile` of the operation's recent latencies (`initial_delay_s` until
+    `min_samples` have been seen), the request is sent again. The first
+    successful response wins and the other request is cancelled; a 429 or 5xx
+    response does not win, and is returned only if the other request fails
+    too. Hedges are limited by `budget`, by default 5% of the requests seen
+    over 10 seconds.
+
+    Async calls hedge with tasks. A sync call runs its request on a reused
+    worker thread so the caller can return as soon as either request answers;
+    only hedges use the pool of `max_workers` threads. `close` releases both.
+
+    The hedge is a second attempt below the retry layer, so `before_request`
+    and `after_error` hooks run once per request sent, as they do for each
+    retry; `after_success` runs once, for the winning response.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        initial_delay_s: float = 0.5,
+        min_delay_s: float = 0.01,
+        min_samples: int = 20,
+        window: int = 1000,
+        budget: Optional[RetryBudget] = None,
+        operations: Collection[str] = DEFAULT_HEDGE_OPERATIONS,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        self.percentile = percentile
+        self.initial_delay_s = initial_delay_s
+        self.min_delay_s = min_delay_s
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = (
+            budget
+            if budget is not None
+            else RetryBudget(ratio=0.05, window_s=10.0, min_retries=0)
+        )
+        self.operations = frozenset(operations)
+        self.max_workers = max_workers
+        self.stats = HedgeStats()
+        self._latencies: Dict[str, _Latencies] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._workers = _Workers()
+
+    def delay(self, operation_id: str) -> float:
+        """Seconds to wait for a response before hedging `operation_id`."""
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None or len(latencies.samples) < self.min_samples:
+                return self.initial_delay_s
+            # Sorting the window on every call would dominate fast requests.
+            if latencies.delay is None or latencies.since_update >= 16:
+                ordered = sorted(latencies.samples)
+                index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+                latencies.delay = max(self.min_delay_s, ordered[index])
+                latencies.since_update = 0
+            return latencies.delay
+
+    def _record(self, operation_id: str, elapsed: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None:
+                latencies = self._latencies[operation_id] = _Latencies(self.window)
+            latencies.samples.append(elapsed)
+            latencies.since_update += 1
+
+    def _eligible(self, operation_id: str, request: httpx.Request) -> bool:
+        if operation_id not in self.operations or request.method != "GET":
+            return False
+        with self._lock:
+            self.stats.requests += 1
+        self.budget.record_request()
+        return True
+
+    def _may_hedge(self) -> bool:
+        allowed = self.budget.try_retry()
+        with self._lock:
+            if allowed:
+                self.stats.hedged += 1
+            else:
+                self.stats.budget_rejected += 1
+        return allowed
+
+    def _won(self) -> None:
+        with self._lock:
+            self.stats.hedge_wins += 1
+
+    def _timed(
+        self, operation_id: str, func: Callable[[], httpx.Response]
+    ) -> httpx.Response:
+        started = time.monotonic()
+        res = func()
+        self._record(operation_id, time.monotonic() - started)
+        return res
+
+    async def _timed_async(
+        self, operation_id: str, func: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        started = time.monotonic()
+        res = await func()
+        self._record(operation_id, time.monotonic() - started)
+        return res
+
+    def _pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="dateno-hedge"
+                )
+            return self._executor
+
+    def _start(
+        self, operation_id: str, func: Callable[[], httpx.Response]
+    ) -> "concurrent.futures.Future[httpx.Response]":
+        # Not the hedge pool: a busy pool would delay the request itself, count
+        # that wait against the hedge delay and cap the number of concurrent
+        # sync calls at `max_workers`.
+        future: "concurrent.futures.Future[httpx.Response]" = (
+            concurrent.futures.Future()
+        )
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._timed(operation_id, func))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+
+        self._workers.submit(run)
+        return future
+
+    def call(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        func: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Run `func`, hedging it with a second call if it is slow."""
+        if not self._eligible(operation_id, request):
+            return func()
+
+        primary = self._start(operation_id, func)
+        try:
+            return primary.result(timeout=self.delay(operation_id))
+        except concurrent.futures.TimeoutError:
+            pass
+        if not self._may_hedge():
+            return primary.result()
+
+        hedge = self._pool().submit(self._timed, operation_id, func)
+        pending = {primary, hedge}
+        fallback: Optional["concurrent.futures.Future[httpx.Response]"] = None
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            winner = next((f for f in done if _succeeded(f)), None)
+            if winner is not None:
+                for loser in pending:
+                    # A running sync request cannot be interrupted; release
+                    # its connection as soon as it completes.
+                    if not loser.cancel():
+                        loser.add_done_callback(_close_result)
+                for other in done - {winner} | ({fallback} if fallback else set()):
+                    _close_result(other)
+                if winner is hedge:
+                    self._won()
+                return winner.result()
+            for future in done:
+                fallback, discarded = _prefer(fallback, future)
+                if discarded is not None:
+                    _close_result(discarded)
+        assert fallback is not None
+        return fallback.result()
+
+    async def call_async(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        func: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async counterpart of `call`."""
+        if not self._eligible(operation_id, request):
+            return await func()
+
+        primary = asyncio.ensure_future(self._timed_async(operation_id, func))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay(operation_id))
+            if done or not self._may_hedge():
+                return await primary
+
+            hedge = asyncio.ensure_future(self._timed_async(operation_id, func))
+            pending.add(hedge)
+            fallback: Optional["asyncio.Future[httpx.Response]"] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((t for t in done if _succeeded(t)), None)
+                if winner is not None:
+                    # Release responses that lost: both answered in the same
+                    # batch, or the other one failed first.
+                    for task in done - {winner} | ({fallback} if fallback else set()):
+                        if task.exception() is None:
+                            await task.result().aclose()
+                    if winner is hedge:
+                        self._won()
+                    return winner.result()
+                for task in done:
+                    fallback, discarded = _prefer(fallback, task)
+                    if discarded is not None and discarded.exception() is None:
+                        await discarded.result().aclose()
+            assert fallback is not None
+            return fallback.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        """Shut down the threads used for sync hedging."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self._workers.close()
+
+
+def _succeeded(future: Any) -> bool:
+    """Whether a done future or task holds a response that may win."""
+    return future.exception() is None and not _is_failure(future.result())
+
+
+def _prefer(current: Any, new: Any) -> Tuple[Any, Any]:
+    """Pick the fallback between two failed attempts, preferring a response
+    over an exception and otherwise the first; returns (kept, discarded)."""
+    if current is None:
+        return new, None
+    if current.exception() is not None and new.exception() is None:
+        return new, current
+    return current, new
+
+
+def _close_result(future: "concurrent.futures.Future[httpx.Response]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
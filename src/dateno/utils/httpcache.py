@@ -0,0 +1,254 @@
+"""Persistent response cache used by `BaseSDK.do_request`."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+import httpx
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How responses of one operation are cached.
+
+    A response is served from the cache for `ttl_s` seconds; afterwards it is
+    revalidated with `If-None-Match` / `If-Modified-Since` when the server
+    sent an `ETag` or `Last-Modified` header (and `revalidate` is set).
+    """
+
+    ttl_s: float = 3600.0
+    revalidate: bool = True
+
+
+DEFAULT_CACHE_POLICIES: Mapping[str, CachePolicy] = {
+    "get_catalog_by_id": CachePolicy(),
+    "get_namespace": CachePolicy(),
+    "get_namespace_table": CachePolicy(),
+    "list_export_formats": CachePolicy(ttl_s=24 * 3600.0),
+    "list_search_facets": CachePolicy(ttl_s=24 * 3600.0),
+}
+"""Operations cached by default, keyed on `HookContext.operation_id`."""
+
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Describe the original transfer, not the decoded body that is stored.
+_DROPPED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    operation_id TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class CacheLookup:
+    """State of one cacheable request between `lookup` and `update`."""
+
+    key: str
+    operation_id: str
+    policy: CachePolicy
+    fresh: Optional[httpx.Response] = None
+    stale: Optional[httpx.Response] = None
+
+
+class ResponseCache:
+    """SQLite-backed cache of successful GET responses.
+
+    Only operations listed in `policies` are cached. The total size of stored
+    bodies is kept under `max_bytes` by evicting the least recently used
+    entries. A single instance may be shared by sync and async SDK calls;
+    async calls use `lookup_async` / `update_async`, which run the SQLite
+    queries in a worker thread instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        policies: Optional[Mapping[str, CachePolicy]] = None,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        self.max_bytes = max_bytes
+        self.policies: Dict[str, CachePolicy] = dict(
+            DEFAULT_CACHE_POLICIES if policies is None else policies
+        )
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        with self._db:
+            self._db.execute(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    @staticmethod
+    def _key(request: httpx.Request) -> str:
+        # The URL carries the API key, so only its digest is stored.
+        raw = f"{request.method} {request.url}\n{request.headers.get('accept', '')}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, operation_id: str, request: httpx.Request) -> Optional[CacheLookup]:
+        """Return the cache state for `request`, or None if it is not cacheable.
+
+        A stale entry with validators adds the conditional headers to `request`.
+        """
+        policy = self.policies.get(operation_id)
+        if policy is None or request.method != "GET":
+            return None
+
+        key = self._key(request)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, body, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                with self._db:
+                    self._db.execute(
+                        "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                    )
+            if row is not None and row[3] > now:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+        entry = CacheLookup(key=key, operation_id=operation_id, policy=policy)
+        if row is None:
+            return entry
+
+        status_code, headers, body, expires_at = row
+        cached = httpx.Response(
+            status_code, headers=json.loads(headers), content=body, request=request
+        )
+        if expires_at > now:
+            entry.fresh = cached
+            return entry
+
+        if policy.revalidate:
+            etag = cached.headers.get("etag")
+            last_modified = cached.headers.get("last-modified")
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
+            if etag or last_modified:
+                entry.stale = cached
+        return entry
+
+    def update(self, entry: CacheLookup, response: httpx.Response) -> httpx.Response:
+        """Store `response`, or turn a 304 into the revalidated cached response."""
+        if response.status_code == 304 and entry.stale is not None:
+            with self._lock:
+                self.stats.revalidated += 1
+            headers = dict(entry.stale.headers)
+            for name, value in response.headers.items():
+                if name.lower() in ("etag", "last-modified", "cache-control", "expires", "date"):
+                    headers[name] = value
+            response = httpx.Response(
+                entry.stale.status_code,
+                headers=headers,
+                content=entry.stale.content,
+                request=response.request,
+            )
+        elif response.status_code != 200:
+            return response
+
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return response
+
+        self._store(entry, response)
+        return response
+
+    async def lookup_async(
+        self, operation_id: str, request: httpx.Request
+    ) -> Optional[CacheLookup]:
+        """`lookup` for async calls, with the SQLite read in a worker thread."""
+        if operation_id not in self.policies or request.method != "GET":
+            return None
+        return await asyncio.to_thread(self.lookup, operation_id, request)
+
+    async def update_async(
+        self, entry: CacheLookup, response: httpx.Response
+    ) -> httpx.Response:
+        """`update` for async calls, with the SQLite write in a worker thread."""
+        if response.status_code not in (200, 304):
+            return response
+        return await asyncio.to_thread(self.update, entry, response)
+
+    def _store(self, entry: CacheLookup, response: httpx.Response) -> None:
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS
+        }
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.operation_id,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    now + entry.policy.ttl_s,
+                    now,
+                ),
+            )
+            self.stats.stores += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.stats.evictions += 1
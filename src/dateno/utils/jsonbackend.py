@@ -0,0 +1,150 @@
+"""JSON encoding and decoding through orjson or msgspec when installed.
+
+`unmarshal_json`, `marshal_json` (request bodies such as the
+`search_datasets_dsl` query), the raw search responses and `write_ndjson` all
+go through the active backend. By default it is the first installed of
+`orjson` and `msgspec` (`pip install "dateno[json]"`), otherwise `builtin`:
+`pydantic_core.from_json` for decoding and `json.dumps` for encoding, as before.
+"""
+
+import importlib.util
+import json
+import threading
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Tuple
+
+from pydantic_core import from_json
+
+
+class JsonBackend:
+    """A pair of `loads` / `dumps` functions; `dumps` returns compact UTF-8 bytes."""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Any], Any],
+        dumps: Callable[[Any], bytes],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+
+def _builtin_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _builtin() -> JsonBackend:
+    return JsonBackend("builtin", from_json, _builtin_dumps)
+
+
+def _orjson() -> JsonBackend:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    def loads(raw: Any) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. integers beyond 64 bits; from_json raises for invalid JSON.
+            return from_json(raw)
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # Non-string keys or integers beyond 64 bits.
+            return _builtin_dumps(obj)
+
+    return JsonBackend("orjson", loads, dumps)
+
+
+def _msgspec() -> JsonBackend:
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(raw: Any) -> Any:
+        try:
+            return decoder.decode(raw)
+        except msgspec.DecodeError:
+            return from_json(raw)
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return encoder.encode(obj)
+        except TypeError:
+            return _builtin_dumps(obj)
+
+    return JsonBackend("msgspec", loads, dumps)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "builtin": _builtin,
+}
+
+_lock = threading.Lock()
+_backend: Optional[JsonBackend] = None
+
+
+def available_json_backends() -> Tuple[str, ...]:
+    """Names of the backends usable here, in order of preference."""
+    return tuple(
+        name
+        for name in _FACTORIES
+        if name == "builtin" or importlib.util.find_spec(name) is not None
+    )
+
+
+def get_json_backend() -> JsonBackend:
+    global _backend  # pylint: disable=global-statement
+    backend = _backend
+    if backend is None:
+        with _lock:
+            if _backend is None:
+                _backend = _FACTORIES[available_json_backends()[0]]()
+            backend = _backend
+    return backend
+
+
+def set_json_backend(name: Optional[str]) -> JsonBackend:
+    """Use backend `name` process-wide; `None` picks the preferred available one."""
+    global _backend  # pylint: disable=global-statement
+    if name is None:
+        name = available_json_backends()[0]
+    if name not in _FACTORIES:
+        raise ValueError(
+            f"unknown JSON backend {name!r}, expected one of {', '.join(_FACTORIES)}"
+        )
+    backend = _FACTORIES[name]()  # raises ImportError if not installed
+    with _lock:
+        _backend = backend
+    return backend
+
+
+def json_loads(raw: Any) -> Any:
+    """Parse JSON from bytes or str with the active backend."""
+    return get_json_backend().loads(raw)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode `obj` as compact UTF-8 JSON with the active backend."""
+    return get_json_backend().dumps(obj)
+
+
+def write_ndjson(fp: IO[bytes], records: Iterable[Any]) -> int:
+    """Write one JSON document per line to binary file `fp`; return the count.
+
+    Works well with `response_mode="json"`, e.g.
+    `write_ndjson(fp, utils.raw_hits(page))`.
+    """
+    dumps = get_json_backend().dumps
+    count = 0
+    for record in records:
+        fp.write(dumps(record) + b"\n")
+        count += 1
+    return count
@@ -0,0 +1,256 @@
+"""Search responses whose hits are validated on first access (`response_mode="lazy"`).
+
+The page is parsed once; `took`, `timed_out`, `_shards` and `hits.total` are
+validated immediately, each `Hit` when it is first read and the aggregations
+when they are first read. Callers that read only `hits.total` or the first few
+hits skip validating the rest. Any attribute that is not handled lazily (e.g.
+`model_dump`, on the response or on `hits`) validates the whole page into a
+`SearchQueryResponse` first.
+
+`hits.hits` is a read-only sequence: it supports indexing, slicing,
+iteration, `len`, `in`, `index`, `count`, `+` and `==` with lists, but not
+in-place changes such as `append` or `sort`; use `list(...)` for those.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+import httpx
+from pydantic import TypeAdapter
+
+from dateno import errors, models
+
+_UNREAD = object()
+
+_aggregations_adapter: TypeAdapter = TypeAdapter(Optional[Dict[str, Any]])
+_hits_adapter: TypeAdapter = TypeAdapter(List[models.Hit])
+
+
+def _validation_error(
+    http_res: httpx.Response, e: Exception
+) -> errors.ResponseValidationError:
+    return errors.ResponseValidationError(
+        "Response validation failed", http_res, e, http_res.text
+    )
+
+
+def _validate(data: Any, http_res: httpx.Response) -> models.SearchQueryResponse:
+    try:
+        return models.SearchQueryResponse.model_validate(data)
+    except Exception as e:
+        raise _validation_error(http_res, e) from e
+
+
+class LazyHitList(Sequence[models.Hit]):
+    """The hits of a page, validated into `models.Hit` one by one when read."""
+
+    __slots__ = ("_raw", "_hits", "_http_res")
+
+    def __init__(self, raw: List[Dict[str, Any]], http_res: httpx.Response) -> None:
+        self._raw = raw
+        self._hits: List[Any] = [_UNREAD] * len(raw)
+        self._http_res = http_res
+
+    def _hit(self, i: int) -> models.Hit:
+        hit = self._hits[i]
+        if hit is _UNREAD:
+            try:
+                hit = models.Hit.model_validate(self._raw[i])
+            except Exception as e:
+                raise _validation_error(self._http_res, e) from e
+            self._hits[i] = hit
+        return hit
+
+    def _validate_range(self, start: int, stop: int) -> None:
+        # One validator call for many hits costs about half as much as one
+        # call per hit. On failure `_hit` reports the offending hit instead.
+        todo = [i for i in range(start, stop) if self._hits[i] is _UNREAD]
+        if len(todo) < 2:
+            return
+        try:
+            hits = _hits_adapter.validate_python([self._raw[i] for i in todo])
+        except Exception:
+            return
+        for i, hit in zip(todo, hits):
+            self._hits[i] = hit
+
+    @overload
+    def __getitem__(self, index: int) -> models.Hit: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[models.Hit]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[models.Hit, List[models.Hit]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._raw))
+            if step == 1:
+                self._validate_range(start, stop)
+            return [self._hit(i) for i in range(start, stop, step)]
+        return self._hit(range(len(self._raw))[index])
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[models.Hit]:
+        # Validate in doubling batches: the first hit is ready after a single
+        # validation, a full pass costs about as much as eager validation.
+        start, batch = 0, 1
+        while start < len(self._raw):
+            stop = min(len(self._raw), start + batch)
+            self._validate_range(start, stop)
+            for i in range(start, stop):
+                yield self._hit(i)
+            start, batch = stop, batch * 2
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __add__(self, other: Iterable[models.Hit]) -> List[models.Hit]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[models.Hit]) -> List[models.Hit]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"LazyHitList({len(self._raw)} hits, {self.materialized} validated)"
+
+    @property
+    def materialized(self) -> int:
+        """Number of hits validated so far."""
+        return sum(1 for hit in self._hits if hit is not _UNREAD)
+
+    def raw(self, index: int) -> Dict[str, Any]:
+        """Hit `index` as parsed, without validating it."""
+        return self._raw[index]
+
+
+class LazyHits:
+    """The `hits` section: `total` and `max_score` are validated, `hits` is lazy.
+
+    Other attributes are read from the fully validated `models.Hits`.
+    """
+
+    __slots__ = ("_envelope", "_raw", "_http_res", "_full", "hits")
+
+    def __init__(
+        self,
+        envelope: models.Hits,
+        raw: Dict[str, Any],
+        http_res: httpx.Response,
+    ) -> None:
+        self._envelope = envelope
+        self._raw = raw
+        self._http_res = http_res
+        self._full: Optional[models.Hits] = None
+        self.hits = LazyHitList(raw["hits"], http_res)
+
+    @property
+    def total(self) -> models.TotalUnion:
+        return self._envelope.total
+
+    @property
+    def max_score(self) -> Optional[float]:
+        return self._envelope.max_score
+
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        return self._envelope.additional_properties
+
+    def materialize(self) -> models.Hits:
+        """The section validated in full."""
+        if self._full is None:
+            try:
+                self._full = models.Hits.model_validate(self._raw)
+            except Exception as e:
+                raise _validation_error(self._http_res, e) from e
+        return self._full
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+
+class LazySearchQueryResponse:
+    """A `SearchQueryResponse` stand-in that validates hits and aggregations on demand."""
+
+    __slots__ = ("_envelope", "_raw", "_aggregations", "_http_res", "_full", "hits")
+
+    def __init__(self, data: Any, http_res: httpx.Response) -> None:
+        hits_section = data.get("hits") if isinstance(data, dict) else None
+        raw_hits = hits_section.get("hits") if isinstance(hits_section, dict) else None
+        if not isinstance(hits_section, dict) or not isinstance(raw_hits, list):
+            # Malformed page (or not a JSON object): fail the way eager
+            # validation does.
+            self._envelope = _validate(data, http_res)
+            hits_section = dict(self._envelope.hits.model_dump(by_alias=True), hits=[])
+        else:
+            envelope = {k: v for k, v in data.items() if k != "aggregations"}
+            envelope["hits"] = dict(hits_section, hits=[])
+            self._envelope = _validate(envelope, http_res)
+
+        self._raw = data
+        self._aggregations: Any = _UNREAD
+        self._http_res = http_res
+        self._full: Optional[models.SearchQueryResponse] = None
+        self.hits = LazyHits(self._envelope.hits, hits_section, http_res)
+
+    @property
+    def took(self) -> Any:
+        return self._envelope.took
+
+    @property
+    def timed_out(self) -> Any:
+        return self._envelope.timed_out
+
+    @property
+    def shards(self) -> Any:
+        return self._envelope.shards
+
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        return self._envelope.additional_properties
+
+    @property
+    def aggregations(self) -> Any:
+        if self._aggregations is _UNREAD:
+            if "aggregations" not in self._raw:
+                self._aggregations = self._envelope.aggregations  # UNSET
+            else:
+                try:
+                    self._aggregations = _aggregations_adapter.validate_python(
+                        self._raw["aggregations"]
+                    )
+                except Exception as e:
+                    raise _validation_error(self._http_res, e) from e
+        return self._aggregations
+
+    def materialize(self) -> models.SearchQueryResponse:
+        """The page validated in full, as `search_datasets` returns it by default."""
+        if self._full is None:
+            self._full = _validate(self._raw, self._http_res)
+        return self._full
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazySearchQueryResponse(took={self.took!r}, "
+            f"total={self.hits.total!r}, hits={self.hits.hits!r})"
+        )
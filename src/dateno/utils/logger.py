@@ -1,5 +1,6 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+import logging
 import httpx
 from typing import Any, Protocol
 
@@ -13,6 +14,46 @@ class NoOpLogger:
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         pass
 
+    def isEnabledFor(self, level: int) -> bool:  # pylint: disable=invalid-name
+        return False
+
+
+def is_debug_enabled(logger: Any) -> bool:
+    """Return whether `logger` would emit debug records.
+
+    Loggers that expose `isEnabledFor` (e.g. `logging.Logger`) are asked
+    directly; any other logger is assumed to want every record.
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(logging.DEBUG))
+
+
+class LazyRequestBody:
+    """Formats a request body only when the log record is rendered."""
+
+    __slots__ = ("_req",)
+
+    def __init__(self, req: httpx.Request) -> None:
+        self._req = req
+
+    def __str__(self) -> str:
+        return get_body_content(self._req)
+
+
+class LazyResponseBody:
+    """Decodes a response body only when the log record is rendered."""
+
+    __slots__ = ("_res", "_stream")
+
+    def __init__(self, res: httpx.Response, stream: bool) -> None:
+        self._res = res
+        self._stream = stream
+
+    def __str__(self) -> str:
+        return "<streaming response>" if self._stream else self._res.text
+
 
 def get_body_content(req: httpx.Request) -> str:
     return "<streaming body>" if not hasattr(req, "_content") else str(req.content)
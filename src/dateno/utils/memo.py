@@ -0,0 +1,250 @@
+"""In-process memoization of idempotent responses used by `BaseSDK.do_request`."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+from .httpcache import _DROPPED_HEADERS
+
+DEFAULT_MEMO_OPERATIONS = frozenset(
+    (
+        "get_dataset_by_entry_id",
+        "get_raw_entry_by_id",
+        "get_timeseries",
+        "get_search_facet_values",
+    )
+)
+"""Operations memoized by default, keyed on `HookContext.operation_id`."""
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    expires_at: float
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.body, request=request
+        )
+
+
+class _Pending:
+    """A request in flight that identical calls wait for."""
+
+    def __init__(self) -> None:
+        self.entry: Optional[_Entry] = None
+        self.done = False
+        self.event = threading.Event()
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def finish(self, entry: Optional[_Entry]) -> None:
+        # Called with the memo lock held.
+        self.entry = entry
+        self.done = True
+        self.event.set()
+        for loop, fut in self.waiters:
+            loop.call_soon_threadsafe(_resolve, fut)
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class ResponseMemo:
+    """LRU memo of successful GET responses with a time-to-live.
+
+    Bounded by `max_entries` and by `max_bytes` of stored bodies. Concurrent
+    identical calls (sync or async) are coalesced: one request goes out and the
+    other callers get its response. Failed or non-200 responses are not
+    memoized; callers waiting on them send their own request.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 60.0,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        operations: Collection[str] = DEFAULT_MEMO_OPERATIONS,
+    ) -> None:
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("max_entries and max_bytes must be positive integers")
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.operations = frozenset(operations)
+        self.stats = MemoStats()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _key(self, operation_id: str, request: httpx.Request) -> Optional[Hashable]:
+        if operation_id not in self.operations or request.method != "GET":
+            return None
+        url = request.url
+        return (
+            operation_id,
+            url.scheme,
+            url.host,
+            url.port,
+            url.path,
+            tuple(sorted(url.params.multi_items())),
+            request.headers.get("accept", ""),
+        )
+
+    def _begin(self, key: Hashable) -> Tuple[Optional[_Entry], Optional[_Pending], bool]:
+        # Returns (memoized entry, pending call, whether this caller leads it).
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return entry, None, False
+                self._remove(key)
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.stats.coalesced += 1
+                return None, pending, False
+            pending = self._pending[key] = _Pending()
+            self.stats.misses += 1
+            return None, pending, True
+
+    def _finish(
+        self, key: Hashable, pending: _Pending, response: Optional[httpx.Response]
+    ) -> None:
+        entry = None
+        if response is not None and response.status_code == 200:
+            body = response.content
+            if len(body) <= self.max_bytes:
+                entry = _Entry(
+                    status_code=response.status_code,
+                    headers=[
+                        (k, v)
+                        for k, v in response.headers.multi_items()
+                        if k.lower() not in _DROPPED_HEADERS
+                    ],
+                    body=body,
+                    expires_at=time.monotonic() + self.ttl_s,
+                )
+        with self._lock:
+            self._pending.pop(key, None)
+            if entry is not None:
+                self._remove(key)
+                self._entries[key] = entry
+                self._bytes += len(entry.body)
+                self._evict()
+            pending.finish(entry)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= len(entry.body)
+            self.stats.evictions += 1
+
+    def fetch(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Return the memoized response for `request` or obtain it with `send`."""
+        key = self._key(operation_id, request)
+        if key is None:
+            return send()
+
+        entry, pending, leader = self._begin(key)
+        if entry is not None:
+            return entry.to_response(request)
+        assert pending is not None
+        if not leader:
+            pending.event.wait()
+            if pending.entry is not None:
+                return pending.entry.to_response(request)
+            return send()
+
+        response = None
+        try:
+            response = send()
+        finally:
+            self._finish(key, pending, response)
+        return response
+
+    async def fetch_async(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async counterpart of `fetch`."""
+        key = self._key(operation_id, request)
+        if key is None:
+            return await send()
+
+        entry, pending, leader = self._begin(key)
+        if entry is not None:
+            return entry.to_response(request)
+        assert pending is not None
+        if not leader:
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            with self._lock:
+                if pending.done:
+                    fut.set_result(None)
+                else:
+                    pending.waiters.append((loop, fut))
+            await fut
+            if pending.entry is not None:
+                return pending.entry.to_response(request)
+            return await send()
+
+        response = None
+        try:
+            response = await send()
+        finally:
+            self._finish(key, pending, response)
+        return response
@@ -1,6 +1,7 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
-from typing import Optional, Type, TypeVar, Union
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_type_hints
 from dataclasses import dataclass
 from pydantic.fields import FieldInfo
 
@@ -116,3 +117,65 @@ def find_metadata(field_info: FieldInfo, metadata_type: Type[T]) -> Optional[T]:
             return md
 
     return None
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """A model field carrying metadata of one kind, resolved ahead of time."""
+
+    name: str
+    alias: str
+    metadata: Any
+    type_hint: Any
+
+
+# Plans are keyed by (model class, metadata type) and built once per process,
+# so that building a request does not reflect over the model on every call.
+_field_plans: Dict[Tuple[type, type], Tuple[FieldPlan, ...]] = {}
+_field_plans_lock = threading.Lock()
+
+
+def _build_field_plan(cls: type, metadata_type: type) -> Tuple[FieldPlan, ...]:
+    found: List[Tuple[str, Any, Any]] = []
+    for name, field in cls.model_fields.items():  # type: ignore[attr-defined]
+        metadata = find_field_metadata(field, metadata_type)
+        if metadata is None:
+            continue
+        found.append((name, field, metadata))
+
+    # Type hints are only needed to serialize fields, and are costly to resolve.
+    hints: Dict[str, Any] = {}
+    if any(getattr(md, "serialization", None) is not None for _, _, md in found):
+        hints = get_type_hints(cls)
+
+    return tuple(
+        FieldPlan(
+            name=name,
+            alias=field.alias if field.alias is not None else name,
+            metadata=metadata,
+            type_hint=hints.get(name),
+        )
+        for name, field, metadata in found
+    )
+
+
+def get_field_plan(cls: type, metadata_type: Type[T]) -> Tuple[FieldPlan, ...]:
+    """Return the cached fields of model `cls` that carry `metadata_type`."""
+    key = (cls, metadata_type)
+    plan = _field_plans.get(key)
+    if plan is not None:
+        return plan
+
+    with _field_plans_lock:
+        plan = _field_plans.get(key)
+        if plan is None:
+            plan = _build_field_plan(cls, metadata_type)
+            _field_plans[key] = plan
+
+    return plan
+
+
+def clear_field_plan_cache() -> None:
+    """Drop all cached field plans (mainly useful in tests and benchmarks)."""
+    with _field_plans_lock:
+        _field_plans.clear()
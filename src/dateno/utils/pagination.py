@@ -0,0 +1,253 @@
+"""Helpers shared by the pagination methods of the API classes."""
+
+import asyncio
+import base64
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+
+def search_hits_total(page: Any) -> Optional[int]:
+    """Return the exact `hits.total` of a search page, if the server reported one.
+
+    `hits.total` may be an int, a `Total` model or a plain dict. A total with
+    relation `gte` is only a lower bound, so `None` is returned for it.
+    """
+    total = getattr(getattr(page, "hits", None), "total", None)
+    if isinstance(total, int):
+        return total
+    if isinstance(total, dict):
+        value, relation = total.get("value"), total.get("relation", "eq")
+    else:
+        value = getattr(total, "value", None)
+        relation = getattr(total, "relation", "eq")
+    if not isinstance(value, int) or relation != "eq":
+        return None
+    return value
+
+
+def _next_offsets(start: int, step: int, total: Optional[int]) -> Iterator[int]:
+    offset = start
+    while total is None or offset < total:
+        yield offset
+        offset += step
+
+
+def prefetch_pages(
+    fetch: Callable[[int], T],
+    *,
+    start: int,
+    step: int,
+    window: int,
+    is_empty: Callable[[T], bool],
+    get_total: Callable[[T], Optional[int]],
+) -> Iterator[T]:
+    """Yield pages in offset order while keeping up to `window` requests in flight.
+
+    The first page is fetched on its own; its total (when known) bounds the
+    offsets that are scheduled afterwards. Iteration stops at the first empty
+    page; the first error is re-raised once all earlier pages were yielded.
+    Pending requests are cancelled when iteration stops or is abandoned.
+    """
+    first = fetch(start)
+    if is_empty(first):
+        return
+    yield first
+
+    offsets = _next_offsets(start + step, step, get_total(first))
+    executor = ThreadPoolExecutor(max_workers=window)
+    pending: Deque[Future] = deque()
+    try:
+        for offset in offsets:
+            pending.append(executor.submit(fetch, offset))
+            if len(pending) >= window:
+                break
+
+        while pending:
+            page = pending.popleft().result()
+            if is_empty(page):
+                return
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(executor.submit(fetch, next_offset))
+            yield page
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def prefetch_pages_async(
+    fetch: Callable[[int], Awaitable[T]],
+    *,
+    start: int,
+    step: int,
+    window: int,
+    is_empty: Callable[[T], bool],
+    get_total: Callable[[T], Optional[int]],
+) -> AsyncIterator[T]:
+    """Async counterpart of `prefetch_pages` that runs the requests as tasks."""
+    first = await fetch(start)
+    if is_empty(first):
+        return
+    yield first
+
+    offsets = _next_offsets(start + step, step, get_total(first))
+    pending: Deque[asyncio.Task] = deque()
+    try:
+        for offset in offsets:
+            pending.append(asyncio.ensure_future(fetch(offset)))
+            if len(pending) >= window:
+                break
+
+        while pending:
+            page = await pending.popleft()
+            if is_empty(page):
+                return
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(asyncio.ensure_future(fetch(next_offset)))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+@dataclass
+class SearchCursor:
+    """Position of a `search_after` pagination, resumable across processes.
+
+    `search_after` holds the sort values of the last hit already returned,
+    `pit_id` the point in time being searched (if any) and `fetched` the
+    number of hits returned so far.
+    """
+
+    search_after: Optional[List[Any]] = None
+    pit_id: Optional[str] = None
+    fetched: int = 0
+
+    def to_token(self) -> str:
+        """Encode the cursor as an opaque, URL-safe string."""
+        payload = {
+            "v": 1,
+            "search_after": self.search_after,
+            "pit_id": self.pit_id,
+            "fetched": self.fetched,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def from_token(cls, token: str) -> "SearchCursor":
+        """Decode a cursor produced by `to_token`."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        except (ValueError, UnicodeError) as e:
+            raise ValueError("invalid search cursor token") from e
+        if not isinstance(payload, dict) or payload.get("v") != 1:
+            raise ValueError("invalid search cursor token")
+        return cls(
+            search_after=payload.get("search_after"),
+            pit_id=payload.get("pit_id"),
+            fetched=int(payload.get("fetched") or 0),
+        )
+
+    @classmethod
+    def coerce(cls, cursor: Union["SearchCursor", str, None]) -> "SearchCursor":
+        if cursor is None:
+            return cls()
+        if isinstance(cursor, str):
+            return cls.from_token(cursor)
+        return cursor
+
+
+def _check_cursor_advanced(previous: SearchCursor, current: SearchCursor) -> None:
+    if previous.search_after is not None and (
+        previous.search_after == current.search_after
+    ):
+        raise RuntimeError(
+            "search_after cursor did not advance; the server may not support "
+            "cursor pagination for this query"
+        )
+
+
+class CursorPageIterator(Generic[T]):
+    """Iterates over cursor-paginated pages.
+
+    After each page is returned, `cursor` points past it, so
+    `cursor.to_token()` can be persisted to resume the iteration later.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[SearchCursor], T],
+        advance: Callable[[T, SearchCursor], Optional[SearchCursor]],
+        cursor: SearchCursor,
+    ) -> None:
+        self._fetch = fetch
+        self._advance = advance
+        self._done = False
+        self.cursor = cursor
+
+    def __iter__(self) -> "CursorPageIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+        page = self._fetch(self.cursor)
+        next_cursor = self._advance(page, self.cursor)
+        if next_cursor is None:
+            self._done = True
+            raise StopIteration
+        _check_cursor_advanced(self.cursor, next_cursor)
+        self.cursor = next_cursor
+        return page
+
+
+class AsyncCursorPageIterator(Generic[T]):
+    """Async counterpart of `CursorPageIterator`."""
+
+    def __init__(
+        self,
+        fetch: Callable[[SearchCursor], Awaitable[T]],
+        advance: Callable[[T, SearchCursor], Optional[SearchCursor]],
+        cursor: SearchCursor,
+    ) -> None:
+        self._fetch = fetch
+        self._advance = advance
+        self._done = False
+        self.cursor = cursor
+
+    def __aiter__(self) -> "AsyncCursorPageIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        if self._done:
+            raise StopAsyncIteration
+        page = await self._fetch(self.cursor)
+        next_cursor = self._advance(page, self.cursor)
+        if next_cursor is None:
+            self._done = True
+            raise StopAsyncIteration
+        _check_cursor_advanced(self.cursor, next_cursor)
+        self.cursor = next_cursor
+        return page
@@ -0,0 +1,180 @@
+"""`_source` projection for search hits.
+
+A projection names the `_source` fields to keep (`includes`) and / or drop
+(`excludes`) as dotted paths, e.g. `dataset.title`; a `*` inside a path
+segment is a wildcard and a path also selects everything below it. Arrays of
+objects are traversed transparently, as in Elasticsearch.
+
+`search_datasets_dsl` sends the projection as the `_source` of the request so
+the server can drop the fields; it and `search_datasets` also prune the hits
+client-side, before model validation, for servers that ignore it.
+"""
+
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+_MISSING = object()
+
+
+class _Node:
+    """A compiled set of paths; `terminal` selects the whole subtree."""
+
+    __slots__ = ("terminal", "exact", "wild")
+
+    def __init__(self) -> None:
+        self.terminal = False
+        self.exact: Dict[str, "_Node"] = {}
+        self.wild: List[Tuple[str, "_Node"]] = []
+
+
+def _compile(paths: Sequence[str]) -> _Node:
+    root = _Node()
+    for path in paths:
+        node = root
+        for segment in path.split("."):
+            if "*" in segment:
+                child = next((c for s, c in node.wild if s == segment), None)
+                if child is None:
+                    child = _Node()
+                    node.wild.append((segment, child))
+            else:
+                child = node.exact.setdefault(segment, _Node())
+            node = child
+        node.terminal = True
+    return root
+
+
+def _merge(nodes: List[_Node]) -> _Node:
+    merged = _Node()
+    merged.terminal = any(n.terminal for n in nodes)
+    for node in nodes:
+        for key, child in node.exact.items():
+            other = merged.exact.get(key)
+            merged.exact[key] = child if other is None else _merge([other, child])
+        merged.wild.extend(node.wild)
+    return merged
+
+
+def _child(node: _Node, key: str) -> Optional[_Node]:
+    matched = [c for s, c in node.wild if fnmatchcase(key, s)]
+    exact = node.exact.get(key)
+    if exact is not None:
+        matched.append(exact)
+    if not matched:
+        return None
+    return matched[0] if len(matched) == 1 else _merge(matched)
+
+
+# Without wildcards only the projected keys are visited, so the cost of a
+# projection does not depend on the size of the documents.
+def _include(value: Any, node: _Node) -> Any:
+    if node.terminal:
+        return value
+    if isinstance(value, list):
+        kept = (_include(item, node) for item in value)
+        return [item for item in kept if item is not _MISSING]
+    if not isinstance(value, dict):
+        return _MISSING
+    out = {}
+    if node.wild:
+        for key, item in value.items():
+            child = _child(node, key)
+            if child is not None:
+                item = _include(item, child)
+                if item is not _MISSING:
+                    out[key] = item
+    else:
+        for key, child in node.exact.items():
+            if key in value:
+                item = _include(value[key], child)
+                if item is not _MISSING:
+                    out[key] = item
+    return out
+
+
+def _exclude(value: Any, node: _Node) -> Any:
+    if node.terminal:
+        return _MISSING
+    if isinstance(value, list):
+        kept = (_exclude(item, node) for item in value)
+        return [item for item in kept if item is not _MISSING]
+    if not isinstance(value, dict):
+        return value
+    if node.wild:
+        out = {}
+        for key, item in value.items():
+            child = _child(node, key)
+            if child is not None:
+                item = _exclude(item, child)
+                if item is _MISSING:
+                    continue
+            out[key] = item
+        return out
+    out = dict(value)
+    for key, child in node.exact.items():
+        if key in out:
+            item = _exclude(out[key], child)
+            if item is _MISSING:
+                del out[key]
+            else:
+                out[key] = item
+    return out
+
+
+@dataclass(frozen=True)
+class SourceProjection:
+    includes: Tuple[str, ...] = ()
+    """Fields to keep; all fields when empty."""
+    excludes: Tuple[str, ...] = ()
+    """Fields to drop, applied after `includes`."""
+    _include: _Node = field(init=False, repr=False, compare=False)
+    _exclude: _Node = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Accept lists for convenience while staying hashable.
+        object.__setattr__(self, "includes", tuple(self.includes))
+        object.__setattr__(self, "excludes", tuple(self.excludes))
+        object.__setattr__(self, "_include", _compile(self.includes))
+        object.__setattr__(self, "_exclude", _compile(self.excludes))
+
+    @classmethod
+    def coerce(cls, value: "Projection") -> "SourceProjection":
+        """A projection from a `SourceProjection` or a sequence of includes."""
+        if isinstance(value, SourceProjection):
+            return value
+        if isinstance(value, str):
+            return cls(includes=(value,))
+        return cls(includes=tuple(value))
+
+    def to_dsl(self) -> Dict[str, List[str]]:
+        """The projection as an Elasticsearch `_source` filter."""
+        dsl: Dict[str, List[str]] = {}
+        if self.includes:
+            dsl["includes"] = list(self.includes)
+        if self.excludes:
+            dsl["excludes"] = list(self.excludes)
+        return dsl
+
+    def prune(self, source: Mapping[str, Any]) -> Dict[str, Any]:
+        """A copy of the `_source` document `source` with only projected fields."""
+        out: Any = _include(source, self._include) if self.includes else dict(source)
+        if self.excludes:
+            out = _exclude(out, self._exclude)
+        return out
+
+    def prune_hits(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Prune `_source` of every hit of a parsed search response in place."""
+        for hit in (response.get("hits") or {}).get("hits") or []:
+            source = hit.get("_source")
+            if isinstance(source, dict):
+                hit["_source"] = self.prune(source)
+        return response
+
+
+Projection = Union[SourceProjection, Sequence[str]]
+"""A `SourceProjection` or the `_source` fields to include."""
+
+
+def coerce_projection(value: Optional[Projection]) -> Optional[SourceProjection]:
+    return None if value is None else SourceProjection.coerce(value)
@@ -3,17 +3,15 @@
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
 )
 
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     QueryParamMetadata,
-    find_field_metadata,
+    get_field_plan,
 )
 from .values import (
     _get_serialized_params,
@@ -50,17 +48,12 @@ def _populate_query_params(
     if not isinstance(query_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = query_params.__class__.model_fields
-    param_field_types = get_type_hints(query_params.__class__)
-    for name in param_fields:
+    for plan in get_field_plan(query_params.__class__, QueryParamMetadata):
+        name = plan.name
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-
-        metadata = find_field_metadata(field, QueryParamMetadata)
-        if not metadata:
-            continue
+        metadata = plan.metadata
 
         value = getattr(query_params, name) if _is_set(query_params) else None
 
@@ -70,11 +63,12 @@ def _populate_query_params(
         if global_found:
             globals_already_populated.append(name)
 
-        f_name = field.alias if field.alias is not None else name
+        f_name = plan.alias
 
-        allow_empty_set = set(allow_empty_value or [])
-        should_include_empty = f_name in allow_empty_set and (
-            value is None or value == [] or value == ""
+        should_include_empty = (
+            allow_empty_value is not None
+            and f_name in allow_empty_value
+            and (value is None or value == [] or value == "")
         )
 
         if should_include_empty:
@@ -84,7 +78,7 @@ def _populate_query_params(
         serialization = metadata.serialization
         if serialization is not None:
             serialized_parms = _get_serialized_params(
-                metadata, f_name, value, param_field_types[name]
+                metadata, f_name, value, plan.type_hint
             )
             for key, value in serialized_parms.items():
                 if key in query_param_values:
@@ -133,17 +127,9 @@ def _populate_deep_object_query_params_basemodel(
     if not _is_set(obj) or not isinstance(obj, BaseModel):
         return
 
-    obj_fields: Dict[str, FieldInfo] = obj.__class__.model_fields
-    for name in obj_fields:
-        obj_field = obj_fields[name]
-
-        f_name = obj_field.alias if obj_field.alias is not None else name
-
-        params_key = f"{prior_params_key}[{f_name}]"
-
-        obj_param_metadata = find_field_metadata(obj_field, QueryParamMetadata)
-        if not _is_set(obj_param_metadata):
-            continue
+    for plan in get_field_plan(obj.__class__, QueryParamMetadata):
+        name = plan.name
+        params_key = f"{prior_params_key}[{plan.alias}]"
 
         obj_val = getattr(obj, name)
         if not _is_set(obj_val):
@@ -0,0 +1,223 @@
+"""Client-side rate limiting applied by `BaseSDK.do_request`."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+import httpx
+
+from .retries import parse_retry_after_header
+
+_REMAINING_HEADERS = ("ratelimit-remaining", "x-ratelimit-remaining")
+_RESET_HEADERS = ("ratelimit-reset", "x-ratelimit-reset")
+
+# Reset values above this are epoch timestamps rather than delays in seconds.
+_EPOCH_THRESHOLD = 10**9
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """`rate` requests per second with bursts of up to `burst` (default: one
+    second's worth), and at most `max_concurrency` requests in flight."""
+
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    max_concurrency: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.max_concurrency is not None and self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+
+
+_Waiter = Union[threading.Event, Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+
+
+class _Bucket:
+    """Token bucket plus concurrency gate; all state is guarded by `lock`."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self.capacity = float(
+            limit.burst if limit.burst is not None else max(1.0, limit.rate or 1.0)
+        )
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self.waiters: Deque[_Waiter] = deque()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before sending."""
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.paused_until - now)
+            rate = self.limit.rate
+            if rate is None:
+                return wait
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations.
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / rate)
+            return wait
+
+    def try_enter(self, waiter: _Waiter) -> bool:
+        with self.lock:
+            limit = self.limit.max_concurrency
+            if limit is None or (self.in_flight < limit and not self.waiters):
+                self.in_flight += 1
+                return True
+            self.waiters.append(waiter)
+            return False
+
+    def forget(self, waiter: _Waiter) -> bool:
+        """Drop a waiter that gave up; False if it had already been given the slot."""
+        with self.lock:
+            try:
+                self.waiters.remove(waiter)
+                return True
+            except ValueError:
+                return False
+
+    def leave(self) -> None:
+        with self.lock:
+            if self.waiters:
+                # The slot passes directly to the next waiter.
+                waiter = self.waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                else:
+                    loop, fut = waiter
+                    loop.call_soon_threadsafe(_resolve, fut)
+            else:
+                self.in_flight -= 1
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class RateLimiter:
+    """Proactive rate limiter shared by sync and async calls of one or more SDKs.
+
+    `global_limit` applies to every request, `per_operation` to the operations
+    named by `HookContext.operation_id`; a request must pass both. When a
+    response carries `Retry-After` (on 429/503) or reports an exhausted quota
+    through `RateLimit-Remaining: 0` / `X-RateLimit-Remaining: 0` with a reset
+    time, requests are held back until then. When the SDK also has a
+    `BackoffCoordinator`, `Retry-After` is waited out there instead, once.
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[RateLimit] = None,
+        per_operation: Optional[Mapping[str, RateLimit]] = None,
+    ) -> None:
+        self._global = _Bucket(global_limit) if global_limit is not None else None
+        self._per_operation: Dict[str, _Bucket] = {
+            op: _Bucket(limit) for op, limit in (per_operation or {}).items()
+        }
+
+    def _buckets(self, operation_id: str) -> List[_Bucket]:
+        buckets = []
+        if self._global is not None:
+            buckets.append(self._global)
+        bucket = self._per_operation.get(operation_id)
+        if bucket is not None:
+            buckets.append(bucket)
+        return buckets
+
+    def acquire(self, operation_id: str) -> None:
+        """Block until a request for `operation_id` may be sent."""
+        entered: List[_Bucket] = []
+        try:
+            for bucket in self._buckets(operation_id):
+                event = threading.Event()
+                if not bucket.try_enter(event):
+                    event.wait()
+                entered.append(bucket)
+                wait = bucket.reserve()
+                if wait > 0:
+                    time.sleep(wait)
+        except BaseException:
+            for bucket in entered:
+                bucket.leave()
+            raise
+
+    async def acquire_async(self, operation_id: str) -> None:
+        """Async counterpart of `acquire`."""
+        entered: List[_Bucket] = []
+        try:
+            for bucket in self._buckets(operation_id):
+                loop = asyncio.get_running_loop()
+                fut = loop.create_future()
+                if not bucket.try_enter((loop, fut)):
+                    try:
+                        await fut
+                    except asyncio.CancelledError:
+                        # The slot may have been handed over just before the cancel.
+                        if not bucket.forget((loop, fut)):
+                            entered.append(bucket)
+                        raise
+                entered.append(bucket)
+                wait = bucket.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+        except BaseException:
+            for bucket in entered:
+                bucket.leave()
+            raise
+
+    def release(self, operation_id: str) -> None:
+        """Mark a request acquired for `operation_id` as finished."""
+        for bucket in self._buckets(operation_id):
+            bucket.leave()
+
+    def observe(
+        self, operation_id: str, response: httpx.Response, *, retry_after: bool = True
+    ) -> None:
+        """Adapt to rate-limit information returned by the server.
+
+        With `retry_after=False` the `Retry-After` header is left to whoever
+        else waits it out (`BaseSDK` passes False when a `BackoffCoordinator`
+        is configured) and only the quota headers are honoured.
+        """
+        delay: Optional[float] = None
+        if retry_after and response.status_code in (429, 503):
+            retry_after_ms = parse_retry_after_header(response)
+            if retry_after_ms is not None:
+                delay = retry_after_ms / 1000
+        if delay is None:
+            delay = _quota_reset_delay(response.headers)
+        if not delay or delay <= 0:
+            return
+        for bucket in self._buckets(operation_id):
+            bucket.pause(delay)
+
+
+def _quota_reset_delay(headers: httpx.Headers) -> Optional[float]:
+    remaining = next((headers[h] for h in _REMAINING_HEADERS if h in headers), None)
+    reset = next((headers[h] for h in _RESET_HEADERS if h in headers), None)
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        value = float(reset)
+    except ValueError:
+        return None
+    if value > _EPOCH_THRESHOLD:
+        return value - time.time()
+    return value
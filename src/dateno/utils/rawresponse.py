@@ -0,0 +1,121 @@
+"""Unvalidated search responses (`response_mode="json"` / `"bytes"`).
+
+Validating a 500-hit page into `SearchQueryResponse` / `Hit` models costs far
+more than parsing it, which is wasted when hits are written straight to
+storage. In `"json"` mode the search operations return the parsed JSON as
+plain dicts and lists, in `"bytes"` mode the undecoded response body. Neither
+applies the normalization done by the models (e.g. the `_source.int_id`
+fallback or the primary `_source.source`). The accessors below read the common
+fields from parsed responses of `search_datasets`, `search_datasets_dsl` and
+`get_similar_datasets`.
+"""
+
+from typing import Any, Dict, List, Literal, Mapping, Optional, get_args
+
+import httpx
+
+from dateno import errors
+
+from .jsonbackend import json_loads
+from .lazyresponse import LazySearchQueryResponse
+from .projection import SourceProjection
+from .serializers import unmarshal
+
+ResponseMode = Literal["model", "lazy", "json", "bytes"]
+
+RESPONSE_MODES = get_args(ResponseMode)
+
+
+def resolve_response_mode(
+    response_mode: Optional[ResponseMode], default: ResponseMode
+) -> ResponseMode:
+    mode = default if response_mode is None else response_mode
+    if mode not in RESPONSE_MODES:
+        raise ValueError(
+            f"response_mode must be one of {', '.join(RESPONSE_MODES)}, got {mode!r}"
+        )
+    return mode
+
+
+def raw_response(http_res: httpx.Response, response_mode: ResponseMode) -> Any:
+    """The body of a successful response as bytes or parsed, unvalidated JSON.
+
+    `"lazy"` wraps the parsed JSON of a `SearchQueryResponse` page in a
+    `LazySearchQueryResponse`.
+    """
+    if response_mode == "bytes":
+        return http_res.content
+    try:
+        data = json_loads(http_res.content)
+    except ValueError as e:
+        raise errors.ResponseValidationError(
+            "Response validation failed", http_res, e, http_res.text
+        ) from e
+    if response_mode == "lazy":
+        return LazySearchQueryResponse(data, http_res)
+    return data
+
+
+def projected_response(
+    http_res: httpx.Response,
+    typ: Any,
+    response_mode: ResponseMode,
+    projection: SourceProjection,
+) -> Any:
+    """A successful search response with the `_source` of its hits pruned.
+
+    The JSON is parsed once, pruned and then validated into `typ` in `"model"`
+    mode (on access in `"lazy"` mode); `"bytes"` returns the body as received.
+    """
+    if response_mode == "bytes":
+        return http_res.content
+    data = projection.prune_hits(raw_response(http_res, "json"))
+    if response_mode == "json":
+        return data
+    if response_mode == "lazy":
+        return LazySearchQueryResponse(data, http_res)
+    try:
+        return unmarshal(data, typ)
+    except Exception as e:
+        raise errors.ResponseValidationError(
+            "Response validation failed", http_res, e, http_res.text
+        ) from e
+
+
+def _hits_section(response: Mapping[str, Any]) -> Mapping[str, Any]:
+    # `get_similar_datasets` returns the hits section itself.
+    hits = response.get("hits")
+    return hits if isinstance(hits, Mapping) else response
+
+
+def raw_hits(response: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """The hits of a parsed search response."""
+    return _hits_section(response).get("hits") or []
+
+
+def raw_hits_total(response: Mapping[str, Any]) -> Optional[int]:
+    """The exact `hits.total` of a parsed search response, like `search_hits_total`."""
+    total = _hits_section(response).get("total")
+    if isinstance(total, Mapping):
+        if total.get("relation", "eq") != "eq":
+            return None
+        total = total.get("value")
+    return total if isinstance(total, int) else None
+
+
+def raw_aggregations(response: Mapping[str, Any]) -> Dict[str, Any]:
+    """The aggregations of a parsed search response (`aggregations` or `aggs`)."""
+    return response.get("aggregations") or response.get("aggs") or {}
+
+
+def raw_hit_id(hit: Mapping[str, Any]) -> Optional[str]:
+    return hit.get("_id")
+
+
+def raw_hit_score(hit: Mapping[str, Any]) -> Optional[float]:
+    return hit.get("_score")
+
+
+def raw_hit_source(hit: Mapping[str, Any]) -> Dict[str, Any]:
+    """The `_source` document of a hit, empty if it was not returned."""
+    return hit.get("_source") or {}
@@ -2,19 +2,26 @@
 
 import asyncio
 import random
+import threading
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Awaitable, Callable, List, Optional
+from typing import Awaitable, Callable, Deque, List, Optional
 
 import httpx
 
+JITTER_STRATEGIES = ("legacy", "full", "decorrelated")
+
 
 class BackoffStrategy:
     initial_interval: int
     max_interval: int
     exponent: float
     max_elapsed_time: int
+    jitter: str
+    max_attempts: Optional[int]
 
     def __init__(
         self,
@@ -22,24 +29,104 @@ class BackoffStrategy:
         max_interval: int,
         exponent: float,
         max_elapsed_time: int,
+        jitter: str = "legacy",
+        max_attempts: Optional[int] = None,
     ):
+        """
+        Args:
+            jitter: "legacy" adds up to one second to the exponential delay,
+                "full" picks uniformly between zero and the exponential delay,
+                "decorrelated" picks between `initial_interval` and three times
+                the previous delay.
+            max_attempts: Upper bound on attempts, including the first one.
+        """
+        if jitter not in JITTER_STRATEGIES:
+            raise ValueError(f"jitter must be one of {JITTER_STRATEGIES}")
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
         self.initial_interval = initial_interval
         self.max_interval = max_interval
         self.exponent = exponent
         self.max_elapsed_time = max_elapsed_time
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+
+
+@dataclass
+class RetryBudgetStats:
+    requests: int = 0
+    retries: int = 0
+    rejected: int = 0
+    """Retries that were not attempted because the budget was spent."""
+
+
+class RetryBudget:
+    """Caps retries at `ratio` of the requests seen over the last `window_s`.
+
+    `min_retries` retries are always allowed per window so that low-traffic
+    clients can still recover from isolated failures. Share one budget between
+    SDK instances to cap their combined load on the API during an outage.
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, window_s: float = 10.0, min_retries: int = 3
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must not be negative")
+        if window_s <= 0:
+            raise ValueError("window_s must be positive")
+        self.ratio = ratio
+        self.window_s = window_s
+        self.min_retries = min_retries
+        self.stats = RetryBudgetStats()
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        horizon = now - self.window_s
+        for events in (self._requests, self._retries):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            self._requests.append(now)
+            self.stats.requests += 1
+
+    def try_retry(self) -> bool:
+        """Spend one retry from the budget; False if none is left."""
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) + 1 > allowed:
+                self.stats.rejected += 1
+                return False
+            self._retries.append(now)
+            self.stats.retries += 1
+            return True
 
 
 class RetryConfig:
     strategy: str
     backoff: BackoffStrategy
     retry_connection_errors: bool
+    budget: Optional[RetryBudget]
 
     def __init__(
-        self, strategy: str, backoff: BackoffStrategy, retry_connection_errors: bool
+        self,
+        strategy: str,
+        backoff: BackoffStrategy,
+        retry_connection_errors: bool,
+        budget: Optional[RetryBudget] = None,
     ):
         self.strategy = strategy
         self.backoff = backoff
         self.retry_connection_errors = retry_connection_errors
+        self.budget = budget
 
 
 class Retries:
@@ -57,7 +144,7 @@ class TemporaryError(Exception):
 
     def __init__(self, response: httpx.Response):
         self.response = response
-        self.retry_after = _parse_retry_after_header(response)
+        self.retry_after = parse_retry_after_header(response)
 
 
 class PermanentError(Exception):
@@ -67,8 +154,8 @@ class PermanentError(Exception):
         self.inner = inner
 
 
-def _parse_retry_after_header(response: httpx.Response) -> Optional[int]:
-    """Parse Retry-After header from response.
+def parse_retry_after_header(response: httpx.Response) -> Optional[int]:
+    """Parse the Retry-After header (delay in seconds or HTTP date) from response.
 
     Returns:
         Retry interval in milliseconds, or None if header is missing or invalid.
@@ -99,6 +186,8 @@ def _get_sleep_interval(
     max_interval: int,
     exponent: float,
     retries: int,
+    jitter: str = "legacy",
+    previous: float = 0.0,
 ) -> float:
     """Get sleep interval for retry with exponential backoff.
 
@@ -108,6 +197,8 @@ def _get_sleep_interval(
         max_interval: Maximum retry interval in milliseconds.
         exponent: Base for exponential backoff calculation.
         retries: Current retry attempt count.
+        jitter: One of `JITTER_STRATEGIES`.
+        previous: Previous sleep interval in seconds (decorrelated jitter).
 
     Returns:
         Sleep interval in seconds.
@@ -119,8 +210,15 @@ def _get_sleep_interval(
     ):
         return exception.retry_after / 1000
 
-    sleep = (initial_interval / 1000) * exponent**retries + random.uniform(0, 1)
-    return min(sleep, max_interval / 1000)
+    base = initial_interval / 1000
+    cap = max_interval / 1000
+    if jitter == "full":
+        return random.uniform(0, min(cap, base * exponent**retries))
+    if jitter == "decorrelated":
+        return min(cap, random.uniform(base, max(base, previous * 3)))
+
+    sleep = base * exponent**retries + random.uniform(0, 1)
+    return min(sleep, cap)
 
 
 def retry(func: Callable[[], httpx.Response], retries: Retries) -> httpx.Response:
@@ -167,6 +265,9 @@ def retry(func: Callable[[], httpx.Response], retries: Retries) -> httpx.Respons
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            jitter=retries.config.backoff.jitter,
+            max_attempts=retries.config.backoff.max_attempts,
+            budget=getattr(retries.config, "budget", None),
         )
 
     return func()
@@ -218,6 +319,9 @@ async def retry_async(
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            jitter=retries.config.backoff.jitter,
+            max_attempts=retries.config.backoff.max_attempts,
+            budget=getattr(retries.config, "budget", None),
         )
 
     return await func()
@@ -229,9 +333,16 @@ def retry_with_backoff(
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    *,
+    jitter: str = "legacy",
+    max_attempts: Optional[int] = None,
+    budget: Optional[RetryBudget] = None,
 ) -> httpx.Response:
-    start = round(time.time() * 1000)
+    start = round(time.monotonic() * 1000)
     retries = 0
+    sleep = 0.0
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -239,15 +350,25 @@ def retry_with_backoff(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            now = round(time.monotonic() * 1000)
+            if (
+                now - start > max_elapsed_time
+                or (max_attempts is not None and retries + 1 >= max_attempts)
+                or (budget is not None and not budget.try_retry())
+            ):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
 
             sleep = _get_sleep_interval(
-                exception, initial_interval, max_interval, exponent, retries
+                exception,
+                initial_interval,
+                max_interval,
+                exponent,
+                retries,
+                jitter=jitter,
+                previous=sleep,
             )
             time.sleep(sleep)
             retries += 1
@@ -259,9 +380,16 @@ async def retry_with_backoff_async(
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    *,
+    jitter: str = "legacy",
+    max_attempts: Optional[int] = None,
+    budget: Optional[RetryBudget] = None,
 ) -> httpx.Response:
-    start = round(time.time() * 1000)
+    start = round(time.monotonic() * 1000)
     retries = 0
+    sleep = 0.0
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -269,15 +397,25 @@ async def retry_with_backoff_async(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            now = round(time.monotonic() * 1000)
+            if (
+                now - start > max_elapsed_time
+                or (max_attempts is not None and retries + 1 >= max_attempts)
+                or (budget is not None and not budget.try_retry())
+            ):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
 
             sleep = _get_sleep_interval(
-                exception, initial_interval, max_interval, exponent, retries
+                exception,
+                initial_interval,
+                max_interval,
+                exponent,
+                retries,
+                jitter=jitter,
+                previous=sleep,
             )
             await asyncio.sleep(sleep)
             retries += 1
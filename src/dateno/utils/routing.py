@@ -0,0 +1,240 @@
+"""Latency-aware routing and failover between servers, used by `BaseSDK`."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+import httpx
+
+from .url import remove_suffix
+
+_FAILOVER_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+DEFAULT_UNROUTED_OPERATIONS = frozenset(("get_healthz",))
+"""Operations that are never failed over, so health checks hit their server."""
+
+
+@dataclass(frozen=True)
+class ServerState:
+    url: str
+    healthy: bool
+    latency_ewma_s: Optional[float]
+    """Exponentially weighted moving average of response latency."""
+    failures: int
+    """Connection failures and failed health checks since creation."""
+
+
+class _Server:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.ewma: Optional[float] = None
+        self.down_until = 0.0
+        self.failures = 0
+
+
+class ServerRouter:
+    """Routes requests to the fastest healthy server and fails over between them.
+
+    Each request goes to the healthy server with the lowest latency EWMA
+    (smoothing factor `alpha`); servers without measurements yet are tried
+    first, in list order. When a connection cannot be established, the server
+    is marked down for `down_s` seconds and the request is re-sent to the next
+    best server. Servers marked down receive traffic again once `down_s` has
+    passed, or after a successful `check_health`.
+    """
+
+    def __init__(
+        self,
+        servers: Sequence[str],
+        *,
+        alpha: float = 0.3,
+        down_s: float = 30.0,
+        unrouted_operations: Collection[str] = DEFAULT_UNROUTED_OPERATIONS,
+    ) -> None:
+        if not servers:
+            raise ValueError("at least one server is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.down_s = down_s
+        self.unrouted_operations = frozenset(unrouted_operations)
+        self._servers = [_Server(remove_suffix(url, "/")) for url in servers]
+        self._lock = threading.Lock()
+
+    @property
+    def servers(self) -> List[str]:
+        return [server.url for server in self._servers]
+
+    def select(self, exclude: Collection[str] = ()) -> Optional[str]:
+        """The server to send the next request to, or None if all are excluded."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [s for s in self._servers if s.url not in exclude]
+            if not candidates:
+                return None
+            healthy = [s for s in candidates if s.down_until <= now]
+            if not healthy:
+                # Everything is down: try the server that went down first.
+                return min(candidates, key=lambda s: s.down_until).url
+            best = min(
+                range(len(healthy)),
+                key=lambda i: (healthy[i].ewma or 0.0, i),
+            )
+            return healthy[best].url
+
+    def _find(self, url: str) -> Optional[_Server]:
+        for server in self._servers:
+            if url == server.url or url.startswith(server.url + "/"):
+                return server
+        return None
+
+    def observe(self, server_url: str, elapsed_s: float) -> None:
+        """Record the latency of a response from `server_url`."""
+        with self._lock:
+            server = self._find(server_url)
+            if server is None:
+                return
+            server.down_until = 0.0
+            if server.ewma is None:
+                server.ewma = elapsed_s
+            else:
+                server.ewma = self.alpha * elapsed_s + (1 - self.alpha) * server.ewma
+
+    def mark_down(self, server_url: str) -> None:
+        """Stop routing to `server_url` for `down_s` seconds."""
+        with self._lock:
+            server = self._find(server_url)
+            if server is not None:
+                server.down_until = time.monotonic() + self.down_s
+                server.failures += 1
+
+    def states(self) -> List[ServerState]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                ServerState(
+                    url=s.url,
+                    healthy=s.down_until <= now,
+                    latency_ewma_s=s.ewma,
+                    failures=s.failures,
+                )
+                for s in self._servers
+            ]
+
+    def _route(self, operation_id: str, request: httpx.Request) -> Optional[_Server]:
+        if operation_id in self.unrouted_operations:
+            return None
+        with self._lock:
+            return self._find(str(request.url))
+
+    def _rebase(self, request: httpx.Request, old: str, new: str) -> httpx.Request:
+        url = new + str(request.url)[len(old) :]
+        headers = [
+            (k, v) for k, v in request.headers.multi_items() if k.lower() != "host"
+        ]
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            content=request.content,
+            extensions=request.extensions,
+        )
+
+    def send(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        send: Callable[[httpx.Request], httpx.Response],
+    ) -> httpx.Response:
+        """Send `request`, failing over to other servers on connection errors."""
+        server = self._route(operation_id, request)
+        if server is None:
+            return send(request)
+        url = server.url
+        tried: List[str] = []
+        while True:
+            started = time.monotonic()
+            try:
+                res = send(request)
+            except _FAILOVER_ERRORS:
+                self.mark_down(url)
+                tried.append(url)
+                next_url = self.select(exclude=tried)
+                if next_url is None:
+                    raise
+                request = self._rebase(request, url, next_url)
+                url = next_url
+                continue
+            self.observe(url, time.monotonic() - started)
+            return res
+
+    async def send_async(
+        self,
+        operation_id: str,
+        request: httpx.Request,
+        send: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async counterpart of `send`."""
+        server = self._route(operation_id, request)
+        if server is None:
+            return await send(request)
+        url = server.url
+        tried: List[str] = []
+        while True:
+            started = time.monotonic()
+            try:
+                res = await send(request)
+            except _FAILOVER_ERRORS:
+                self.mark_down(url)
+                tried.append(url)
+                next_url = self.select(exclude=tried)
+                if next_url is None:
+                    raise
+                request = self._rebase(request, url, next_url)
+                url = next_url
+                continue
+            self.observe(url, time.monotonic() - started)
+            return res
+
+    def check_health(self, service: Any) -> Dict[str, bool]:
+        """Probe every server with `service.get_healthz` (e.g. `sdk.service`)."""
+        results = {}
+        for url in self.servers:
+            started = time.monotonic()
+            try:
+                service.get_healthz(server_url=url)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.mark_down(url)
+                results[url] = False
+            else:
+                self.observe(url, time.monotonic() - started)
+                results[url] = True
+        return results
+
+    async def check_health_async(self, service: Any) -> Dict[str, bool]:
+        """Async counterpart of `check_health`; probes all servers concurrently."""
+
+        async def probe(url: str) -> bool:
+            started = time.monotonic()
+            try:
+                await service.get_healthz_async(server_url=url)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.mark_down(url)
+                return False
+            self.observe(url, time.monotonic() - started)
+            return True
+
+        urls = self.servers
+        results = await asyncio.gather(*(probe(url) for url in urls))
+        return dict(zip(urls, results))
@@ -1,10 +1,14 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 import base64
+import threading
+from collections import OrderedDict
 from typing import (
     Any,
     Dict,
+    Hashable,
     List,
+    Optional,
     Tuple,
 )
 from pydantic import BaseModel
@@ -16,7 +20,58 @@ from .metadata import (
 )
 
 
-def get_security(security: Any) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+_SecurityParams = Tuple[Dict[str, str], Dict[str, List[str]]]
+
+# Resolved security is keyed by the security model's class and field values,
+# so a static key is resolved once and a rotated key (e.g. a callable
+# `api_key_query` returning a new value) is resolved again automatically.
+_SECURITY_CACHE_SIZE = 16
+_security_cache: "OrderedDict[Hashable, _SecurityParams]" = OrderedDict()
+_security_lock = threading.Lock()
+
+
+def _security_key(security: Any) -> Optional[Hashable]:
+    if not isinstance(security, BaseModel):
+        return None
+    key = (security.__class__, tuple(security.__dict__.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # Nested, unhashable security models are resolved on every call.
+        return None
+    return key
+
+
+def get_security(security: Any) -> _SecurityParams:
+    key = _security_key(security)
+    if key is None:
+        return _resolve_security(security)
+
+    with _security_lock:
+        cached = _security_cache.get(key)
+        if cached is not None:
+            _security_cache.move_to_end(key)
+
+    if cached is None:
+        cached = _resolve_security(security)
+        with _security_lock:
+            _security_cache[key] = cached
+            while len(_security_cache) > _SECURITY_CACHE_SIZE:
+                _security_cache.popitem(last=False)
+
+    # Copy down to the value lists so that callers (and hooks editing the
+    # request params) cannot change the cached entry.
+    headers, query_params = cached
+    return dict(headers), {k: list(v) for k, v in query_params.items()}
+
+
+def clear_security_cache() -> None:
+    """Forget all resolved security, e.g. after revoking a credential."""
+    with _security_lock:
+        _security_cache.clear()
+
+
+def _resolve_security(security: Any) -> _SecurityParams:
     headers: Dict[str, str] = {}
     query_params: Dict[str, List[str]] = {}
 
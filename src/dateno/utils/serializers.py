@@ -2,17 +2,27 @@
 
 from decimal import Decimal
 import functools
-import json
+import threading
 import typing
-from typing import Any, AsyncIterator, Dict, Iterable, List, Tuple, Union, get_args
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+)
 import typing_extensions
 from typing_extensions import get_origin
 
 import httpx
-from pydantic import ConfigDict, create_model
-from pydantic_core import from_json
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict, create_model
 
 from ..types.basemodel import BaseModel, Nullable, OptionalNullable, Unset
+from .jsonbackend import json_dumps, json_loads
 
 
 def serialize_decimal(as_str: bool):
@@ -136,16 +146,70 @@ def validate_const(v):
     return validate
 
 
+_WRAPPER_CONFIG = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+
+# Wrapper models are keyed by target type and built once per process. Building
+# them (and their core schema) is far more expensive than validating a payload,
+# so they must not be recreated for every request/response body.
+_unmarshallers: Dict[Any, Type[PydanticBaseModel]] = {}
+_marshallers: Dict[Any, Type[PydanticBaseModel]] = {}
+_wrapper_lock = threading.Lock()
+
+
+def _create_wrapper_model(name: str, typ: Any) -> Type[PydanticBaseModel]:
+    return create_model(name, body=(typ, ...), __config__=_WRAPPER_CONFIG)
+
+
+def _get_wrapper_model(
+    registry: Dict[Any, Type[PydanticBaseModel]], name: str, typ: Any
+) -> Type[PydanticBaseModel]:
+    try:
+        model = registry.get(typ)
+    except TypeError:
+        # Unhashable annotations cannot be cached; build a one-off wrapper.
+        return _create_wrapper_model(name, typ)
+
+    if model is not None:
+        return model
+
+    with _wrapper_lock:
+        model = registry.get(typ)
+        if model is None:
+            model = _create_wrapper_model(name, typ)
+            registry[typ] = model
+
+    return model
+
+
+def get_unmarshaller(typ: Any) -> Type[PydanticBaseModel]:
+    """Return the cached wrapper model used to validate values of type `typ`."""
+    return _get_wrapper_model(_unmarshallers, "Unmarshaller", typ)
+
+
+def get_marshaller(typ: Any) -> Type[PydanticBaseModel]:
+    """Return the cached wrapper model used to serialize values of type `typ`."""
+    return _get_wrapper_model(_marshallers, "Marshaller", typ)
+
+
+def prewarm_serializers(types: Iterable[Any]) -> None:
+    """Build and cache the unmarshallers for `types` ahead of the first call."""
+    for typ in types:
+        get_unmarshaller(typ)
+
+
+def clear_serializer_cache() -> None:
+    """Drop all cached wrapper models (mainly useful in tests and benchmarks)."""
+    with _wrapper_lock:
+        _unmarshallers.clear()
+        _marshallers.clear()
+
+
 def unmarshal_json(raw, typ: Any) -> Any:
-    return unmarshal(from_json(raw), typ)
+    return unmarshal(json_loads(raw), typ)
 
 
 def unmarshal(val, typ: Any) -> Any:
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
+    unmarshaller = get_unmarshaller(typ)
 
     m = unmarshaller(body=val)
 
@@ -157,11 +221,7 @@ def marshal_json(val, typ):
     if is_nullable(typ) and val is None:
         return "null"
 
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
+    marshaller = get_marshaller(typ)
 
     m = marshaller(body=val)
 
@@ -170,7 +230,7 @@ def marshal_json(val, typ):
     if len(d) == 0:
         return ""
 
-    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+    return json_dumps(d[next(iter(d))]).decode("utf-8")
 
 
 def is_nullable(field):
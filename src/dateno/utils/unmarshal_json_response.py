@@ -25,14 +25,15 @@ def unmarshal_json_response(
 def unmarshal_json_response(
     typ: Any, http_res: httpx.Response, body: Optional[str] = None
 ) -> Any:
-    if body is None:
-        body = http_res.text
+    # Parse straight from the raw bytes; the body is only decoded to `str`
+    # when it has to be attached to a validation error.
+    raw = http_res.content if body is None else body
     try:
-        return unmarshal_json(body, typ)
+        return unmarshal_json(raw, typ)
     except Exception as e:
         raise errors.ResponseValidationError(
             "Response validation failed",
             http_res,
             e,
-            body,
+            http_res.text if body is None else body,
         ) from e
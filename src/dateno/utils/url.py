@@ -4,7 +4,6 @@ from decimal import Decimal
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
     Union,
@@ -12,11 +11,10 @@ from typing import (
     get_origin,
 )
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .metadata import (
     PathParamMetadata,
-    find_field_metadata,
+    get_field_plan,
 )
 from .values import (
     _get_serialized_params,
@@ -57,17 +55,12 @@ def _populate_path_params(
     if not isinstance(path_params, BaseModel):
         return globals_already_populated
 
-    path_param_fields: Dict[str, FieldInfo] = path_params.__class__.model_fields
-    path_param_field_types = get_type_hints(path_params.__class__)
-    for name in path_param_fields:
+    for plan in get_field_plan(path_params.__class__, PathParamMetadata):
+        name = plan.name
         if name in skip_fields:
             continue
 
-        field = path_param_fields[name]
-
-        param_metadata = find_field_metadata(field, PathParamMetadata)
-        if param_metadata is None:
-            continue
+        param_metadata = plan.metadata
 
         param = getattr(path_params, name) if _is_set(path_params) else None
         param, global_found = _populate_from_globals(
@@ -79,11 +72,11 @@ def _populate_path_params(
         if not _is_set(param):
             continue
 
-        f_name = field.alias if field.alias is not None else name
+        f_name = plan.alias
         serialization = param_metadata.serialization
         if serialization is not None:
             serialized_params = _get_serialized_params(
-                param_metadata, f_name, param, path_param_field_types[name]
+                param_metadata, f_name, param, plan.type_hint
             )
             for key, value in serialized_params.items():
                 path_param_values[key] = value
@@ -106,21 +99,12 @@ def _populate_path_params(
                             pp_vals.append(f"{pp_key},{_val_to_string(param[pp_key])}")
                     path_param_values[f_name] = ",".join(pp_vals)
                 elif not isinstance(param, (str, int, float, complex, bool, Decimal)):
-                    param_fields: Dict[str, FieldInfo] = param.__class__.model_fields
-                    for name in param_fields:
-                        param_field = param_fields[name]
-
-                        param_value_metadata = find_field_metadata(
-                            param_field, PathParamMetadata
-                        )
-                        if param_value_metadata is None:
-                            continue
-
-                        param_name = (
-                            param_field.alias if param_field.alias is not None else name
-                        )
+                    for field_plan in get_field_plan(
+                        param.__class__, PathParamMetadata
+                    ):
+                        param_name = field_plan.alias
 
-                        param_field_val = getattr(param, name)
+                        param_field_val = getattr(param, field_plan.name)
                         if not _is_set(param_field_val):
                             continue
                         if param_metadata.explode:
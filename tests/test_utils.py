@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Optional
+
+import httpx
 
 import dateno.utils as utils
+from dateno import SDK
 from dateno.sdkconfiguration import SDKConfiguration
 
 
@@ -163,6 +166,46 @@ def mk_cfg(server_url: str = "https://example.invalid") -> SDKConfiguration:
     )
 
 
+def mk_mock_sdk(
+    handler: Callable[[httpx.Request], Any],
+    *,
+    async_handler: Optional[Callable[[httpx.Request], Any]] = None,
+    **kwargs: Any,
+) -> SDK:
+    """
+    Create an SDK whose HTTP clients are answered in-process by `handler`.
+
+    Unlike `mk_cfg`, the full request pipeline runs (hooks, retries, caches,
+    ...), only the network is replaced by `httpx.MockTransport`.
+
+    Args:
+        handler:
+            Called with each `httpx.Request` of the sync client (and of the
+            async client unless `async_handler` is given); returns an
+            `httpx.Response` (or an awaitable of one for async clients).
+
+        async_handler:
+            Optional separate handler for the async client.
+
+        **kwargs:
+            Passed to `SDK`; `api_key_query` defaults to "TEST_KEY",
+            `server_url` to "https://example.invalid" and `client` /
+            `async_client` to the mock clients.
+
+    Returns:
+        An SDK instance for unit testing.
+    """
+    kwargs.setdefault("api_key_query", "TEST_KEY")
+    kwargs.setdefault("server_url", "https://example.invalid")
+    if "client" not in kwargs:
+        kwargs["client"] = httpx.Client(transport=httpx.MockTransport(handler))
+    if "async_client" not in kwargs:
+        kwargs["async_client"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(async_handler or handler)
+        )
+    return SDK(**kwargs)
+
+
 def make_unmarshal_json_response_stub(
     mapping: Mapping[Any, Any | Callable[[Any], Any]]
 ) -> Callable[[Any, Any], Any]:
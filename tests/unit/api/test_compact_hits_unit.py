@@ -0,0 +1,50 @@
+# tests/unit/api/test_compact_hits_unit.py
+from __future__ import annotations
+
+import pickle
+
+from dateno import models
+from dateno.ext.compact_hits import CompactHit, compact_hits
+
+RAW_HIT = {
+    "_id": "d1",
+    "_index": "fulldb",
+    "_score": 2.5,
+    "_source": {"id": "d1", "dataset": {"title": "Salmon", "tags": ["fish"]}},
+    "sort": [2.5, "d1"],
+}
+
+
+def test_round_trip_with_hit_model() -> None:
+    hit = models.Hit.model_validate(RAW_HIT)
+    compact = CompactHit.from_hit(hit)
+
+    assert (compact.id, compact.score, compact.index) == ("d1", 2.5, "fulldb")
+    assert compact.source == RAW_HIT["_source"]
+    assert compact.extra == {"sort": [2.5, "d1"]}
+    assert compact.to_hit() == hit
+    assert CompactHit.from_raw(RAW_HIT) == compact
+
+
+def test_lazy_field_access() -> None:
+    compact = CompactHit.from_raw(RAW_HIT)
+
+    assert compact.get("dataset.title") == "Salmon"
+    assert compact.get("dataset.tags") == ["fish"]
+    assert compact.get("dataset.missing", "n/a") == "n/a"
+    assert compact.get("id.nested") is None
+    assert compact.source_size == len(b'{"id":"d1","dataset":{"title":"Salmon","tags":["fish"]}}')
+    assert not hasattr(compact, "__dict__")
+
+
+def test_dedupe_pickle_and_bulk_conversion() -> None:
+    page = {"hits": {"total": 2, "hits": [RAW_HIT, dict(RAW_HIT, _score=1.0)]}}
+    from_raw = CompactHit.from_response(page)
+    from_model = CompactHit.from_response(models.SearchQueryResponse.model_validate(page))
+
+    assert from_raw == from_model
+    assert len(set(from_raw)) == 2  # hashed by id, compared by value
+    assert len({h.id for h in from_raw}) == 1
+
+    assert pickle.loads(pickle.dumps(from_raw[0])) == from_raw[0]
+    assert list(compact_hits(page["hits"]["hits"])) == from_raw
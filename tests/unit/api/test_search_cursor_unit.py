@@ -0,0 +1,121 @@
+# tests/unit/api/test_search_cursor_unit.py
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from dateno import SDK, utils
+from test_utils import mk_mock_sdk
+
+
+def _hit(i: int, *, with_sort: bool = True) -> Dict[str, Any]:
+    hit: Dict[str, Any] = {
+        "_id": f"id{i}",
+        "_score": 1.0,
+        "_source": {"id": f"id{i}", "dataset": {"title": f"t{i}"}},
+    }
+    if with_sort:
+        hit["sort"] = [1.0, f"id{i}"]
+    return hit
+
+
+def _page(hits: List[Dict[str, Any]], **extra: Any) -> httpx.Response:
+    body = {"hits": {"total": {"value": 5, "relation": "eq"}, "hits": hits}, **extra}
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, content=json.dumps(body).encode()
+    )
+
+
+def _mk_sdk(pages: List[httpx.Response], bodies: List[Dict[str, Any]]) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/search/0.2/es_search"
+        assert request.url.params["offset"] == "0"
+        bodies.append(json.loads(request.content))
+        return pages.pop(0)
+
+    return mk_mock_sdk(handler)
+
+
+def test_search_cursor_token_round_trip() -> None:
+    cursor = utils.SearchCursor(search_after=[1.5, "abc"], pit_id="pit-1", fetched=42)
+
+    restored = utils.SearchCursor.from_token(cursor.to_token())
+
+    assert restored == cursor
+    with pytest.raises(ValueError):
+        utils.SearchCursor.from_token("not-a-token")
+
+
+def test_iter_search_datasets_dsl_sends_search_after_from_last_hit() -> None:
+    bodies: List[Dict[str, Any]] = []
+    sdk = _mk_sdk([_page([_hit(0), _hit(1)]), _page([_hit(2)]), _page([])], bodies)
+
+    pages = sdk.search_api.iter_search_datasets_dsl(
+        query={"match_all": {}}, limit=2
+    )
+    ids = [hit.id for page in pages for hit in page.hits.hits]
+
+    assert ids == ["id0", "id1", "id2"]
+    assert "search_after" not in bodies[0]
+    assert bodies[0]["sort"] == [{"_score": "desc"}, {"id": "asc"}]
+    assert bodies[0]["query"] == {"match_all": {}}
+    assert bodies[1]["search_after"] == [1.0, "id1"]
+    assert bodies[2]["search_after"] == [1.0, "id2"]
+    assert pages.cursor.fetched == 3
+
+
+def test_iter_search_datasets_dsl_resumes_from_token() -> None:
+    bodies: List[Dict[str, Any]] = []
+    sdk = _mk_sdk([_page([_hit(0), _hit(1)]), _page([_hit(2)]), _page([])], bodies)
+
+    pages = sdk.search_api.iter_search_datasets_dsl(limit=2)
+    next(pages)
+    token = pages.cursor.to_token()
+
+    resumed = sdk.search_api.iter_search_datasets_dsl(limit=2, cursor=token)
+    ids = [hit.id for page in resumed for hit in page.hits.hits]
+
+    assert ids == ["id2"]
+    assert bodies[1]["search_after"] == [1.0, "id1"]
+    assert resumed.cursor.fetched == 3
+
+
+def test_iter_search_datasets_dsl_derives_sort_values_and_uses_pit() -> None:
+    bodies: List[Dict[str, Any]] = []
+    sdk = _mk_sdk(
+        [_page([_hit(0, with_sort=False)], pit_id="pit-2"), _page([])], bodies
+    )
+
+    pages = sdk.search_api.iter_search_datasets_dsl(
+        sort=[{"dataset.title": "asc"}, "_id"],
+        cursor=utils.SearchCursor(pit_id="pit-1"),
+    )
+    list(pages)
+
+    assert bodies[0]["pit"] == {"id": "pit-1"}
+    assert bodies[1]["search_after"] == ["t0", "id0"]
+    assert bodies[1]["pit"]["id"] == "pit-2"
+
+
+def test_iter_search_datasets_dsl_detects_non_advancing_cursor() -> None:
+    bodies: List[Dict[str, Any]] = []
+    sdk = _mk_sdk([_page([_hit(0)]), _page([_hit(0)])], bodies)
+
+    with pytest.raises(RuntimeError, match="did not advance"):
+        list(sdk.search_api.iter_search_datasets_dsl(limit=1))
+
+
+@pytest.mark.anyio
+async def test_iter_search_datasets_dsl_async_paginates_with_cursor() -> None:
+    bodies: List[Dict[str, Any]] = []
+    sdk = _mk_sdk([_page([_hit(0), _hit(1)]), _page([_hit(2)]), _page([])], bodies)
+
+    pages = sdk.search_api.iter_search_datasets_dsl_async(limit=2)
+    ids = [hit.id async for page in pages for hit in page.hits.hits]
+
+    assert ids == ["id0", "id1", "id2"]
+    assert bodies[2]["search_after"] == [1.0, "id2"]
+    assert pages.cursor.search_after == [1.0, "id2"]
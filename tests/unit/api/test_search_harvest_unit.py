@@ -0,0 +1,228 @@
+# tests/unit/api/test_search_harvest_unit.py
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import pytest
+
+from dateno import models
+from dateno.ext.search_harvest import facet_filter, harvest_search_datasets_async
+from dateno.search_api import SearchAPI
+from test_utils import mk_cfg
+
+
+@dataclass
+class _Hit:
+    id: str
+
+
+@dataclass
+class _FakeHits:
+    hits: List[Any]
+    total: Any = None
+
+
+@dataclass
+class _FakeSearchResponse:
+    hits: _FakeHits
+
+
+# Datasets keyed by catalog type; "d3" is tagged with two countries.
+_DATASETS: Dict[str, Dict[str, List[str]]] = {
+    "d1": {"type": ["ckan"], "country": ["FR"]},
+    "d2": {"type": ["ckan"], "country": ["DE"]},
+    "d3": {"type": ["ckan"], "country": ["FR", "DE"]},
+    "d4": {"type": ["geonetwork"], "country": ["FR"]},
+    "d5": {"type": [], "country": ["FR"]},
+}
+_FIELDS = {"source.catalog_type": "type", "source.countries.name": "country"}
+
+
+def _matches(doc: Dict[str, List[str]], filters: List[str]) -> bool:
+    for f in filters:
+        for key, field in _FIELDS.items():
+            for value in doc[field]:
+                if f == facet_filter(key, value):
+                    break
+            else:
+                continue
+            break
+        else:
+            return False
+    return True
+
+
+def _install_fakes(
+    monkeypatch,
+    api: SearchAPI,
+    calls: List[List[str]],
+    datasets: Dict[str, Dict[str, List[str]]] = _DATASETS,
+) -> None:
+    async def list_search_facets_async(**kwargs):
+        return [models.FacetInfo(key=k, name=k) for k in _FIELDS]
+
+    async def get_search_facet_values_async(*, key, **kwargs):
+        field = _FIELDS[key]
+        counts: Dict[str, int] = {}
+        for doc in datasets.values():
+            for value in doc[field]:
+                counts[value] = counts.get(value, 0) + 1
+        return models.FacetValuesResponse(
+            facet_key=key,
+            items=[models.FacetItem(key=k, num=n) for k, n in counts.items()],
+        )
+
+    async def search_datasets_async(*, filters=None, **kwargs):
+        total = sum(_matches(doc, filters or []) for doc in datasets.values())
+        return _FakeSearchResponse(_FakeHits([], {"value": total, "relation": "eq"}))
+
+    async def paginate_search_datasets_async(*, filters, **kwargs):
+        calls.append(list(filters))
+        await asyncio.sleep(0)
+        for doc_id, doc in datasets.items():
+            if _matches(doc, filters):
+                yield _Hit(doc_id)
+
+    monkeypatch.setattr(api, "list_search_facets_async", list_search_facets_async)
+    monkeypatch.setattr(api, "get_search_facet_values_async", get_search_facet_values_async)
+    monkeypatch.setattr(api, "search_datasets_async", search_datasets_async)
+    monkeypatch.setattr(api, "paginate_search_datasets_async", paginate_search_datasets_async)
+
+
+@pytest.mark.anyio
+async def test_harvest_dedupes_hits_and_reports_coverage(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    calls: List[List[str]] = []
+    _install_fakes(monkeypatch, api, calls)
+
+    harvest = harvest_search_datasets_async(
+        api, partition_keys=["source.countries.name"], concurrency=2
+    )
+    ids = sorted([hit.id async for hit in harvest])
+
+    assert ids == ["d1", "d2", "d3", "d4", "d5"]
+    report = harvest.report
+    assert report.expected_total == 5
+    assert report.unique_hits == 5
+    assert report.duplicate_hits == 1
+    assert report.coverage == 1.0
+    assert sorted(p.harvested for p in report.partitions) == [2, 4]
+    assert report.failed_partitions == []
+
+
+@pytest.mark.anyio
+async def test_harvest_splits_large_partitions_by_next_key(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    calls: List[List[str]] = []
+    _install_fakes(monkeypatch, api, calls)
+
+    harvest = harvest_search_datasets_async(
+        api,
+        partition_keys=["source.catalog_type", "source.countries.name"],
+        max_partition_size=2,
+    )
+    ids = sorted([hit.id async for hit in harvest])
+
+    # "ckan" (3 hits) is split by country and not harvested itself,
+    # "geonetwork" (1 hit) is not split; d5 has no catalog type and therefore
+    # shows up as missing coverage.
+    assert ids == ["d1", "d2", "d3", "d4"]
+    assert sorted(calls) == sorted(
+        [
+            [facet_filter("source.catalog_type", "ckan"), facet_filter("source.countries.name", "FR")],
+            [facet_filter("source.catalog_type", "ckan"), facet_filter("source.countries.name", "DE")],
+            [facet_filter("source.catalog_type", "geonetwork")],
+        ]
+    )
+    assert harvest.report.coverage == pytest.approx(0.8)
+
+    [split] = [p for p in harvest.report.partitions if p.split]
+    assert split.filters == [facet_filter("source.catalog_type", "ckan")]
+    assert (split.harvested, split.total, split.uncovered) == (0, 3, 0)
+
+
+@pytest.mark.anyio
+async def test_split_reports_hits_without_a_value_for_the_next_key(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    calls: List[List[str]] = []
+    datasets = dict(_DATASETS, d6={"type": ["ckan"], "country": []})
+    _install_fakes(monkeypatch, api, calls, datasets)
+
+    harvest = harvest_search_datasets_async(
+        api,
+        partition_keys=["source.catalog_type", "source.countries.name"],
+        max_partition_size=2,
+    )
+    ids = sorted([hit.id async for hit in harvest])
+
+    # d6 (ckan, no country) is in no sub-partition of the split "ckan" query,
+    # which is never paged through itself.
+    assert ids == ["d1", "d2", "d3", "d4"]
+    assert [facet_filter("source.catalog_type", "ckan")] not in calls
+    [split] = [p for p in harvest.report.partitions if p.split]
+    assert (split.total, split.uncovered) == (4, 1)
+    assert harvest.report.uncovered_hits == 1
+
+
+@pytest.mark.anyio
+async def test_failed_sub_partition_leaves_uncovered_unknown(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    calls: List[List[str]] = []
+    _install_fakes(monkeypatch, api, calls)
+    original = api.paginate_search_datasets_async
+
+    async def flaky(*, filters, **kwargs):
+        if facet_filter("source.countries.name", "DE") in filters:
+            raise RuntimeError("boom")
+        async for hit in original(filters=filters, **kwargs):
+            yield hit
+
+    monkeypatch.setattr(api, "paginate_search_datasets_async", flaky)
+    harvest = harvest_search_datasets_async(
+        api,
+        partition_keys=["source.catalog_type", "source.countries.name"],
+        max_partition_size=2,
+    )
+    [hit.id async for hit in harvest]
+
+    [split] = [p for p in harvest.report.partitions if p.split]
+    assert split.uncovered is None
+    assert len(harvest.report.failed_partitions) == 1
+
+
+def test_facet_filter_escapes_quotes() -> None:
+    assert facet_filter("source.name", 'The "Open" Portal') == (
+        '"source.name"="The \\"Open\\" Portal"'
+    )
+    assert facet_filter("k", "a\\b") == '"k"="a\\\\b"'
+
+
+@pytest.mark.anyio
+async def test_harvest_records_partition_errors_and_rejects_unknown_keys(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    calls: List[List[str]] = []
+    _install_fakes(monkeypatch, api, calls)
+
+    with pytest.raises(ValueError, match="unknown partition keys"):
+        async for _ in harvest_search_datasets_async(api, partition_keys=["nope"]):
+            pass
+
+    original = api.paginate_search_datasets_async
+
+    async def flaky(*, filters, **kwargs):
+        if facet_filter("source.catalog_type", "geonetwork") in filters:
+            raise RuntimeError("boom")
+        async for hit in original(filters=filters, **kwargs):
+            yield hit
+
+    monkeypatch.setattr(api, "paginate_search_datasets_async", flaky)
+
+    harvest = harvest_search_datasets_async(api)
+    ids = sorted([hit.id async for hit in harvest])
+
+    assert ids == ["d1", "d2", "d3"]
+    [failed] = harvest.report.failed_partitions
+    assert failed.filters == [facet_filter("source.catalog_type", "geonetwork")]
+    assert isinstance(failed.error, RuntimeError)
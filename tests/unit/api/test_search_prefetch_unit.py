@@ -0,0 +1,166 @@
+# tests/unit/api/test_search_prefetch_unit.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import pytest
+
+from dateno import models
+from dateno.search_api import SearchAPI
+from dateno.utils.pagination import search_hits_total
+from test_utils import mk_cfg
+
+
+@dataclass
+class _FakeHits:
+    hits: List[Any]
+    total: Any = None
+
+
+@dataclass
+class _FakeSearchResponse:
+    hits: _FakeHits
+
+
+def _corpus_page(corpus: List[str], offset: int, limit: int, total: Any) -> _FakeSearchResponse:
+    return _FakeSearchResponse(_FakeHits(corpus[offset : offset + limit], total))
+
+
+def test_search_hits_total_handles_all_total_shapes() -> None:
+    assert search_hits_total(_FakeSearchResponse(_FakeHits([], 7))) == 7
+    assert search_hits_total(_FakeSearchResponse(_FakeHits([], {"value": 9, "relation": "eq"}))) == 9
+    assert search_hits_total(_FakeSearchResponse(_FakeHits([], models.Total(value=3, relation="eq")))) == 3
+    assert search_hits_total(_FakeSearchResponse(_FakeHits([], {"value": 10000, "relation": "gte"}))) is None
+    assert search_hits_total(_FakeSearchResponse(_FakeHits([], None))) is None
+
+
+def test_prefetch_yields_hits_in_order_and_bounds_requests_by_total(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    corpus = [f"h{i}" for i in range(23)]
+    offsets: List[Optional[int]] = []
+    lock = threading.Lock()
+
+    def fake_search_datasets(*, limit=None, offset=None, **kwargs):
+        with lock:
+            offsets.append(offset)
+        # Later pages finish first to prove ordering is preserved.
+        time.sleep(0.001 * (30 - offset) / 10)
+        return _corpus_page(corpus, offset, limit, {"value": 23, "relation": "eq"})
+
+    monkeypatch.setattr(api, "search_datasets", fake_search_datasets)
+
+    hits = list(api.paginate_search_datasets(q="env", limit=5, prefetch=3))
+
+    assert hits == corpus
+    # 23 hits / 5 per page -> offsets 0..20, no request past the known total.
+    assert sorted(offsets) == [0, 5, 10, 15, 20]
+
+
+def test_prefetch_keeps_at_most_window_requests_in_flight(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    corpus = [f"h{i}" for i in range(40)]
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fake_search_datasets(*, limit=None, offset=None, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return _corpus_page(corpus, offset, limit, 40)
+
+    monkeypatch.setattr(api, "search_datasets", fake_search_datasets)
+
+    assert len(list(api.paginate_search_datasets(limit=4, prefetch=3))) == 40
+    assert max_in_flight == 3
+
+
+def test_prefetch_stops_on_first_empty_page_without_total(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    corpus = [f"h{i}" for i in range(7)]
+
+    def fake_search_datasets(*, limit=None, offset=None, **kwargs):
+        return _corpus_page(corpus, offset, limit, None)
+
+    monkeypatch.setattr(api, "search_datasets", fake_search_datasets)
+
+    pages = list(api.iter_search_datasets(limit=2, prefetch=4))
+
+    assert [hit for page in pages for hit in page.hits.hits] == corpus
+
+
+def test_prefetch_propagates_error_after_earlier_pages(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    corpus = [f"h{i}" for i in range(10)]
+
+    def fake_search_datasets(*, limit=None, offset=None, **kwargs):
+        if offset == 4:
+            raise RuntimeError("boom")
+        return _corpus_page(corpus, offset, limit, 10)
+
+    monkeypatch.setattr(api, "search_datasets", fake_search_datasets)
+
+    seen: List[str] = []
+    with pytest.raises(RuntimeError, match="boom"):
+        for hit in api.paginate_search_datasets(limit=2, prefetch=3):
+            seen.append(hit)
+
+    assert seen == ["h0", "h1", "h2", "h3"]
+
+
+@pytest.mark.anyio
+async def test_prefetch_async_yields_hits_in_order(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    corpus = [f"h{i}" for i in range(11)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_search_datasets_async(*, limit=None, offset=None, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (20 - offset) / 10)
+        in_flight -= 1
+        return _corpus_page(corpus, offset, limit, {"value": 11, "relation": "eq"})
+
+    monkeypatch.setattr(api, "search_datasets_async", fake_search_datasets_async)
+
+    hits = [
+        hit async for hit in api.paginate_search_datasets_async(limit=3, prefetch=2)
+    ]
+
+    assert hits == corpus
+    assert max_in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_prefetch_async_cancels_pending_tasks_on_error(monkeypatch) -> None:
+    api = SearchAPI(mk_cfg())
+    cancelled: List[int] = []
+
+    async def fake_search_datasets_async(*, limit=None, offset=None, **kwargs):
+        if offset == 2:
+            raise RuntimeError("boom")
+        if offset > 2:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(offset)
+                raise
+        return _corpus_page(["a", "b"], 0, limit, 100)
+
+    monkeypatch.setattr(api, "search_datasets_async", fake_search_datasets_async)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in api.iter_search_datasets_async(limit=2, prefetch=3):
+            pass
+
+    assert sorted(cancelled) == [4, 6]
@@ -0,0 +1,448 @@
+# tests/unit/api/test_statsdb_export_unit.py
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from dateno import SDK, errors
+from dateno.ext import statsdb_export
+from dateno.ext.statsdb_export import (
+    export_namespace,
+    export_namespace_async,
+    export_timeseries_file_to_path,
+    export_timeseries_file_to_path_async,
+    export_timeseries_file_to_stream,
+    export_timeseries_file_to_stream_async,
+)
+from test_utils import mk_mock_sdk
+
+_BODY = b"date,value\n" + b"2024-01-01,1\n" * 5000
+
+
+def _mk_sdk(status: int = 200) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/statsdb/0.1/ns/ns1/ts/ts1/export.csv"
+        if status != 200:
+            return httpx.Response(
+                status, headers={"content-type": "text/plain"}, content=b"boom"
+            )
+        return httpx.Response(200, headers={"content-type": "text/csv"}, content=_BODY)
+
+    return mk_mock_sdk(handler)
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+
+def test_export_to_stream_writes_bounded_chunks() -> None:
+    sink = _Sink()
+
+    written = export_timeseries_file_to_stream(
+        _mk_sdk().statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        sink=sink,
+        chunk_size=4096,
+    )
+
+    assert written == len(_BODY)
+    assert b"".join(sink.chunks) == _BODY
+    assert len(sink.chunks) > 1
+    assert max(len(c) for c in sink.chunks) <= 4096
+
+
+@pytest.mark.anyio
+async def test_export_to_stream_async_accepts_coroutine_sinks() -> None:
+    chunks: List[bytes] = []
+
+    class _AsyncSink:
+        async def write(self, data: bytes) -> None:
+            chunks.append(data)
+
+    written = await export_timeseries_file_to_stream_async(
+        _mk_sdk().statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        sink=_AsyncSink(),
+        chunk_size=1024,
+    )
+
+    assert written == len(_BODY)
+    assert b"".join(chunks) == _BODY
+
+
+def test_export_to_path_replaces_target_atomically(tmp_path: Path) -> None:
+    target = tmp_path / "out" / "ts1.csv"
+
+    result = export_timeseries_file_to_path(
+        _mk_sdk().statistics_api, ns_id="ns1", ts_id="ts1", fileext="csv", path=target
+    )
+
+    assert result == target
+    assert target.read_bytes() == _BODY
+    assert [p.name for p in target.parent.iterdir()] == ["ts1.csv"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_exported_file_gets_the_umask_mode(tmp_path: Path) -> None:
+    target = tmp_path / "ts1.csv"
+    reference = tmp_path / "reference"
+    reference.write_bytes(b"")
+
+    export_timeseries_file_to_path(
+        _mk_sdk().statistics_api, ns_id="ns1", ts_id="ts1", fileext="csv", path=target
+    )
+
+    assert target.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
+
+@pytest.mark.anyio
+async def test_export_to_path_async_keeps_existing_file_on_error(tmp_path: Path) -> None:
+    target = tmp_path / "ts1.csv"
+    target.write_bytes(b"previous")
+
+    with pytest.raises(Exception):
+        await export_timeseries_file_to_path_async(
+            _mk_sdk(status=503).statistics_api,
+            ns_id="ns1",
+            ts_id="ts1",
+            fileext="csv",
+            path=target,
+        )
+
+    assert target.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["ts1.csv"]
+
+
+class _StalledStream(httpx.AsyncByteStream):
+    """Body stream that sends one chunk and then never finishes."""
+
+    async def __aiter__(self):
+        yield b"partial"
+        await asyncio.Event().wait()
+
+    async def aclose(self) -> None:
+        # Closing takes a few loop iterations, like a real connection.
+        await asyncio.sleep(0.01)
+
+
+def _mk_namespace_sdk(
+    fail: str = "", series: Optional[List[Dict[str, Any]]] = None, stall: bool = False
+) -> SDK:
+    series = series or [
+        {"id": "ts1", "indicator": "gdp", "table": "t1", "name": "GDP"},
+        {"id": "ts2", "indicator": "cpi", "table": "t1", "name": "CPI"},
+        {"id": "ts3", "indicator": "gdp", "table": "t2", "name": "GDP 2"},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/statsdb/0.1/ns/ns1/ts":
+            start = int(request.url.params["start"])
+            if stall and start > 0:
+                return httpx.Response(
+                    200, headers={"content-type": "application/json"}, stream=_StalledStream()
+                )
+            limit = int(request.url.params["limit"])
+            items = series[start : start + limit]
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json"},
+                json={"items": items, "totals": len(series), "start": start, "limit": limit},
+            )
+        ts_id = path.rsplit("/", 2)[-2]
+        if ts_id == fail:
+            return httpx.Response(500, headers={"content-type": "text/plain"}, content=b"x")
+        if stall:
+            return httpx.Response(
+                200, headers={"content-type": "text/csv"}, stream=_StalledStream()
+            )
+        return httpx.Response(
+            200, headers={"content-type": "text/csv"}, content=ts_id.encode() * 10
+        )
+
+    return mk_mock_sdk(handler)
+
+
+def test_export_namespace_filters_and_records_failures(tmp_path: Path) -> None:
+    manifest = export_namespace(
+        _mk_namespace_sdk(fail="ts3").statistics_api,
+        ns_id="ns1",
+        dest_dir=tmp_path,
+        indicators={"gdp"},
+        concurrency=2,
+    )
+
+    assert [e.ts_id for e in manifest.entries] == ["ts1", "ts3"]
+    ok, failed = manifest.entries
+    assert ok.size == 30 and ok.error is None
+    assert (tmp_path / "ts1.csv").read_bytes() == b"ts1" * 10
+    assert manifest.failed == [failed]
+    assert "SDKDefaultError" in (failed.error or "")
+    assert not (tmp_path / "ts3.csv").exists()
+
+    written = json.loads(manifest.write(tmp_path / "manifest.json").read_text())
+    assert written["exported"] == 1 and written["failed"] == 1
+    assert written["total_bytes"] == 30
+
+
+def test_export_namespace_listing_error_does_not_wait_for_queued_exports(
+    tmp_path: Path,
+) -> None:
+    exports_started: List[float] = []
+    listing_failed: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/statsdb/0.1/ns/ns1/ts":
+            if int(request.url.params["start"]) > 0:
+                listing_failed.append(time.monotonic())
+                return httpx.Response(500, headers={"content-type": "text/plain"})
+            items = [
+                {"id": f"ts{i}", "indicator": "i", "table": "t", "name": f"TS {i}"}
+                for i in range(20)
+            ]
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json"},
+                json={"items": items, "totals": 40, "start": 0, "limit": 100},
+            )
+        exports_started.append(time.monotonic())
+        time.sleep(0.02)
+        return httpx.Response(200, headers={"content-type": "text/csv"}, content=b"x")
+
+    with pytest.raises(errors.SDKError):
+        export_namespace(
+            mk_mock_sdk(handler).statistics_api,
+            ns_id="ns1",
+            dest_dir=tmp_path,
+            concurrency=2,
+        )
+
+    # Listing stayed at most `concurrency` exports ahead of the failure.
+    assert sum(t > listing_failed[0] for t in exports_started) <= 2
+
+
+@pytest.mark.anyio
+async def test_export_namespace_async_exports_selected_tables(tmp_path: Path) -> None:
+    manifest = await export_namespace_async(
+        _mk_namespace_sdk().statistics_api,
+        ns_id="ns1",
+        dest_dir=tmp_path,
+        tables={"t1"},
+    )
+
+    assert sorted(e.ts_id for e in manifest.entries) == ["ts1", "ts2"]
+    assert manifest.failed == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ts1.csv", "ts2.csv"]
+
+
+@pytest.mark.anyio
+async def test_export_namespace_keeps_ids_with_separators_apart(tmp_path: Path) -> None:
+    series = [
+        {"id": i, "indicator": "gdp", "table": "t1", "name": i} for i in ("a/b", "a_b")
+    ]
+    manifest = await export_namespace_async(
+        _mk_namespace_sdk(series=series).statistics_api, ns_id="ns1", dest_dir=tmp_path
+    )
+
+    slashed, plain = manifest.entries
+    assert Path(plain.path).name == "a_b.csv"
+    assert Path(slashed.path).name.startswith("a_b-")
+    assert len({p.name for p in tmp_path.iterdir()}) == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_namespace_export_leaves_no_partial_files(tmp_path: Path) -> None:
+    # A full first page of series, then the listing and every export stall.
+    series = [
+        {"id": f"ts{i}", "indicator": "gdp", "table": "t1", "name": "GDP"}
+        for i in range(100)
+    ]
+    export = asyncio.ensure_future(
+        export_namespace_async(
+            _mk_namespace_sdk(series=series, stall=True).statistics_api,
+            ns_id="ns1",
+            dest_dir=tmp_path,
+            concurrency=2,
+        )
+    )
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if list(tmp_path.iterdir()):
+            break
+    assert list(tmp_path.iterdir())
+
+    export.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await export
+    assert list(tmp_path.iterdir()) == []
+
+
+class _DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Body stream that breaks the connection after `cut` bytes."""
+
+    def __init__(self, data: bytes, cut: int) -> None:
+        self._data = data
+        self._cut = cut
+
+    def __iter__(self):
+        yield self._data[: self._cut]
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        yield self._data[: self._cut]
+        raise httpx.ReadError("connection reset")
+
+
+def _mk_ranged_sdk(
+    requests: List[httpx.Request], *, ranges: bool = True, connect_errors: int = 0
+) -> SDK:
+    refused: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests and len(refused) < connect_errors:
+            # Reconnecting after the drop fails a few times.
+            refused.append(request)
+            raise httpx.ConnectError("refused", request=request)
+        requests.append(request)
+        headers = {"content-type": "text/csv", "etag": '"v1"'}
+        if ranges:
+            headers["accept-ranges"] = "bytes"
+        rng = request.headers.get("range")
+        if rng and ranges and request.headers.get("if-range") == '"v1"':
+            start = int(rng.split("=")[1].rstrip("-"))
+            body = _BODY[start:]
+            headers["content-range"] = f"bytes {start}-{len(_BODY) - 1}/{len(_BODY)}"
+            headers["content-length"] = str(len(body))
+            return httpx.Response(206, headers=headers, content=body)
+        headers["content-length"] = str(len(_BODY))
+        if len(requests) == 1:
+            return httpx.Response(200, headers=headers, stream=_DroppingStream(_BODY, 1000))
+        return httpx.Response(200, headers=headers, content=_BODY)
+
+    return mk_mock_sdk(handler)
+
+
+def test_resumable_export_continues_with_range_after_drop(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    target = tmp_path / "ts1.csv"
+
+    export_timeseries_file_to_path(
+        _mk_ranged_sdk(requests).statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        path=target,
+        resume=True,
+    )
+
+    assert target.read_bytes() == _BODY
+    assert [r.headers.get("range") for r in requests] == [None, "bytes=1000-"]
+    assert requests[1].headers["if-range"] == '"v1"'
+    assert all(r.headers["accept-encoding"] == "identity" for r in requests)
+    assert [p.name for p in tmp_path.iterdir()] == ["ts1.csv"]
+
+
+@pytest.mark.anyio
+async def test_resumable_export_async_restarts_without_accept_ranges(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    target = tmp_path / "ts1.csv"
+
+    await export_timeseries_file_to_path_async(
+        _mk_ranged_sdk(requests, ranges=False).statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        path=target,
+        resume=True,
+    )
+
+    assert target.read_bytes() == _BODY
+    assert [r.headers.get("range") for r in requests] == [None, None]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_resumable_export_retries_failed_reconnects(
+    tmp_path: Path, use_async: bool
+) -> None:
+    requests: List[httpx.Request] = []
+    target = tmp_path / "ts1.csv"
+    kwargs: Dict[str, Any] = dict(
+        ns_id="ns1", ts_id="ts1", fileext="csv", path=target, resume=True
+    )
+    stats = _mk_ranged_sdk(requests, connect_errors=2).statistics_api
+
+    if use_async:
+        await export_timeseries_file_to_path_async(stats, **kwargs)
+    else:
+        export_timeseries_file_to_path(stats, **kwargs)
+
+    assert target.read_bytes() == _BODY
+    assert [r.headers.get("range") for r in requests] == [None, "bytes=1000-"]
+
+
+def test_resumable_export_keeps_part_file_when_attempts_run_out(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    target = tmp_path / "ts1.csv"
+
+    with pytest.raises(httpx.ReadError):
+        export_timeseries_file_to_path(
+            _mk_ranged_sdk(requests).statistics_api,
+            ns_id="ns1",
+            ts_id="ts1",
+            fileext="csv",
+            path=target,
+            resume=True,
+            resume_attempts=1,
+        )
+
+    assert not target.exists()
+    assert (tmp_path / "ts1.csv.part").read_bytes() == _BODY[:1000]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("resume", [False, True])
+async def test_async_export_keeps_disk_io_off_the_event_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, resume: bool
+) -> None:
+    loop_thread = threading.get_ident()
+    replaced_on: List[int] = []
+    replace = os.replace
+
+    def recording_replace(src, dst):
+        replaced_on.append(threading.get_ident())
+        replace(src, dst)
+
+    monkeypatch.setattr(statsdb_export.os, "replace", recording_replace)
+    requests: List[httpx.Request] = []
+    sdk = _mk_ranged_sdk(requests) if resume else _mk_sdk()
+    target = tmp_path / "ts1.csv"
+
+    await export_timeseries_file_to_path_async(
+        sdk.statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        path=target,
+        resume=resume,
+    )
+
+    assert target.read_bytes() == _BODY
+    assert replaced_on and loop_thread not in replaced_on
@@ -0,0 +1,84 @@
+# tests/unit/sdk/test_basesdk_logging_unit.py
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import httpx
+import pytest
+
+from dateno import SDK, utils
+from dateno.utils.logger import NoOpLogger
+from test_utils import mk_mock_sdk
+
+
+class _RecordingLogger:
+    """Logger without `isEnabledFor`: receives every record, formats eagerly."""
+
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self.messages.append(msg % args if args else msg)
+
+
+def _mk_sdk(logger: Any, responses: list[httpx.Response]) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    return mk_mock_sdk(handler, debug_logger=logger)
+
+
+def _healthz_response() -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, content=b'{"status":"ok"}'
+    )
+
+
+def test_is_debug_enabled_respects_logger_levels() -> None:
+    std_logger = logging.getLogger("dateno-sdk-tests.logging")
+    std_logger.setLevel(logging.INFO)
+
+    assert utils.is_debug_enabled(NoOpLogger()) is False
+    assert utils.is_debug_enabled(std_logger) is False
+    assert utils.is_debug_enabled(_RecordingLogger()) is True
+
+    std_logger.setLevel(logging.DEBUG)
+    assert utils.is_debug_enabled(std_logger) is True
+
+
+def test_do_request_does_not_decode_body_when_debug_is_off() -> None:
+    response = _healthz_response()
+    sdk = _mk_sdk(NoOpLogger(), [response])
+
+    assert sdk.service.get_healthz() == {"status": "ok"}
+    # httpx caches the decoded text on first access of `.text`.
+    assert not hasattr(response, "_text")
+
+
+def test_do_request_logs_bodies_when_debug_is_on() -> None:
+    logger = _RecordingLogger()
+    sdk = _mk_sdk(logger, [_healthz_response()])
+
+    sdk.service.get_healthz()
+
+    assert any(m.startswith("Request:") for m in logger.messages)
+    assert any('Body: {"status":"ok"}' in m for m in logger.messages)
+
+
+@pytest.mark.anyio
+async def test_do_request_async_does_not_decode_body_when_debug_is_off() -> None:
+    response = _healthz_response()
+    sdk = _mk_sdk(NoOpLogger(), [response])
+
+    assert await sdk.service.get_healthz_async() == {"status": "ok"}
+    assert not hasattr(response, "_text")
+
+
+def test_lazy_bodies_format_on_demand() -> None:
+    req = httpx.Request("POST", "https://example.invalid", content=b"abc")
+    res = httpx.Response(200, content=b"xyz", request=req)
+
+    assert str(utils.LazyRequestBody(req)) == "b'abc'"
+    assert str(utils.LazyResponseBody(res, False)) == "xyz"
+    assert str(utils.LazyResponseBody(res, True)) == "<streaming response>"
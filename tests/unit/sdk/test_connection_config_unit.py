@@ -0,0 +1,50 @@
+# tests/unit/sdk/test_connection_config_unit.py
+from __future__ import annotations
+
+import importlib.util
+
+import httpx
+import pytest
+
+from dateno import SDK, ConnectionConfig
+from test_utils import mk_mock_sdk
+
+
+def test_sdk_builds_clients_from_connection_config() -> None:
+    sdk = SDK(
+        api_key_query="TEST_KEY",
+        connection_config=ConnectionConfig(max_connections=7, max_keepalive_connections=3),
+    )
+
+    for client in (sdk.sdk_configuration.client, sdk.sdk_configuration.async_client):
+        assert isinstance(client, (httpx.Client, httpx.AsyncClient))
+        pool = client._transport._pool  # pylint: disable=protected-access
+        assert pool._max_connections == 7  # pylint: disable=protected-access
+        assert pool._max_keepalive_connections == 3  # pylint: disable=protected-access
+    assert sdk.sdk_configuration.client_supplied is False
+
+
+def test_pool_timeout_is_applied_to_each_request() -> None:
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.update(request.extensions["timeout"])
+        return httpx.Response(200, headers={"content-type": "application/json"}, json={})
+
+    sdk = mk_mock_sdk(
+        handler,
+        timeout_ms=10_000,
+        connection_config=ConnectionConfig(pool_timeout_ms=250),
+    )
+
+    sdk.statistics_api.list_export_formats()
+
+    assert captured == {"connect": 10.0, "read": 10.0, "write": 10.0, "pool": 0.25}
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+)
+def test_http2_without_h2_raises_a_helpful_error() -> None:
+    with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+        ConnectionConfig(http2=True)
@@ -0,0 +1,127 @@
+# tests/unit/sdk/test_lazy_response_unit.py
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from dateno import SDK, errors, models, utils
+from test_utils import mk_mock_sdk
+
+PAGE: Dict[str, Any] = {
+    "took": 3,
+    "timed_out": False,
+    "hits": {
+        "total": {"value": 3, "relation": "eq"},
+        "max_score": 1.5,
+        "hits": [
+            {"_id": "a", "_score": 1.5, "_source": {"id": "a"}},
+            {"_id": "b", "_score": 0.5, "_source": {"id": "b"}},
+            {"_id": "c", "_score": 0.1, "_source": {"id": "c"}, "sort": [1]},
+        ],
+    },
+    "aggregations": {"countries": {"buckets": []}},
+}
+
+
+def _sdk(body: Any = PAGE, **kwargs: Any) -> SDK:
+    content = json.dumps(body).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=content, headers={"content-type": "application/json"}
+        )
+
+    return mk_mock_sdk(handler, **kwargs)
+
+
+def test_envelope_is_validated_and_hits_on_access() -> None:
+    res = _sdk().search_api.search_datasets(q="x", response_mode="lazy")
+    eager = models.SearchQueryResponse.model_validate(PAGE)
+
+    assert isinstance(res, utils.LazySearchQueryResponse)
+    assert (res.took, res.timed_out) == (3, False)
+    assert res.hits.total == eager.hits.total
+    assert res.hits.max_score == 1.5
+    assert res.hits.hits.materialized == 0
+
+    assert res.hits.hits[0] == eager.hits.hits[0]
+    assert res.hits.hits.materialized == 1
+    assert res.hits.hits[0] is res.hits.hits[0]
+
+    assert len(res.hits.hits) == 3
+    assert res.hits.hits[-1].additional_properties == {"sort": [1]}
+    assert res.hits.hits[1:] == eager.hits.hits[1:]
+    assert [hit.id for hit in res.hits.hits] == ["a", "b", "c"]
+    assert res.hits.hits == eager.hits.hits
+    assert res.aggregations == eager.aggregations
+
+
+def test_other_attributes_validate_the_whole_page() -> None:
+    res = _sdk(response_mode="lazy").search_api.search_datasets_dsl(body={})
+
+    assert isinstance(res, utils.LazySearchQueryResponse)
+    assert res.model_dump() == models.SearchQueryResponse.model_validate(
+        PAGE
+    ).model_dump()
+    assert isinstance(res.materialize(), models.SearchQueryResponse)
+
+
+def test_hits_support_the_model_and_list_api() -> None:
+    res = _sdk().search_api.search_datasets(q="x", response_mode="lazy")
+    eager = models.SearchQueryResponse.model_validate(PAGE)
+    hits = res.hits.hits
+
+    assert res.hits.model_dump() == eager.hits.model_dump()
+    assert hits + [] == eager.hits.hits
+    assert [] + hits == eager.hits.hits
+    assert hits.index(eager.hits.hits[1]) == 1
+    assert hits.count(eager.hits.hits[2]) == 1
+    assert eager.hits.hits[0] in hits
+    assert list(reversed(hits)) == eager.hits.hits[::-1]
+    assert hits != eager.hits.hits[:2]
+
+
+def test_invalid_hit_fails_when_read() -> None:
+    page = json.loads(json.dumps(PAGE))
+    page["hits"]["hits"][1]["_score"] = "high"
+    res = _sdk(page).search_api.search_datasets(q="x", response_mode="lazy")
+
+    assert res.hits.hits[0].id == "a"
+    with pytest.raises(errors.ResponseValidationError):
+        res.hits.hits[1]
+
+    seen = []
+    with pytest.raises(errors.ResponseValidationError):
+        for hit in res.hits.hits:
+            seen.append(hit.id)
+    assert seen == ["a"]
+
+    for body in ({"hits": {"total": "many", "hits": []}}, [1]):
+        with pytest.raises(errors.ResponseValidationError):
+            _sdk(body).search_api.search_datasets(q="x", response_mode="lazy")
+
+
+def test_projection_and_similar_datasets() -> None:
+    sdk = _sdk(response_mode="lazy")
+
+    res = sdk.search_api.search_datasets(q="x", projection=["missing"])
+    assert isinstance(res, utils.LazySearchQueryResponse)
+    assert res.hits.hits[0].source == {}
+
+    similar_page = {"total": PAGE["hits"]["total"], "hits": []}
+    similar = _sdk(similar_page, response_mode="lazy").search_api.get_similar_datasets(
+        entry_id="a"
+    )
+    assert isinstance(similar, models.SimilarHitsResponse)
+
+
+@pytest.mark.anyio
+async def test_async_lazy_mode() -> None:
+    res = await _sdk().search_api.search_datasets_async(q="x", response_mode="lazy")
+
+    assert isinstance(res, utils.LazySearchQueryResponse)
+    assert res.hits.hits[2].id == "c"
+    assert res.hits.hits.materialized == 1
@@ -0,0 +1,94 @@
+# tests/unit/sdk/test_response_mode_unit.py
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from dateno import SDK, errors, models, utils
+from test_utils import mk_mock_sdk
+
+PAGE: Dict[str, Any] = {
+    "took": 3,
+    "hits": {
+        "total": {"value": 2, "relation": "eq"},
+        "hits": [
+            {"_id": "a", "_score": 1.5, "_source": {"id": "a"}},
+            {"_id": "b", "_score": 0.5, "_source": {"id": "b"}},
+        ],
+    },
+    "aggs": {"countries": {"buckets": []}},
+}
+
+
+def _sdk(status: int = 200, body: Any = PAGE, **kwargs: Any) -> SDK:
+    content = json.dumps(body).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status, content=content, headers={"content-type": "application/json"}
+        )
+
+    return mk_mock_sdk(handler, **kwargs)
+
+
+def test_default_mode_returns_models() -> None:
+    res = _sdk().search_api.search_datasets(q="x")
+    assert isinstance(res, models.SearchQueryResponse)
+
+
+def test_per_call_json_and_bytes_modes() -> None:
+    sdk = _sdk()
+
+    res = sdk.search_api.search_datasets(q="x", response_mode="json")
+    assert res == PAGE
+    assert [utils.raw_hit_id(h) for h in utils.raw_hits(res)] == ["a", "b"]
+    assert utils.raw_hit_score(utils.raw_hits(res)[0]) == 1.5
+    assert utils.raw_hit_source(utils.raw_hits(res)[1]) == {"id": "b"}
+    assert utils.raw_hits_total(res) == 2
+    assert utils.raw_aggregations(res) == {"countries": {"buckets": []}}
+
+    raw = sdk.search_api.search_datasets(q="x", response_mode="bytes")
+    assert json.loads(raw) == PAGE
+
+
+def test_sdk_mode_is_the_default_and_can_be_overridden() -> None:
+    sdk = _sdk(response_mode="json")
+
+    assert isinstance(sdk.search_api.search_datasets_dsl(body={}), dict)
+    model = sdk.search_api.search_datasets(q="x", response_mode="model")
+    assert isinstance(model, models.SearchQueryResponse)
+
+    # Pagination helpers always work on models.
+    pages = sdk.search_api.iter_search_datasets(q="x", limit=2)
+    assert isinstance(next(iter(pages)), models.SearchQueryResponse)
+
+
+def test_similar_hits_accessors() -> None:
+    body = {"total": 7, "hits": [{"_id": "s1", "_source": {}}]}
+    res = _sdk(body=body).search_api.get_similar_datasets(
+        entry_id="e", response_mode="json"
+    )
+    assert utils.raw_hits_total(res) == 7
+    assert [utils.raw_hit_id(h) for h in utils.raw_hits(res)] == ["s1"]
+
+
+def test_errors_are_unchanged_in_raw_modes() -> None:
+    sdk = _sdk(status=400, body={"detail": "bad"})
+    with pytest.raises(errors.ErrorResponse):
+        sdk.search_api.search_datasets(q="x", response_mode="json")
+
+
+def test_unknown_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        _sdk(response_mode="dicts")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        _sdk().search_api.search_datasets(response_mode="dicts")  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+async def test_async_json_mode() -> None:
+    res = await _sdk().search_api.search_datasets_async(q="x", response_mode="json")
+    assert utils.raw_hits_total(res) == 2
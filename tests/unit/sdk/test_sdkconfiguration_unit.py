@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
 from dateno.sdkconfiguration import DEFAULT_TIMEOUT_MS, SDKConfiguration, SERVERS
@@ -144,3 +147,27 @@ def test_get_server_details_raises_on_invalid_server_idx() -> None:
 
     with pytest.raises(IndexError):
         cfg.get_server_details()
+
+
+def test_creating_an_sdk_does_not_import_optional_features() -> None:
+    """
+    Importing the SDK and creating a client must not load opt-in features.
+
+    The cache (and sqlite3), hedging, routing and the other opt-in helpers are
+    only referenced by type in `SDKConfiguration`; they are imported by the
+    caller that constructs one.
+    """
+    code = (
+        "import sys, dateno\n"
+        "dateno.SDK(api_key_query='x')\n"
+        "mods = ('sqlite3', 'dateno.utils.httpcache', 'dateno.utils.hedging',\n"
+        "        'dateno.utils.routing', 'dateno.utils.ratelimit',\n"
+        "        'dateno.utils.backoff', 'dateno.utils.circuitbreaker',\n"
+        "        'dateno.utils.memo')\n"
+        "print(sorted(m for m in mods if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip() == "[]"
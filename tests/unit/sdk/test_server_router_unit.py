@@ -0,0 +1,117 @@
+# tests/unit/sdk/test_server_router_unit.py
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from dateno import SDK
+from dateno.utils.routing import ServerRouter
+from test_utils import mk_mock_sdk
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps({"csv": "text/csv"}).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def mirror_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def dead_url() -> str:
+    # A port that was just released: connections are refused.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_fails_over_to_mirror_on_connection_error(dead_url: str, mirror_url: str) -> None:
+    router = ServerRouter([dead_url, mirror_url])
+    sdk = SDK(api_key_query="TEST_KEY", server_router=router)
+
+    assert sdk.statistics_api.list_export_formats() == {"csv": "text/csv"}
+    primary, mirror = router.states()
+    assert (primary.healthy, primary.failures) == (False, 1)
+    assert mirror.healthy and mirror.latency_ewma_s is not None
+
+    # The next request goes straight to the mirror.
+    assert sdk.sdk_configuration.get_server_details()[0] == mirror_url
+    sdk.statistics_api.list_export_formats()
+    assert router.states()[0].failures == 1
+
+
+def test_health_check_marks_servers_down_and_up() -> None:
+    healthy = {"a.invalid": False, "b.invalid": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = 200 if healthy[request.url.host] else 503
+        return httpx.Response(
+            status, headers={"content-type": "application/json"}, json={}
+        )
+
+    router = ServerRouter(["https://a.invalid", "https://b.invalid"])
+    sdk = mk_mock_sdk(handler, server_url=None, server_router=router)
+
+    assert router.check_health(sdk.service) == {
+        "https://a.invalid": False,
+        "https://b.invalid": True,
+    }
+    assert router.select() == "https://b.invalid"
+
+    healthy["a.invalid"] = True
+    router.check_health(sdk.service)
+    assert all(state.healthy for state in router.states())
+
+
+@pytest.mark.anyio
+async def test_routes_to_lowest_latency_server() -> None:
+    hosts: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host == "slow.invalid":
+            await asyncio.sleep(0.05)
+        return httpx.Response(200, headers={"content-type": "application/json"}, json={})
+
+    router = ServerRouter(["https://slow.invalid", "https://fast.invalid"])
+    sdk = mk_mock_sdk(handler, server_url=None, server_router=router)
+    for _ in range(5):
+        await sdk.statistics_api.list_export_formats_async()
+
+    # Each server is measured once, then the fast one takes the traffic.
+    assert hosts == ["slow.invalid", "fast.invalid"] + ["fast.invalid"] * 3
+
+
+def test_explicit_server_url_bypasses_router() -> None:
+    router = ServerRouter(["https://a.invalid"])
+    sdk = SDK(
+        api_key_query="TEST_KEY",
+        server_url="https://pinned.invalid",
+        server_router=router,
+    )
+    assert sdk.sdk_configuration.get_server_details()[0] == "https://pinned.invalid"
@@ -0,0 +1,75 @@
+# tests/unit/utils/test_backoff_unit.py
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+
+from dateno import SDK, errors
+from dateno.utils.backoff import BackoffCoordinator
+from dateno.utils.ratelimit import RateLimit, RateLimiter
+from test_utils import mk_mock_sdk
+
+
+def _mk_sdk(
+    coordinator: BackoffCoordinator,
+    sent: List[float],
+    throttled: int = 1,
+    **kwargs: Any,
+) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        if len(sent) <= throttled:
+            return httpx.Response(
+                429, headers={"content-type": "text/plain", "retry-after": "0.2"}
+            )
+        return httpx.Response(200, headers={"content-type": "application/json"}, json={})
+
+    return mk_mock_sdk(handler, backoff_coordinator=coordinator, **kwargs)
+
+
+@pytest.mark.anyio
+async def test_one_retry_after_holds_every_concurrent_request() -> None:
+    coordinator = BackoffCoordinator()
+    sent: List[float] = []
+    stats = _mk_sdk(coordinator, sent).statistics_api
+
+    with pytest.raises(errors.SDKError):
+        await stats.list_export_formats_async()
+    await asyncio.gather(*(stats.list_export_formats_async() for _ in range(10)))
+
+    assert len(sent) == 11
+    assert min(sent[1:]) - sent[0] >= 0.19
+    assert coordinator.metrics.throttles == 1
+    assert coordinator.metrics.held_requests == 10
+    assert coordinator.metrics.held_seconds_max >= 0.19
+
+
+def test_pause_is_per_host_and_capped() -> None:
+    coordinator = BackoffCoordinator(max_pause_s=0.05)
+    sent: List[float] = []
+    stats = _mk_sdk(coordinator, sent).statistics_api
+
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()
+
+    assert 0 < coordinator.paused_for("example.invalid") <= 0.05
+    assert coordinator.paused_for("other.invalid") == 0.0
+    stats.list_export_formats()
+    assert sent[1] - sent[0] >= 0.04
+
+
+def test_rate_limiter_on_the_same_sdk_does_not_pause_too() -> None:
+    coordinator = BackoffCoordinator()
+    limiter = RateLimiter(RateLimit(rate=1000))
+    sent: List[float] = []
+    stats = _mk_sdk(coordinator, sent, rate_limiter=limiter).statistics_api
+
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()
+
+    assert coordinator.paused_for("example.invalid") > 0.1
+    assert limiter._global is not None and limiter._global.paused_until == 0.0
@@ -0,0 +1,101 @@
+# tests/unit/utils/test_circuitbreaker_unit.py
+from __future__ import annotations
+
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from dateno import SDK, errors
+from dateno.utils.circuitbreaker import CircuitBreaker, path_prefix_key
+from test_utils import mk_mock_sdk
+
+
+def _mk_sdk(breaker: CircuitBreaker, statuses: List[int], paths: List[str]) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        status = statuses.pop(0) if statuses else 200
+        body = {"facet_key": "k", "items": []} if "facet" in request.url.path else {}
+        return httpx.Response(
+            status, headers={"content-type": "application/json"}, json=body
+        )
+
+    return mk_mock_sdk(handler, circuit_breaker=breaker)
+
+
+def test_trips_open_and_fails_fast_without_sending() -> None:
+    breaker = CircuitBreaker(minimum_calls=3, open_s=60)
+    paths: List[str] = []
+    stats = _mk_sdk(breaker, [200, 503, 503], paths).statistics_api
+
+    stats.list_export_formats()
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()
+    assert breaker.state("list_export_formats").state == "closed"
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()
+
+    with pytest.raises(errors.CircuitOpenError) as excinfo:
+        stats.list_export_formats()
+
+    assert len(paths) == 3
+    assert excinfo.value.key == "list_export_formats"
+    state = breaker.state("list_export_formats")
+    assert state.state == "open"
+    assert state.trips == 1
+    assert 0 < state.retry_in_s <= 60
+
+
+def test_half_open_probe_closes_or_reopens_circuit() -> None:
+    breaker = CircuitBreaker(minimum_calls=1, open_s=0.05)
+    paths: List[str] = []
+    stats = _mk_sdk(breaker, [500, 500], paths).statistics_api
+
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()
+    time.sleep(0.06)
+    with pytest.raises(errors.SDKError):
+        stats.list_export_formats()  # failed probe
+    assert breaker.state("list_export_formats").trips == 2
+    with pytest.raises(errors.CircuitOpenError):
+        stats.list_export_formats()
+
+    time.sleep(0.06)
+    stats.list_export_formats()  # successful probe
+    assert breaker.state("list_export_formats").state == "closed"
+    assert len(paths) == 3
+
+
+@pytest.mark.anyio
+async def test_path_prefix_circuits_are_independent_in_async_calls() -> None:
+    breaker = CircuitBreaker(minimum_calls=2, key=path_prefix_key())
+    paths: List[str] = []
+    sdk = _mk_sdk(breaker, [503, 503], paths)
+
+    for _ in range(2):
+        with pytest.raises(errors.SDKError):
+            await sdk.statistics_api.list_export_formats_async()
+    with pytest.raises(errors.CircuitOpenError):
+        await sdk.statistics_api.list_export_formats_async()
+    await sdk.search_api.get_search_facet_values_async(key="source.catalog_type")
+
+    states: Dict[str, str] = {k: s.state for k, s in breaker.states().items()}
+    assert states == {"/statsdb": "open", "/search": "closed"}
+
+
+def test_connection_errors_count_as_failures() -> None:
+    breaker = CircuitBreaker(minimum_calls=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    sdk = mk_mock_sdk(handler, circuit_breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            sdk.statistics_api.list_export_formats()
+    with pytest.raises(errors.CircuitOpenError):
+        sdk.statistics_api.list_export_formats()
+
+    breaker.reset()
+    assert breaker.states() == {}
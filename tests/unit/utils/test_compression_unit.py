@@ -0,0 +1,120 @@
+# tests/unit/utils/test_compression_unit.py
+from __future__ import annotations
+
+import gzip
+import json
+from typing import List
+
+import httpx
+import pytest
+
+from dateno import SDK
+from dateno.ext.statsdb_export import (
+    export_timeseries_file_to_stream,
+    export_timeseries_file_to_stream_async,
+)
+from dateno.utils.compression import (
+    ACCEPT_ENCODING,
+    CompressionMetrics,
+    supported_encodings,
+)
+from test_utils import mk_mock_sdk
+
+_FORMATS = json.dumps({f"fmt{i}": "text/plain" for i in range(500)}).encode()
+_CSV = b"date,value\n" + b"2024-01-01,1\n" * 5000
+
+
+def _respond(seen: List[List[str]], request: httpx.Request):
+    seen.append(request.headers.get_list("accept-encoding"))
+    body = _CSV if request.url.path.endswith(".csv") else _FORMATS
+    headers = {"content-type": "application/json"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip.compress(body)
+        headers["content-encoding"] = "gzip"
+    # Chunked like a network body, so that it is not read up front.
+    return headers, [body[i : i + 1024] for i in range(0, len(body), 1024)]
+
+
+def _mk_sdk(seen: List[List[str]], metrics: CompressionMetrics) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers, chunks = _respond(seen, request)
+        return httpx.Response(200, headers=headers, content=iter(chunks))
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        headers, chunks = _respond(seen, request)
+
+        async def body():
+            for chunk in chunks:
+                yield chunk
+
+        return httpx.Response(200, headers=headers, content=body())
+
+    return mk_mock_sdk(
+        handler,
+        async_handler=async_handler,
+        compression_metrics=metrics,
+    )
+
+
+def test_supported_encodings_always_include_gzip() -> None:
+    assert supported_encodings()[-2:] == ("gzip", "deflate")
+    assert ACCEPT_ENCODING.endswith("gzip, deflate")
+
+
+def test_negotiates_encoding_and_records_ratio() -> None:
+    seen: List[List[str]] = []
+    metrics = CompressionMetrics()
+    sdk = _mk_sdk(seen, metrics)
+
+    assert len(sdk.statistics_api.list_export_formats()) == 500
+    sdk.statistics_api.list_export_formats(http_headers={"accept-encoding": "identity"})
+
+    assert seen == [[ACCEPT_ENCODING], ["identity"]]
+    gz, identity = metrics.stats["gzip"], metrics.stats["identity"]
+    assert gz.responses == 1 and identity.responses == 1
+    assert gz.decoded_bytes == len(_FORMATS)
+    assert gz.wire_bytes < gz.decoded_bytes
+    assert gz.compression_ratio > 5
+    assert identity.compression_ratio == 1.0
+
+
+def test_streamed_export_is_decompressed_while_streaming() -> None:
+    chunks: List[bytes] = []
+    metrics = CompressionMetrics()
+
+    class _Sink:
+        def write(self, data: bytes) -> None:
+            chunks.append(data)
+
+    export_timeseries_file_to_stream(
+        _mk_sdk([], metrics).statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        sink=_Sink(),
+        chunk_size=4096,
+    )
+
+    assert b"".join(chunks) == _CSV
+    gz = metrics.stats["gzip"]
+    assert gz.streamed_wire_bytes == gz.wire_bytes == len(gzip.compress(_CSV))
+
+
+@pytest.mark.anyio
+async def test_async_streamed_export_is_recorded_on_close() -> None:
+    metrics = CompressionMetrics()
+
+    class _Sink:
+        def write(self, data: bytes) -> None:
+            pass
+
+    await export_timeseries_file_to_stream_async(
+        _mk_sdk([], metrics).statistics_api,
+        ns_id="ns1",
+        ts_id="ts1",
+        fileext="csv",
+        sink=_Sink(),
+    )
+
+    assert metrics.stats["gzip"].responses == 1
+    assert metrics.stats["gzip"].elapsed_s > 0
@@ -0,0 +1,39 @@
+# tests/unit/utils/test_field_plan_unit.py
+from __future__ import annotations
+
+from dateno import models, utils
+from dateno.utils.metadata import (
+    PathParamMetadata,
+    QueryParamMetadata,
+    clear_field_plan_cache,
+    get_field_plan,
+)
+
+
+def test_field_plans_are_built_once_per_class_and_kind() -> None:
+    clear_field_plan_cache()
+
+    query = get_field_plan(models.ListTimeseriesRequest, QueryParamMetadata)
+    path = get_field_plan(models.ListTimeseriesRequest, PathParamMetadata)
+
+    assert [p.name for p in query] == ["start", "limit", "apikey"]
+    assert [p.name for p in path] == ["ns_id"]
+    assert get_field_plan(models.ListTimeseriesRequest, QueryParamMetadata) is query
+
+
+def test_request_parts_are_unchanged_by_cached_plans() -> None:
+    request = models.SearchDatasetsRequest(
+        q="salmon", filters=['"a"="1"', '"b"="2"'], limit=10, facets=True
+    )
+
+    for _ in range(2):  # cold, then cached
+        params = utils.get_query_params(request)
+        assert params["q"] == ["salmon"]
+        assert params["filters"] == ['"a"="1"', '"b"="2"']
+        assert params["limit"] == ["10"]
+        assert params["facets"] == ["true"]
+
+    ts = models.ListTimeseriesRequest(ns_id="wb", start=5)
+    url = utils.generate_url("https://x.invalid/", "/statsdb/0.1/ns/{ns_id}/ts", ts)
+    assert url == "https://x.invalid/statsdb/0.1/ns/wb/ts"
+    assert utils.get_headers(ts) == {}
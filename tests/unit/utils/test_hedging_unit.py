@@ -0,0 +1,265 @@
+# tests/unit/utils/test_hedging_unit.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from dateno.utils.hedging import RequestHedger
+from dateno.utils.retries import RetryBudget
+from test_utils import mk_mock_sdk
+
+OPS = {"list_export_formats"}
+
+
+def _ok(tag: str) -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, json={"from": tag}
+    )
+
+
+def _hedger(**kwargs) -> RequestHedger:
+    kwargs.setdefault("budget", RetryBudget(ratio=1.0, min_retries=0))
+    return RequestHedger(initial_delay_s=0.05, operations=OPS, **kwargs)
+
+
+@pytest.mark.anyio
+async def test_slow_async_request_is_hedged_and_loser_cancelled() -> None:
+    calls: List[int] = []
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return _ok("primary")
+        return _ok("hedge")
+
+    hedger = _hedger()
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+
+    started = time.monotonic()
+    res = await sdk.statistics_api.list_export_formats_async()
+
+    assert res == {"from": "hedge"}
+    assert time.monotonic() - started < 1
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert (hedger.stats.hedged, hedger.stats.hedge_wins) == (1, 1)
+
+
+def test_slow_sync_request_is_hedged() -> None:
+    calls: List[int] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        if first:
+            time.sleep(0.5)
+            return _ok("primary")
+        return _ok("hedge")
+
+    hedger = _hedger()
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+    try:
+        assert sdk.statistics_api.list_export_formats() == {"from": "hedge"}
+        assert hedger.stats.hedge_wins == 1
+    finally:
+        hedger.close()
+
+
+def test_fast_requests_and_other_operations_are_not_hedged() -> None:
+    paths: Dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths[request.url.path] = paths.get(request.url.path, 0) + 1
+        body = {"facet_key": "k", "items": []} if "facet" in request.url.path else {}
+        return httpx.Response(
+            200, headers={"content-type": "application/json"}, json=body
+        )
+
+    hedger = _hedger(min_samples=5, min_delay_s=0.02)
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+    try:
+        for _ in range(5):
+            sdk.statistics_api.list_export_formats()
+            sdk.search_api.get_search_facet_values(key="k")
+    finally:
+        hedger.close()
+
+    assert set(paths.values()) == {5}
+    assert hedger.stats.requests == 5
+    assert hedger.stats.hedged == 0
+
+
+def test_delay_is_the_latency_percentile_floored_at_min_delay() -> None:
+    hedger = _hedger(min_samples=5, min_delay_s=0.02)
+    assert hedger.delay("list_export_formats") == 0.05
+
+    for _ in range(5):
+        hedger._record("list_export_formats", 0.001)
+    assert hedger.delay("list_export_formats") == pytest.approx(0.02)
+
+    hedger = _hedger(min_samples=5, percentile=0.5)
+    for elapsed in (0.1, 0.2, 0.3, 0.4, 0.5):
+        hedger._record("list_export_formats", elapsed)
+    assert hedger.delay("list_export_formats") == pytest.approx(0.3)
+
+
+@pytest.mark.anyio
+async def test_budget_caps_hedges() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.08)
+        return _ok("any")
+
+    hedger = _hedger(budget=RetryBudget(ratio=0.0, min_retries=1))
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+    for _ in range(3):
+        await sdk.statistics_api.list_export_formats_async()
+
+    assert hedger.stats.hedged == 1
+    assert hedger.stats.budget_rejected == 2
+
+
+def _slow_ok_fast_error(statuses: List[int]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        statuses.append(0)
+        if len(statuses) == 1:
+            time.sleep(0.2)
+            return _ok("primary")
+        return httpx.Response(503, headers={"content-type": "application/json"}, json={})
+
+    return handler
+
+
+def test_sync_error_response_does_not_beat_a_slower_success() -> None:
+    hedger = _hedger()
+    sdk = mk_mock_sdk(_slow_ok_fast_error([]), request_hedger=hedger)
+    try:
+        assert sdk.statistics_api.list_export_formats() == {"from": "primary"}
+    finally:
+        hedger.close()
+
+    assert hedger.stats.hedged == 1
+    assert hedger.stats.hedge_wins == 0
+
+
+@pytest.mark.anyio
+async def test_async_error_response_does_not_beat_a_slower_success() -> None:
+    statuses: List[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        statuses.append(0)
+        if len(statuses) == 1:
+            await asyncio.sleep(0.2)
+            return _ok("primary")
+        return httpx.Response(503, headers={"content-type": "application/json"}, json={})
+
+    hedger = _hedger()
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+
+    assert await sdk.statistics_api.list_export_formats_async() == {"from": "primary"}
+    assert hedger.stats.hedge_wins == 0
+
+
+@pytest.mark.anyio
+async def test_first_error_response_is_returned_when_both_fail() -> None:
+    request = httpx.Request("GET", "https://example.invalid")
+    calls: List[int] = []
+
+    async def func() -> httpx.Response:
+        calls.append(0)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(502, request=request)
+
+    hedger = _hedger()
+    res = await hedger.call_async("list_export_formats", request, func)
+
+    assert res.status_code == 502
+    assert hedger.stats.hedge_wins == 0
+
+
+def test_sync_calls_reuse_request_threads() -> None:
+    threads: List[threading.Thread] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        threads.append(threading.current_thread())
+        return _ok("any")
+
+    hedger = _hedger()
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+    try:
+        for _ in range(20):
+            sdk.statistics_api.list_export_formats()
+    finally:
+        hedger.close()
+
+    assert hedger.stats.hedged == 0
+    assert len({id(thread) for thread in threads}) < 5
+
+
+def test_sync_concurrency_is_not_capped_by_the_hedge_pool() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.02)
+        return _ok("any")
+
+    hedger = _hedger(max_workers=1)
+    sdk = mk_mock_sdk(handler, request_hedger=hedger)
+    threads = [
+        threading.Thread(target=sdk.statistics_api.list_export_formats)
+        for _ in range(8)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        hedger.close()
+
+    assert hedger.stats.requests == 8
+    assert hedger.stats.hedged == 0
+
+
+class _Closable:
+    status_code = 200
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.anyio
+async def test_async_loser_finishing_in_the_same_batch_is_closed() -> None:
+    request = httpx.Request("GET", "https://example.invalid")
+    release = asyncio.Event()
+    responses: List[_Closable] = []
+
+    async def func():
+        res = _Closable(str(len(responses)))
+        responses.append(res)
+        if len(responses) == 1:
+            await release.wait()
+        else:
+            release.set()
+        return res
+
+    winner = await _hedger().call_async("list_export_formats", request, func)
+
+    assert len(responses) == 2
+    assert [res.closed for res in responses if res is not winner] == [True]
+    assert not winner.closed
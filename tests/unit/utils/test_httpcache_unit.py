@@ -0,0 +1,125 @@
+# tests/unit/utils/test_httpcache_unit.py
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List
+
+import httpx
+import pytest
+
+from dateno import SDK
+from dateno.utils.httpcache import CachePolicy, ResponseCache
+from test_utils import mk_mock_sdk
+
+_FORMATS = {"csv": "text/csv", "json": "application/json"}
+
+
+def _mk_sdk(cache: ResponseCache, requests: List[httpx.Request]) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200, headers={"content-type": "application/json", "etag": '"v1"'}, json=_FORMATS
+        )
+
+    return mk_mock_sdk(handler, response_cache=cache)
+
+
+def test_fresh_entries_are_served_from_disk_across_sdk_instances(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    cache = ResponseCache(tmp_path / "cache.db")
+
+    assert _mk_sdk(cache, requests).statistics_api.list_export_formats() == _FORMATS
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "cache.db")
+    assert _mk_sdk(reopened, requests).statistics_api.list_export_formats() == _FORMATS
+
+    assert len(requests) == 1
+    assert reopened.stats.hits == 1
+
+
+@pytest.mark.anyio
+async def test_stale_entries_are_revalidated_with_if_none_match(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    cache = ResponseCache(
+        tmp_path / "cache.db", policies={"list_export_formats": CachePolicy(ttl_s=0)}
+    )
+    sdk = _mk_sdk(cache, requests)
+
+    first = await sdk.statistics_api.list_export_formats_async()
+    second = await sdk.statistics_api.list_export_formats_async()
+
+    assert first == second == _FORMATS
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"']
+    assert cache.stats.revalidated == 1
+
+
+def test_operations_without_policy_are_not_cached(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    cache = ResponseCache(tmp_path / "cache.db", policies={})
+    sdk = _mk_sdk(cache, requests)
+
+    sdk.statistics_api.list_export_formats()
+    sdk.statistics_api.list_export_formats()
+
+    assert len(requests) == 2
+    assert cache.total_bytes() == 0
+
+
+def test_eviction_keeps_total_size_under_max_bytes(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=100)
+    client = httpx.Client()
+    for i in range(5):
+        request = client.build_request("GET", f"https://example.invalid/{i}")
+        entry = cache.lookup("get_namespace", request)
+        assert entry is not None
+        cache.update(entry, httpx.Response(200, content=b"x" * 40, request=request))
+
+    assert cache.total_bytes() <= 100
+    assert cache.stats.evictions == 3
+    latest = client.build_request("GET", "https://example.invalid/4")
+    entry = cache.lookup("get_namespace", latest)
+    assert entry is not None and entry.fresh is not None
+
+
+@pytest.mark.anyio
+async def test_async_calls_query_sqlite_off_the_event_loop(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    cache = ResponseCache(tmp_path / "cache.db")
+    loop_thread = threading.get_ident()
+    query_threads: List[int] = []
+    store = cache._store
+
+    def recording_store(entry, response):
+        query_threads.append(threading.get_ident())
+        store(entry, response)
+
+    cache._store = recording_store  # type: ignore[method-assign]
+    sdk = _mk_sdk(cache, requests)
+
+    await sdk.statistics_api.list_export_formats_async()
+    assert await sdk.statistics_api.list_export_formats_async() == _FORMATS
+
+    assert len(requests) == 1
+    assert query_threads and loop_thread not in query_threads
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+def test_stats_are_exact_under_threads(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db")
+    request = httpx.Request("GET", "https://example.invalid/formats")
+
+    def look_up() -> None:
+        for _ in range(200):
+            cache.lookup("list_export_formats", request)
+
+    threads = [threading.Thread(target=look_up) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats.misses == 1600
@@ -0,0 +1,66 @@
+# tests/unit/utils/test_jsonbackend_unit.py
+from __future__ import annotations
+
+import io
+import json
+from typing import Optional
+
+import pytest
+
+from dateno import models, utils
+from dateno.utils import jsonbackend, serializers
+
+BACKENDS = jsonbackend.available_json_backends()
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest):
+    yield utils.set_json_backend(request.param)
+    utils.set_json_backend(None)
+
+
+def test_builtin_is_always_available() -> None:
+    assert BACKENDS[-1] == "builtin"
+    assert utils.get_json_backend().name == BACKENDS[0]
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        utils.set_json_backend("simplejson")
+
+
+def test_round_trip_matches_stdlib(backend) -> None:
+    doc = {"q": "Zürich", "n": [1, 2.5, None, True], "big": 2**70, "nested": {"a": {}}}
+
+    encoded = utils.json_dumps(doc)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == doc
+    assert utils.json_loads(encoded) == doc
+    assert utils.json_loads(encoded.decode("utf-8")) == doc
+
+    with pytest.raises(ValueError):
+        utils.json_loads(b"{not json")
+
+
+def test_marshal_and_unmarshal_use_the_backend(backend) -> None:
+    body = models.BodySearchDatasetsDsl(
+        query={"match": {"dataset.title": "salmon"}}, sort=[{"_score": "desc"}]
+    )
+    out = serializers.marshal_json(body, Optional[models.BodySearchDatasetsDsl])
+    assert json.loads(out) == {
+        "query": {"match": {"dataset.title": "salmon"}},
+        "sort": [{"_score": "desc"}],
+    }
+
+    page = serializers.unmarshal_json(
+        b'{"hits": {"total": 1, "hits": []}, "aggregations": {"k": {"buckets": []}}}',
+        models.SearchQueryResponse,
+    )
+    assert page.aggregations == {"k": {"buckets": []}}
+
+
+def test_write_ndjson(backend) -> None:
+    fp = io.BytesIO()
+    assert utils.write_ndjson(fp, [{"_id": "a"}, {"_id": "b"}]) == 2
+    lines = fp.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [{"_id": "a"}, {"_id": "b"}]
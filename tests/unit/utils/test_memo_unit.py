@@ -0,0 +1,105 @@
+# tests/unit/utils/test_memo_unit.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from dateno import SDK
+from dateno.utils.memo import ResponseMemo
+from test_utils import mk_mock_sdk
+
+
+def _facet_response(key: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json"},
+        json={"facet_key": key, "items": [{"key": "FR", "num": 3}]},
+    )
+
+
+def _mk_sdk(memo: ResponseMemo, keys: List[str], delay: float = 0.0) -> SDK:
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.url.params["key"])
+        time.sleep(delay)
+        return _facet_response(request.url.params["key"])
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.url.params["key"])
+        await asyncio.sleep(delay)
+        return _facet_response(request.url.params["key"])
+
+    return mk_mock_sdk(handler, async_handler=async_handler, response_memo=memo)
+
+
+def test_repeated_calls_are_served_from_memo() -> None:
+    memo = ResponseMemo()
+    keys: List[str] = []
+    search = _mk_sdk(memo, keys).search_api
+
+    first = search.get_search_facet_values(key="countries")
+    second = search.get_search_facet_values(key="countries")
+    search.get_search_facet_values(key="formats")
+
+    assert first == second
+    assert keys == ["countries", "formats"]
+    assert (memo.stats.hits, memo.stats.misses) == (1, 2)
+
+
+def test_concurrent_identical_calls_are_coalesced() -> None:
+    memo = ResponseMemo()
+    keys: List[str] = []
+    search = _mk_sdk(memo, keys, delay=0.05).search_api
+    results: List[object] = []
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(search.get_search_facet_values(key="countries"))
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert keys == ["countries"]
+    assert len(results) == 5
+    assert memo.stats.coalesced == 4
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_async_calls_are_coalesced() -> None:
+    memo = ResponseMemo()
+    keys: List[str] = []
+    search = _mk_sdk(memo, keys, delay=0.05).search_api
+
+    results = await asyncio.gather(
+        *(search.get_search_facet_values_async(key="countries") for _ in range(5))
+    )
+
+    assert keys == ["countries"]
+    assert all(r == results[0] for r in results)
+
+
+def test_memo_respects_ttl_and_entry_bounds() -> None:
+    memo = ResponseMemo(ttl_s=0.0)
+    keys: List[str] = []
+    search = _mk_sdk(memo, keys).search_api
+
+    search.get_search_facet_values(key="countries")
+    search.get_search_facet_values(key="countries")
+    assert keys == ["countries", "countries"]
+
+    memo = ResponseMemo(max_entries=2)
+    search = _mk_sdk(memo, keys).search_api
+    for key in ("a", "b", "c"):
+        search.get_search_facet_values(key=key)
+
+    assert len(memo) == 2
+    assert memo.stats.evictions == 1
+    assert memo.total_bytes > 0
@@ -0,0 +1,91 @@
+# tests/unit/utils/test_projection_unit.py
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+
+from dateno import SDK, models, utils
+from test_utils import mk_mock_sdk
+
+SOURCE: Dict[str, Any] = {
+    "id": "d1",
+    "dataset": {"title": "Salmon", "description": "long text", "uid": "u1"},
+    "source": {"catalog_type": "Geoportal", "name": "Portal"},
+    "resources": [
+        {"url": "https://a", "name": "A", "format": "csv"},
+        {"url": "https://b", "name": "B", "format": "json"},
+    ],
+}
+FIELDS = ["id", "dataset.title", "source.catalog_type"]
+
+
+def test_includes_keep_only_the_projected_paths() -> None:
+    assert utils.SourceProjection(FIELDS).prune(SOURCE) == {
+        "id": "d1",
+        "dataset": {"title": "Salmon"},
+        "source": {"catalog_type": "Geoportal"},
+    }
+
+
+def test_arrays_wildcards_and_excludes() -> None:
+    projection = utils.SourceProjection(
+        includes=["id", "resources.*"], excludes=["resources.name"]
+    )
+    assert projection.prune(SOURCE) == {
+        "id": "d1",
+        "resources": [
+            {"url": "https://a", "format": "csv"},
+            {"url": "https://b", "format": "json"},
+        ],
+    }
+    only_excludes = utils.SourceProjection(excludes=["dataset.desc*", "resources"])
+    assert only_excludes.prune(SOURCE) == {
+        "id": "d1",
+        "dataset": {"title": "Salmon", "uid": "u1"},
+        "source": SOURCE["source"],
+    }
+    assert only_excludes.to_dsl() == {"excludes": ["dataset.desc*", "resources"]}
+
+
+def _sdk(bodies: List[Dict[str, Any]]) -> SDK:
+    page = {
+        "hits": {
+            "total": {"value": 1, "relation": "eq"},
+            "hits": [{"_id": "d1", "_source": SOURCE}],
+        }
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content) if request.content else {})
+        return httpx.Response(200, json=page)
+
+    return mk_mock_sdk(handler)
+
+
+def test_dsl_search_sends_source_filter_and_prunes() -> None:
+    bodies: List[Dict[str, Any]] = []
+    res = _sdk(bodies).search_api.search_datasets_dsl(
+        body={"query": {"match_all": {}}}, projection=FIELDS
+    )
+
+    assert bodies[0] == {
+        "query": {"match_all": {}},
+        "_source": {"includes": FIELDS},
+    }
+    assert isinstance(res, models.SearchQueryResponse)
+    assert set(res.hits.hits[0].source) == {"id", "dataset", "source"}
+
+
+def test_query_search_and_paginators_prune_client_side() -> None:
+    bodies: List[Dict[str, Any]] = []
+    search = _sdk(bodies).search_api
+
+    raw = search.search_datasets(q="x", projection=FIELDS, response_mode="json")
+    assert utils.raw_hit_source(utils.raw_hits(raw)[0])["dataset"] == {
+        "title": "Salmon"
+    }
+
+    hit = next(iter(search.paginate_search_datasets(q="x", projection=["id"])))
+    assert hit.source == {"id": "d1"}
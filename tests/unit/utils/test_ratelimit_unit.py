@@ -0,0 +1,163 @@
+# tests/unit/utils/test_ratelimit_unit.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from dateno import SDK, errors, utils
+from dateno.utils.backoff import BackoffCoordinator
+from dateno.utils.ratelimit import RateLimit, RateLimiter
+from test_utils import mk_mock_sdk
+
+
+def _ok() -> httpx.Response:
+    return httpx.Response(200, headers={"content-type": "application/json"}, json={})
+
+
+def _mk_sdk(limiter: RateLimiter, handler, async_handler=None) -> SDK:
+    return mk_mock_sdk(handler, async_handler=async_handler, rate_limiter=limiter)
+
+
+def test_global_rate_spaces_out_requests() -> None:
+    sent: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        return _ok()
+
+    sdk = _mk_sdk(RateLimiter(RateLimit(rate=20, burst=1)), handler)
+    for _ in range(5):
+        sdk.statistics_api.list_export_formats()
+
+    assert sent[-1] - sent[0] >= 4 / 20 - 0.01
+
+
+def test_per_operation_concurrency_is_shared_across_threads_and_tasks() -> None:
+    state: Dict[str, int] = {"in_flight": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def enter() -> None:
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+
+    def leave() -> None:
+        with lock:
+            state["in_flight"] -= 1
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        enter()
+        time.sleep(0.02)
+        leave()
+        return _ok()
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        enter()
+        await asyncio.sleep(0.02)
+        leave()
+        return _ok()
+
+    limiter = RateLimiter(
+        per_operation={"list_export_formats": RateLimit(max_concurrency=2)}
+    )
+    sdk = _mk_sdk(limiter, handler, async_handler)
+
+    async def run_tasks() -> None:
+        await asyncio.gather(
+            *(sdk.statistics_api.list_export_formats_async() for _ in range(4))
+        )
+
+    threads = [
+        threading.Thread(target=sdk.statistics_api.list_export_formats) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    asyncio.run(run_tasks())
+    for t in threads:
+        t.join()
+
+    assert state["peak"] == 2
+
+
+@pytest.mark.anyio
+async def test_retry_after_pauses_following_requests() -> None:
+    sent: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        if len(sent) == 1:
+            return httpx.Response(
+                429, headers={"content-type": "text/plain", "retry-after": "0.2"}
+            )
+        return _ok()
+
+    sdk = _mk_sdk(RateLimiter(RateLimit(rate=1000)), handler)
+
+    with pytest.raises(errors.SDKError):
+        await sdk.statistics_api.list_export_formats_async()
+    await sdk.statistics_api.list_export_formats_async()
+
+    assert sent[1] - sent[0] >= 0.19
+
+
+def test_retry_after_is_left_to_the_backoff_coordinator() -> None:
+    sent: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        if len(sent) == 1:
+            return httpx.Response(
+                429, headers={"content-type": "text/plain", "retry-after": "0.2"}
+            )
+        return _ok()
+
+    sdk = mk_mock_sdk(
+        handler,
+        rate_limiter=RateLimiter(RateLimit(rate=1000)),
+        backoff_coordinator=BackoffCoordinator(max_pause_s=0.05),
+    )
+    with pytest.raises(errors.SDKError):
+        sdk.statistics_api.list_export_formats()
+    sdk.statistics_api.list_export_formats()
+
+    # Only the coordinator's capped pause applies, not the full Retry-After.
+    assert 0.04 <= sent[1] - sent[0] < 0.15
+
+
+def test_parse_retry_after_header_accepts_seconds_and_dates() -> None:
+    def parse(value: str):
+        return utils.parse_retry_after_header(
+            httpx.Response(429, headers={"retry-after": value})
+        )
+
+    assert parse("1.5") == 1500
+    assert parse("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse("soon") is None
+
+
+def test_exhausted_quota_headers_pause_until_reset() -> None:
+    sent: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        return httpx.Response(
+            200,
+            headers={
+                "content-type": "application/json",
+                "x-ratelimit-remaining": "0" if len(sent) == 1 else "10",
+                "x-ratelimit-reset": "0.15",
+            },
+            json={},
+        )
+
+    sdk = _mk_sdk(RateLimiter(RateLimit(rate=1000)), handler)
+    for _ in range(3):
+        sdk.statistics_api.list_export_formats()
+
+    assert sent[1] - sent[0] >= 0.14
+    assert sent[2] - sent[1] < 0.1
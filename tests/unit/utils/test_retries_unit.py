@@ -0,0 +1,104 @@
+# tests/unit/utils/test_retries_unit.py
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+import pytest
+
+from dateno.utils import retries as retries_mod
+from dateno.utils.retries import (
+    BackoffStrategy,
+    Retries,
+    RetryBudget,
+    RetryConfig,
+    TemporaryError,
+)
+
+
+def _retries(**backoff_kwargs) -> Retries:
+    budget = backoff_kwargs.pop("budget", None)
+    backoff = BackoffStrategy(
+        initial_interval=0,
+        max_interval=0,
+        exponent=1.5,
+        max_elapsed_time=60_000,
+        **backoff_kwargs,
+    )
+    return Retries(RetryConfig("backoff", backoff, True, budget=budget), ["503"])
+
+
+def _failing(calls: List[int]):
+    def fn() -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(503)
+
+    return fn
+
+
+def test_max_attempts_returns_last_response(monkeypatch) -> None:
+    monkeypatch.setattr(retries_mod.time, "sleep", lambda *_: None)
+    calls: List[int] = []
+
+    res = retries_mod.retry(_failing(calls), _retries(max_attempts=3))
+
+    assert res.status_code == 503
+    assert len(calls) == 3
+
+
+def test_budget_limits_retries_to_ratio_of_requests(monkeypatch) -> None:
+    monkeypatch.setattr(retries_mod.time, "sleep", lambda *_: None)
+    budget = RetryBudget(ratio=0.5, window_s=60, min_retries=0)
+    retries = _retries(max_attempts=5, budget=budget)
+    calls: List[int] = []
+
+    for _ in range(10):
+        retries_mod.retry(_failing(calls), retries)
+
+    assert budget.stats.requests == 10
+    assert budget.stats.retries == 5
+    assert len(calls) == 15
+    assert budget.stats.rejected > 0
+
+
+def test_budget_window_slides(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(retries_mod.time, "monotonic", lambda: now[0])
+    budget = RetryBudget(ratio=0.0, window_s=1.0, min_retries=1)
+
+    budget.record_request()
+    assert budget.try_retry() is True
+    assert budget.try_retry() is False
+    now[0] += 1.5
+    assert budget.try_retry() is True
+
+
+@pytest.mark.parametrize("retries", [0, 3, 8])
+def test_full_jitter_stays_below_exponential_delay(retries: int) -> None:
+    exc = TemporaryError(httpx.Response(503))
+    for _ in range(50):
+        sleep = retries_mod._get_sleep_interval(
+            exc, 500, 10_000, 2.0, retries, jitter="full"
+        )
+        assert 0 <= sleep <= min(10.0, 0.5 * 2.0**retries)
+
+
+def test_decorrelated_jitter_grows_from_previous_delay() -> None:
+    exc = TemporaryError(httpx.Response(503))
+    previous = 0.0
+    for retries in range(20):
+        sleep = retries_mod._get_sleep_interval(
+            exc, 100, 5_000, 2.0, retries, jitter="decorrelated", previous=previous
+        )
+        assert 0.1 <= sleep <= min(5.0, max(0.1, previous * 3))
+        previous = sleep
+
+
+def test_retry_after_overrides_jitter() -> None:
+    exc = TemporaryError(httpx.Response(503, headers={"retry-after": "2"}))
+    assert retries_mod._get_sleep_interval(exc, 0, 0, 2.0, 5, jitter="full") == 2.0
+
+
+def test_unknown_jitter_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        BackoffStrategy(0, 0, 1.5, 0, jitter="random")
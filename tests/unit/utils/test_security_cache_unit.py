@@ -0,0 +1,71 @@
+# tests/unit/utils/test_security_cache_unit.py
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+import pytest
+
+from dateno import models, utils
+from dateno.utils import security as security_mod
+from test_utils import mk_mock_sdk
+
+
+@pytest.fixture
+def resolutions(monkeypatch: pytest.MonkeyPatch) -> List[object]:
+    utils.clear_security_cache()
+    calls: List[object] = []
+    resolve = security_mod._resolve_security
+
+    def counting(security):
+        calls.append(security)
+        return resolve(security)
+
+    monkeypatch.setattr(security_mod, "_resolve_security", counting)
+    yield calls
+    utils.clear_security_cache()
+
+
+def test_security_is_resolved_once_per_credential(resolutions) -> None:
+    headers, params = utils.get_security(models.Security(api_key_query="k1"))
+    assert headers == {}
+    assert params == {"apikey": ["k1"]}
+
+    # A new, equal instance (as built per request for callable keys) hits the cache.
+    _, again = utils.get_security(models.Security(api_key_query="k1"))
+    assert again == params
+    assert len(resolutions) == 1
+
+    # Callers may mutate what they get back without affecting the cache.
+    again["apikey"] = ["tampered"]
+    assert utils.get_security(models.Security(api_key_query="k1"))[1] == params
+    _, again = utils.get_security(models.Security(api_key_query="k1"))
+    again["apikey"].append("k9")
+    again["apikey"][0] = "tampered"
+    assert utils.get_security(models.Security(api_key_query="k1"))[1] == {
+        "apikey": ["k1"]
+    }
+
+    utils.get_security(models.Security(api_key_query="k2"))
+    assert len(resolutions) == 2
+
+    utils.clear_security_cache()
+    utils.get_security(models.Security(api_key_query="k1"))
+    assert len(resolutions) == 3
+
+
+def test_rotating_api_key_is_picked_up(resolutions) -> None:
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params["apikey"])
+        return httpx.Response(200, json={"csv": "text/csv"})
+
+    keys = iter(["k1", "k1", "k2"])
+    sdk = mk_mock_sdk(handler, api_key_query=lambda: next(keys))
+
+    for _ in range(3):
+        sdk.statistics_api.list_export_formats()
+
+    assert seen == ["k1", "k1", "k2"]
+    assert len(resolutions) == 2
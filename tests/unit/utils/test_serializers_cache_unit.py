@@ -0,0 +1,113 @@
+# tests/unit/utils/test_serializers_cache_unit.py
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from dateno import errors, models
+from dateno.utils import serializers
+from dateno.utils.unmarshal_json_response import unmarshal_json_response
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    serializers.clear_serializer_cache()
+    yield
+    serializers.clear_serializer_cache()
+
+
+def test_unmarshaller_is_built_once_per_type() -> None:
+    first = serializers.get_unmarshaller(models.PageTimeseries)
+    second = serializers.get_unmarshaller(models.PageTimeseries)
+
+    assert first is second
+    assert serializers.get_unmarshaller(List[models.FacetInfo]) is (
+        serializers.get_unmarshaller(List[models.FacetInfo])
+    )
+    assert serializers.get_marshaller(models.PageTimeseries) is not first
+
+
+def test_unmarshal_uses_cached_validator_and_returns_body() -> None:
+    raw = b'{"totals": 1, "start": 0, "limit": 10, "items": [{"id": "a", "indicator": "i", "table": "t", "name": "n"}]}'
+
+    page = serializers.unmarshal_json(raw, models.PageTimeseries)
+
+    assert isinstance(page, models.PageTimeseries)
+    assert page.items is not None and page.items[0].id == "a"
+    assert models.PageTimeseries in serializers._unmarshallers
+
+
+def test_concurrent_first_use_builds_single_wrapper() -> None:
+    built: list[Any] = []
+    barrier = threading.Barrier(8)
+
+    def worker() -> None:
+        barrier.wait()
+        built.append(serializers.get_unmarshaller(Dict[str, models.Namespace]))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(m) for m in built}) == 1
+
+
+def test_unhashable_type_falls_back_to_uncached_wrapper(monkeypatch) -> None:
+    class _Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+    sentinel = object()
+    monkeypatch.setattr(
+        serializers, "_create_wrapper_model", lambda name, typ: sentinel
+    )
+
+    assert serializers.get_unmarshaller(_Unhashable()) is sentinel
+    assert serializers._unmarshallers == {}
+
+
+def test_prewarm_serializers_populates_registry() -> None:
+    serializers.prewarm_serializers([models.SearchQueryResponse, Optional[str]])
+
+    assert models.SearchQueryResponse in serializers._unmarshallers
+    assert Optional[str] in serializers._unmarshallers
+
+
+def test_marshal_json_output_is_unchanged_with_cache() -> None:
+    body = models.BodySearchDatasetsDsl(query={"match_all": {}})
+
+    first = serializers.marshal_json(body, Optional[models.BodySearchDatasetsDsl])
+    second = serializers.marshal_json(body, Optional[models.BodySearchDatasetsDsl])
+
+    assert first == second == '{"query":{"match_all":{}}}'
+
+
+def test_unmarshal_json_response_reports_decoded_body_on_failure() -> None:
+    res = httpx.Response(
+        200,
+        headers={"content-type": "application/json"},
+        content=b'{"totals": "not-an-int"}',
+    )
+
+    with pytest.raises(errors.ResponseValidationError) as exc_info:
+        unmarshal_json_response(models.PageTimeseries, res)
+
+    assert exc_info.value.body == '{"totals": "not-an-int"}'
+
+
+def test_sdk_prewarm_models_builds_response_validators() -> None:
+    from dateno import SDK
+
+    SDK(
+        api_key_query="TEST_KEY",
+        client=httpx.Client(),
+        async_client=httpx.AsyncClient(),
+        prewarm_models=True,
+    )
+
+    assert models.SearchQueryResponse in serializers._unmarshallers
+    assert List[models.FacetInfo] in serializers._unmarshallers